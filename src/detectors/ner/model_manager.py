@@ -24,6 +24,8 @@ class NerModelManager:
     def __init__(self) -> None:
         self._spacy_cache: Dict[str, Any] = {}
         self._flair_cache: Dict[str, Any] = {}
+        self._installed_cache: Dict[str, bool] = {}
+        self._flair_found: bool | None = None
         self._lock = threading.Lock()
 
         backend = str(config.get("ner_backend", "spacy") or "spacy").strip().lower()
@@ -146,13 +148,22 @@ class NerModelManager:
         return tagger
 
     def flair_available(self) -> bool:
-        return importlib.util.find_spec("flair") is not None
+        if self._flair_found is None:
+            self._flair_found = importlib.util.find_spec("flair") is not None
+        return self._flair_found
 
     def spacy_model_installed(self, model_name: str) -> bool:
+        cached = self._installed_cache.get(model_name)
+        if cached is not None:
+            return cached
+
         try:
-            return is_package(model_name)
+            installed = is_package(model_name)
         except Exception:
-            return False
+            installed = False
+
+        self._installed_cache[model_name] = installed
+        return installed
 
     def available_spacy_models(self) -> list[tuple[str, str]]:
         out: list[tuple[str, str]] = []
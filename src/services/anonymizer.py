@@ -3,6 +3,8 @@ from __future__ import annotations
 import json
 import hashlib
 import hmac
+import re
+from functools import lru_cache
 from typing import Callable, Dict, List, Optional, Tuple, Any
 
 from pipeline.anonymisieren import maskiere
@@ -76,10 +78,24 @@ def anonymize(
     return masked_with_ids, mapping, hits
 
 
+@lru_cache(maxsize=32)
+def _token_pattern(keys: frozenset[str]) -> re.Pattern[str]:
+    return re.compile("|".join(re.escape(k) for k in sorted(keys, key=len, reverse=True)))
+
+
+def find_tokens(text: str, mapping: Dict[str, str]) -> set[str]:
+    keys = frozenset(k for k in mapping if k)
+    if not text or not keys:
+        return set()
+    return set(_token_pattern(keys).findall(text))
+
+
 def de_anonymize(text: str, mapping: Dict[str, str]) -> str:
-    for k in sorted(mapping.keys(), key=lambda s: -len(s)):
-        text = text.replace(k, mapping[k])
-    return text
+    keys = frozenset(k for k in mapping if k)
+    if not text or not keys:
+        return text
+    lookup = mapping.__getitem__
+    return _token_pattern(keys).sub(lambda m: lookup(m[0]), text)
 
 
 def mapping_to_json(mapping: Dict[str, str]) -> str:
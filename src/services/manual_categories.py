@@ -6,6 +6,7 @@
 #  - Unterstützt Migration von alter Datei-Location (repo_root/manual_types.json → Data/)
 #  - Verhindert Duplikate durch Set-Semantik bei add_type
 #  - Liefert deterministisch sortierte Liste für UI + Pipeline
+#  - Hält In-Memory Cache (_TYPES) zur Vermeidung wiederholter IO bei View-Aufbau
 
 
 from __future__ import annotations
@@ -16,6 +17,10 @@ from pathlib import Path
 from core.paths import manual_types_path, repo_root
 
 
+# In-Memory Cache der gespeicherten Typen (None = noch nicht geladen)
+_TYPES: tuple[str, ...] | None = None
+
+
 # Liest JSON-Liste ein und normalisiert alle Einträge auf getrimmte UPPERCASE-Strings
 def _read_list(path: Path) -> list[str]:
     if not path.exists():
@@ -67,15 +72,27 @@ def _migrate_from_repo_root_if_needed() -> None:
 
 
 
+# Liefert den gecachten Typ-Tupel ohne Kopie (identisch bis zur nächsten Änderung)
+def get_types() -> tuple[str, ...]:
+    global _TYPES
+
+    if _TYPES is None:
+        _migrate_from_repo_root_if_needed()
+        _TYPES = tuple(_read_list(manual_types_path()))
+
+    return _TYPES
+
+
 # Liefert alle gespeicherten Custom-Typen
 def get_all_types() -> list[str]:
-    _migrate_from_repo_root_if_needed()
-    return _read_list(manual_types_path())
+    return list(get_types())
 
 
 
 # Fügt neuen Typ hinzu (validiert, normalisiert, dedupliziert, sortiert)
 def add_type(name: str) -> str:
+    global _TYPES
+
     _migrate_from_repo_root_if_needed()
 
     typ = (name or "").strip().upper()
@@ -91,12 +108,15 @@ def add_type(name: str) -> str:
         items = sorted(set(items), key=str.upper)
         _write_list(path, items)
 
+    _TYPES = tuple(items)
     return typ
 
 
 
 # Entfernt einen Typ aus Persistenz (falls vorhanden)
 def remove_type(name: str) -> None:
+    global _TYPES
+
     _migrate_from_repo_root_if_needed()
 
     typ = (name or "").strip().upper()
@@ -106,4 +126,5 @@ def remove_type(name: str) -> None:
 
     items = [x for x in items if x != typ]
 
-    _write_list(path, items)
\ No newline at end of file
+    _write_list(path, items)
+    _TYPES = tuple(items)
@@ -148,6 +148,33 @@ def remove_manual_token(typ: str, value: str) -> None:
 
 
 
+# Entfernt alle Tokens eines Typs mit einem einzigen Schreibvorgang, liefert die entfernten Werte
+def remove_manual_tokens_by_type(typ: str) -> list[str]:
+    _migrate_from_repo_root_if_needed()
+
+    typ_n = (typ or "").strip().upper()
+
+    path = manual_tokens_path()
+    items = _read_json(path)
+
+    removed: list[str] = []
+    new_items: list[dict] = []
+
+    for it in items:
+        if str(it.get("typ", "")).strip().upper() == typ_n:
+            value = str(it.get("value", "")).strip()
+            if value:
+                removed.append(value)
+            continue
+        new_items.append(it)
+
+    if len(new_items) != len(items):
+        _write_json(path, new_items)
+
+    return removed
+
+
+
 # Liefert Tokens als Match-Liste für den Custom-Detector (längste Werte zuerst)
 def as_match_list() -> List[ManualToken]:
     """
@@ -23,6 +23,7 @@ class SessionManager:
         self.ttl_seconds = int(ttl_seconds)
         self._sessions: Dict[str, Dict[str, Any]] = {}
         self._active_session_id: str | None = None
+        self.revision = 0
 
         self._storage_path = storage_path or (data_dir() / "sessions.json")
 
@@ -40,6 +41,7 @@ class SessionManager:
         tmp.replace(path)
 
     def _save_to_disk(self) -> None:
+        self.revision += 1
         payload = {
             "version": 3,
             "ttl_seconds": self.ttl_seconds,
@@ -56,9 +58,10 @@ class SessionManager:
 
     def _token_label(self, token: str) -> str:
         tok = (token or "").strip()
-        if not tok.startswith("[") or "_" not in tok:
+        sep = tok.find("_", 1)
+        if sep == -1 or not tok.startswith("["):
             return ""
-        head = tok[1:].split("_", 1)[0].strip().upper()
+        head = tok[1:sep].strip().upper()
         return head
 
     def _rebuild_index(self, mapping: Dict[str, str]) -> Dict[str, str]:
@@ -178,6 +181,9 @@ class SessionManager:
             if now - float(closed_at) >= self.ttl_seconds:
                 to_delete.append(sid)
 
+        if to_delete:
+            self.revision += 1
+
         for sid in to_delete:
             if sid == self._active_session_id:
                 self._active_session_id = None
@@ -17,6 +17,8 @@
 
 from __future__ import annotations
 
+from itertools import chain
+
 from core import config
 from services.session_manager import SessionManager, SESSION_TTL_SECONDS
 from ui.style.theme import THEMES
@@ -30,6 +32,8 @@ class AppStore:
         self.lang = self._load_lang()
 
         self.last_mapping = {}
+        self._mapping_inv: dict = {}
+        self._mapping_inv_src = None
         self.last_hits = []
         self.last_masked_text = ""
         self.last_original_text = ""
@@ -93,6 +97,22 @@ class AppStore:
         self.last_original_text = original or ""
         self.last_masked_text = masked or ""
 
+    def _mapping_index(self) -> dict:
+        if self._mapping_inv_src is not self.last_mapping:
+            inv: dict = {}
+            for token, value in self.last_mapping.items():
+                inv.setdefault(value, []).append(token)
+            self._mapping_inv = inv
+            self._mapping_inv_src = self.last_mapping
+        return self._mapping_inv
+
+    def remove_mapping_values(self, values) -> list:
+        inv = self._mapping_index()
+        removed = list(chain.from_iterable(inv.pop(v, ()) for v in set(values)))
+        for token in removed:
+            self.last_mapping.pop(token, None)
+        return removed
+
     def set_reversible(self, value: bool):
         self.reversible = bool(value)
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Dict, List, Set
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Set
 import threading
 
 import flet as ft
@@ -8,7 +9,7 @@ import flet as ft
 from core import config
 from pipeline.validation import filter_effective_hits_for_masking
 from ui.helpers.dashboard_context import DashboardContext, AUTO_MASK_DEBOUNCE_SECONDS, OccurrenceRow
-from ui.helpers.dashboard_helpers import gen_token
+from ui.helpers.dashboard_helpers import gen_token, is_nonblank
 from ui.helpers.dashboard_masking_engine import (
     MaskSpan,
     apply_spans,
@@ -21,6 +22,25 @@ from ui.helpers.dashboard_token_renderer import build_token_rows
 from ui.style.translations import t
 
 
+def flush(ctx: DashboardContext) -> None:
+    if not ctx.suspend_updates:
+        ctx.page.update()
+
+
+@contextmanager
+def batched_updates(ctx: DashboardContext) -> Iterator[None]:
+    if ctx.suspend_updates:
+        yield
+        return
+
+    ctx.suspend_updates = True
+    try:
+        yield
+    finally:
+        ctx.suspend_updates = False
+        ctx.page.update()
+
+
 def _active_session_secret(ctx: DashboardContext) -> str:
     mgr = getattr(ctx.store, "session_mgr", None)
     if mgr is None:
@@ -65,8 +85,9 @@ def _filter_session_mapping_to_allowed_types(
             continue
 
         label = ""
-        if token.startswith("[") and "_" in token:
-            label = token[1:].split("_", 1)[0].strip().upper()
+        sep = token.find("_", 1)
+        if sep != -1 and token.startswith("["):
+            label = token[1:sep].strip().upper()
 
         if label not in allowed_types:
             continue
@@ -86,7 +107,7 @@ def show_snack(ctx: DashboardContext, message: str, kind: str) -> None:
 
     ctx.page.snack_bar = ft.SnackBar(ft.Text(message), bgcolor=bg)
     ctx.page.snack_bar.open = True
-    ctx.page.update()
+    flush(ctx)
 
 
 def update_banner(ctx: DashboardContext, mapping: Dict[str, str]) -> None:
@@ -218,6 +239,15 @@ def _rebuild_output_from_occurrences(ctx: DashboardContext) -> None:
         )
 
     chosen = select_non_overlapping_spans(spans, len(src))
+
+    ctx.mask_source = src
+    ctx.mask_spans = chosen
+    ctx.mask_spans_dropped = len(spans) - len(chosen)
+
+    _publish_masked_output(ctx, src, chosen)
+
+
+def _publish_masked_output(ctx: DashboardContext, src: str, chosen: List[MaskSpan]) -> None:
     masked_text = apply_spans(src, chosen)
     used_mapping = mapping_from_spans(chosen)
 
@@ -230,7 +260,6 @@ def _rebuild_output_from_occurrences(ctx: DashboardContext) -> None:
 
 def _rebuild_token_ui(ctx: DashboardContext) -> None:
     build_token_rows(
-        page=ctx.page,
         theme=ctx.theme,
         lang=ctx.lang,
         accent=ctx.accent,
@@ -263,10 +292,7 @@ def refresh_tokens_from_store(ctx: DashboardContext) -> None:
 
 
 def update_add_button_state(ctx: DashboardContext) -> None:
-    src = (ctx.input_field.value or "").strip()
-    val = (ctx.manual_token_text.value or "").strip()
-
-    enabled = bool(src and val)
+    enabled = ctx.input_nonblank and is_nonblank(ctx.manual_token_text.value)
 
     ctx.add_button.disabled = not enabled
     if enabled:
@@ -276,17 +302,19 @@ def update_add_button_state(ctx: DashboardContext) -> None:
         ctx.add_button.bgcolor = None
         ctx.add_button.color = None
 
-    ctx.page.update()
+    flush(ctx)
 
 
 def _on_start_edit(ctx: DashboardContext, row_id: str) -> None:
     ctx.editing_row_ids.add(row_id)
     _rebuild_token_ui(ctx)
+    flush(ctx)
 
 
 def _on_cancel_edit(ctx: DashboardContext, row_id: str) -> None:
     ctx.editing_row_ids.discard(row_id)
     _rebuild_token_ui(ctx)
+    flush(ctx)
 
 
 def _on_save_edit(ctx: DashboardContext, row_id: str, new_val: str) -> None:
@@ -298,17 +326,13 @@ def _on_save_edit(ctx: DashboardContext, row_id: str, new_val: str) -> None:
     new_val = (new_val or "").strip()
 
     if not new_val:
-        msg = "Der Wert darf nicht leer sein." if ctx.lang == "de" else "Value must not be empty."
+        msg = t(ctx.lang, "dash.value_empty")
         show_snack(ctx, msg, "danger")
         return
 
     best = find_best_occurrence(src_text, new_val, row.start, row.ende)
     if best is None:
-        msg = (
-            "Der angegebene Text wurde im Eingabetext nicht gefunden."
-            if ctx.lang == "de"
-            else "The given text was not found in the input."
-        )
+        msg = t(ctx.lang, "dash.value_not_found")
         show_snack(ctx, msg, "danger")
         return
 
@@ -333,7 +357,7 @@ def _on_save_edit(ctx: DashboardContext, row_id: str, new_val: str) -> None:
 
     _rebuild_output_from_occurrences(ctx)
     _rebuild_token_ui(ctx)
-    ctx.page.update()
+    flush(ctx)
 
 
 def _on_delete_row(ctx: DashboardContext, row_id: str) -> None:
@@ -345,7 +369,12 @@ def _on_delete_row(ctx: DashboardContext, row_id: str) -> None:
     ctx.occurrence_rows = new_rows
     ctx.editing_row_ids.discard(row_id)
 
-    _rebuild_output_from_occurrences(ctx)
+    src = ctx.input_field.value or ""
+    if ctx.mask_spans_dropped == 0 and ctx.mask_source == src:
+        ctx.mask_spans = [span for span in ctx.mask_spans if span.row_id != row_id]
+        _publish_masked_output(ctx, src, ctx.mask_spans)
+    else:
+        _rebuild_output_from_occurrences(ctx)
 
     if ctx.occurrence_rows:
         _rebuild_token_ui(ctx)
@@ -354,7 +383,7 @@ def _on_delete_row(ctx: DashboardContext, row_id: str) -> None:
         ctx.token_groups_col.controls.clear()
         ctx.tokens_host.visible = False
 
-    ctx.page.update()
+    flush(ctx)
 
 
 def add_manual_token(ctx: DashboardContext) -> None:
@@ -366,21 +395,13 @@ def add_manual_token(ctx: DashboardContext) -> None:
 
     val = (ctx.manual_token_text.value or "").strip()
     if not val:
-        msg = (
-            "Bitte Text für den Token eingeben oder einfügen."
-            if ctx.lang == "de"
-            else "Please enter or paste text for the token."
-        )
+        msg = t(ctx.lang, "dash.manual_token_empty")
         show_snack(ctx, msg, "danger")
         return
 
     occurrences = find_occurrences(src, val)
     if not occurrences:
-        msg = (
-            "Der angegebene Text wurde im Eingabetext nicht als eigenständiger Treffer gefunden."
-            if ctx.lang == "de"
-            else "The given text was not found as a standalone match in the input."
-        )
+        msg = t(ctx.lang, "dash.manual_token_not_found")
         show_snack(ctx, msg, "danger")
         return
 
@@ -427,13 +448,13 @@ def add_manual_token(ctx: DashboardContext) -> None:
     update_add_button_state(ctx)
 
     ctx.tokens_section.visible = True
-    ctx.page.update()
+    flush(ctx)
 
 
 def apply_current_edits(ctx: DashboardContext) -> None:
     _rebuild_output_from_occurrences(ctx)
     _rebuild_token_ui(ctx)
-    ctx.page.update()
+    flush(ctx)
 
 
 def run_masking_internal(ctx: DashboardContext, auto: bool = False) -> None:
@@ -459,7 +480,7 @@ def run_masking_internal(ctx: DashboardContext, auto: bool = False) -> None:
                 ctx.store.set_dash(output_text="", status_text=ctx.results_text.value or "")
                 ctx.occurrence_rows = []
                 ctx.sync_equal_height()
-                ctx.page.update()
+                flush(ctx)
                 return
 
             msg = t(ctx.lang, "status.no_input")
@@ -513,7 +534,7 @@ def run_masking_internal(ctx: DashboardContext, auto: bool = False) -> None:
             ctx.tokens_host.visible = False
 
         update_banner(ctx, getattr(ctx.store, "last_mapping", {}) or {})
-        ctx.page.update()
+        flush(ctx)
     finally:
         if ctx.on_masking_phase is not None:
             try:
@@ -544,6 +565,7 @@ def clear_both(ctx: DashboardContext) -> None:
     _cancel_debounce(ctx)
 
     ctx.input_field.value = ""
+    ctx.input_nonblank = False
     ctx.output_field.value = ""
     ctx.results_text.value = ""
     ctx.results_banner.visible = False
@@ -565,15 +587,16 @@ def clear_both(ctx: DashboardContext) -> None:
     ctx.update_placeholder()
     ctx.sync_equal_height()
     update_add_button_state(ctx)
-    ctx.page.update()
+    flush(ctx)
 
 
 def handle_input_change(ctx: DashboardContext) -> None:
     text = ctx.input_field.value or ""
+    ctx.input_nonblank = is_nonblank(text)
     ctx.store.set_dash(input_text=text)
     ctx.update_placeholder()
 
-    if not text.strip():
+    if not ctx.input_nonblank:
         _cancel_debounce(ctx)
 
         if hasattr(ctx.store, "close_active_session"):
@@ -591,12 +614,12 @@ def handle_input_change(ctx: DashboardContext) -> None:
         ctx.store.set_dash(status_text="")
         ctx.sync_equal_height()
         update_add_button_state(ctx)
-        ctx.page.update()
+        flush(ctx)
         return
 
     ctx.sync_equal_height()
     update_add_button_state(ctx)
-    ctx.page.update()
+    flush(ctx)
 
     auto_enabled = getattr(ctx.store, "auto_mask_enabled", False)
     if not auto_enabled:
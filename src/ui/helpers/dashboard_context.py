@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Callable, Optional
+from typing import Any, Dict, List, Callable, Optional, Tuple
 import threading
 
 import flet as ft
 
+from ui.helpers.dashboard_masking_engine import MaskSpan
+
 
 AUTO_MASK_DEBOUNCE_SECONDS = 0.3
 
@@ -53,16 +55,30 @@ class DashboardContext:
     search_box: ft.TextField
     manual_token_text: ft.TextField
     manual_token_type: ft.Dropdown
-    manual_token_type_values: List[str]
+    manual_token_type_values: Tuple[str, ...]
     manual_token_type_value: List[str]
     add_button: ft.FilledButton
 
-    sync_equal_height: Any
-    update_placeholder: Any
+    clear_button: ft.IconButton
+    placeholder: ft.Column
+    progress_ring: ft.ProgressRing
+    progress_host: ft.Row
+    phase_text: ft.Text
+    show_masking_phase_text: bool = True
+    busy_count: int = 0
+    suspend_updates: bool = False
+    input_nonblank: bool = False
+
+    sync_equal_height: Any = None
+    update_placeholder: Any = None
 
     occurrence_rows: List[OccurrenceRow] = field(default_factory=list)
     editing_row_ids: set[str] = field(default_factory=set)
 
+    mask_source: str = ""
+    mask_spans: List[MaskSpan] = field(default_factory=list)
+    mask_spans_dropped: int = 0
+
     debounce_timer: threading.Timer | None = None
 
     on_masking_state: Optional[Callable[[bool], None]] = None
@@ -4,6 +4,7 @@ import math
 import re
 import hashlib
 import hmac
+from functools import lru_cache
 from typing import Dict, Tuple
 
 
@@ -51,6 +52,7 @@ TYPE_LABELS_EN: Dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=512)
 def type_label(lang: str, typ: str) -> str:
     if lang == "de":
         return TYPE_LABELS_DE.get(typ, typ.title())
@@ -80,6 +82,10 @@ def group_sort_key(typ: str) -> Tuple[int, str]:
         return (len(GROUP_ORDER), typ)
 
 
+def is_nonblank(text: str | None) -> bool:
+    return bool(text) and not text.isspace()
+
+
 def estimate_wrapped_lines(text: str, chars_per_line: int) -> int:
     if chars_per_line <= 0:
         chars_per_line = 80
@@ -1,20 +1,28 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 import re
 
 
+_WORD_RE = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=1024)
+def _word_pattern(value: str) -> Optional[re.Pattern[str]]:
+    if _WORD_RE.fullmatch(value) is None:
+        return None
+    return re.compile(r"\b" + re.escape(value) + r"\b")
+
+
 def find_occurrences(text: str, value: str) -> List[Tuple[int, int]]:
-    if not value:
+    if not value or value not in text:
         return []
 
-    if re.fullmatch(r"\w+", value):
-        pattern = r"\b" + re.escape(value) + r"\b"
-        res: List[Tuple[int, int]] = []
-        for m in re.finditer(pattern, text):
-            res.append((m.start(), m.end()))
-        return res
+    pattern = _word_pattern(value)
+    if pattern is not None:
+        return [m.span() for m in pattern.finditer(text)]
 
     res: List[Tuple[int, int]] = []
     start = 0
@@ -89,17 +97,15 @@ def apply_spans(text: str, spans: List[MaskSpan]) -> str:
         return text
 
     parts: List[str] = []
+    append = parts.append
     pos = 0
 
     for span in spans:
-        if span.start > pos:
-            parts.append(text[pos:span.start])
-        parts.append(span.token)
+        append(text[pos:span.start])
+        append(span.token)
         pos = span.end
 
-    if pos < len(text):
-        parts.append(text[pos:])
-
+    append(text[pos:])
     return "".join(parts)
 
 
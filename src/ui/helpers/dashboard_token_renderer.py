@@ -10,7 +10,6 @@ from ui.helpers.dashboard_helpers import type_label, group_sort_key
 
 def build_token_rows(
     *,
-    page: ft.Page,
     theme: Dict,
     lang: str,
     accent: str,
@@ -32,32 +31,35 @@ def build_token_rows(
         if not q:
             return True
 
-        span_text = f"{row.start}-{row.ende}"
-        hay = [
-            row.token.lower(),
-            (row.value or "").lower(),
-            row.label.lower(),
-            (row.source_label or "").lower(),
-            span_text,
-        ]
-
-        if row.validation_status:
-            hay.append(str(row.validation_status).lower())
+        hay = "\0".join(
+            (
+                row.token,
+                row.value or "",
+                row.label,
+                row.source_label or "",
+                f"{row.start}-{row.ende}",
+                str(row.validation_status or ""),
+            )
+        ).lower()
 
-        return any(q in part for part in hay)
+        return q in hay
 
     items_all = [row for row in rows if match_filter(row)]
 
     if not items_all:
         tokens_host.visible = False
-        page.update()
         return
 
+    decorated = [(row.start, row.ende, row.row_id, row) for row in items_all]
+    decorated.sort()
+
     groups: Dict[str, List[OccurrenceRow]] = {}
-    for row in items_all:
+    for _, _, _, row in decorated:
         groups.setdefault(row.label, []).append(row)
 
-    ordered_types = sorted(groups.keys(), key=group_sort_key)
+    group_keys = {typ: group_sort_key(typ) for typ in groups}
+    group_titles = {typ: type_label(lang, typ) for typ in groups}
+    ordered_types = sorted(groups, key=group_keys.__getitem__)
 
     def group_header(typ: str, count: int) -> ft.Control:
         badge = ft.Container(
@@ -67,7 +69,7 @@ def build_token_rows(
             content=ft.Text(str(count), size=12, color=theme["text_secondary"]),
         )
         title = ft.Text(
-            type_label(lang, typ),
+            group_titles[typ],
             weight=ft.FontWeight.W_600,
             color=theme["text_primary"],
         )
@@ -247,8 +249,7 @@ def build_token_rows(
         return ft.Column([head, body], spacing=6)
 
     for i, typ in enumerate(ordered_types):
-        items = sorted(groups[typ], key=lambda row: (row.start, row.ende, row.row_id))
-        cards = [make_token_row(row) for row in items]
+        cards = [make_token_row(row) for row in groups[typ]]
 
         grid_rows: List[ft.Control] = []
         for j in range(0, len(cards), 2):
@@ -272,7 +273,7 @@ def build_token_rows(
 
         grp = ft.Column(
             [
-                group_header(typ, len(items)),
+                group_header(typ, len(cards)),
                 ft.Container(height=6),
                 ft.Column(grid_rows, spacing=8),
             ],
@@ -284,5 +285,4 @@ def build_token_rows(
         if i < len(ordered_types) - 1:
             token_groups_col.controls.append(ft.Container(height=16))
 
-    tokens_host.visible = True
-    page.update()
\ No newline at end of file
+    tokens_host.visible = True
\ No newline at end of file
@@ -1,20 +1,41 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+from functools import partial
+from importlib import import_module
+from typing import Callable, Iterator
+
 import flet as ft
 
-from ui.style.components import nav_item
+from ui.style.components import nav_item, update_nav_item
 from ui.style.translations import t
 from ui.shared.help_overlay import HelpOverlay
 
-from ui.views import dashboard as dashboard_view
-from ui.views import settings as settings_view
-from ui.views import demask as demask_view
-from ui.views import dictionary as dictionary_view
-
 LOGO_SIZE = 45
 LOGO_TEXT_SIZE = 18
 LOGO_FILE_LIGHT = "logo.png"
 LOGO_FILE_DARK = "logo_white.png"
+LOGO_FILES = {"light": LOGO_FILE_LIGHT, "dark": LOGO_FILE_DARK}
+
+VIEW_MODULES = {
+    "dashboard": "ui.views.dashboard",
+    "vault": "ui.views.demask",
+    "dictionary": "ui.views.dictionary",
+    "settings": "ui.views.settings",
+}
+
+NAV_ITEMS = (
+    ("dashboard", ft.Icons.DASHBOARD_OUTLINED, "nav.dashboard"),
+    ("vault", ft.Icons.VPN_KEY, "nav.vault"),
+    ("dictionary", ft.Icons.BOOK_OUTLINED, "nav.dictionary"),
+    ("settings", ft.Icons.SETTINGS_OUTLINED, "nav.settings"),
+)
+
+# Gecachte Views behalten ihren Control-Baum je (View, Theme, Sprache) samt Zustand vom Aufbau.
+# Zulässig nur, solange ausschließlich die View selbst die dargestellten Werte ändert:
+# settings.view schreibt beim Aufbau zwar ner_backend/ner_model-Fallbacks in die Config,
+# diese Werte (und Labels/Flags) werden im UI aber nur von der Settings-View geändert.
+CACHED_VIEWS = frozenset({"settings"})
 
 
 class Router:
@@ -22,10 +43,17 @@ class Router:
         self.page = page
         self.store = store
         self.assets_dir = assets_dir
+        self._logo_srcs = {name: f"/{file}" for name, file in LOGO_FILES.items()}
+        self._window_icons = {name: f"{assets_dir}/{file}" for name, file in LOGO_FILES.items()}
 
         self.current_view = "dashboard"
+        self._batching = False
+        self._nav_items: dict[str, ft.Container] = {}
+        self._view_cache: dict[tuple[str, str, str], ft.Control] = {}
+        self._view_factories: dict[str, Callable[..., ft.Control]] = {}
 
         self.center = ft.Container(expand=True)
+        self._empty_view = ft.Container()
 
         self.sidebar_list = ft.Column(
             spacing=4,
@@ -37,13 +65,32 @@ class Router:
         self.sidebar = ft.Container(width=220, padding=12)
         self.right_area = ft.Container(expand=True)
 
-        self.header_container = ft.Container()
         self.help = HelpOverlay(page, store)
 
-        self.sidebar.bgcolor = self.store.theme["sidebar"]
+        self._logo_img = ft.Image(width=LOGO_SIZE, height=LOGO_SIZE, fit=ft.ImageFit.CONTAIN)
+        self._title_txt = ft.Text(size=LOGO_TEXT_SIZE, weight=ft.FontWeight.W_600)
+        self._help_button = self.help.build_help_button()
+
+        self.header_container = ft.Container(
+            padding=ft.padding.symmetric(horizontal=24, vertical=12),
+            content=ft.Row(
+                [
+                    ft.Row(
+                        [self._logo_img, self._title_txt],
+                        spacing=10,
+                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                    ),
+                    ft.Container(expand=True),
+                    self._help_button,
+                ],
+                vertical_alignment=ft.CrossAxisAlignment.CENTER,
+            ),
+        )
+
+        self.sidebar.bgcolor = self.store.theme.sidebar
         self.sidebar.content = self.sidebar_list
 
-        self.right_area.bgcolor = self.store.theme["background"]
+        self.right_area.bgcolor = self.store.theme.background
         self.right_area.content = self.center
 
         body = ft.Row(
@@ -55,7 +102,7 @@ class Router:
 
         self.root = ft.Container(
             expand=True,
-            bgcolor=self.store.theme["page_bg"],
+            bgcolor=self.store.theme.page_bg,
             content=ft.Column(
                 [
                     self.header_container,
@@ -72,132 +119,153 @@ class Router:
         self._render_sidebar()
         self._render_center()
 
-        def _maximize_on_connect(_: ft.ControlEvent) -> None:
-            self.page.window_maximized = True
-            self.page.update()
-
-        self.page.on_connect = _maximize_on_connect
-
-    def current_logo_file(self) -> str:
-        return LOGO_FILE_DARK if self.store.theme_name == "dark" else LOGO_FILE_LIGHT
+        self.page.window_maximized = True
 
     def mount(self) -> ft.Control:
         return self.root
 
     def set_view(self, view: str) -> None:
+        previous = self._nav_items.get(self.current_view)
+        if previous is not None:
+            previous.bgcolor = None
+
         self.current_view = view
-        self._render_sidebar()
+
+        selected = self._nav_items.get(view)
+        if selected is not None:
+            selected.bgcolor = self.store.theme.sidebar_active
+
         self._render_center()
         self.page.update()
 
+    @contextmanager
+    def _batch(self) -> Iterator[None]:
+        if self._batching:
+            yield
+            return
+
+        self._batching = True
+        self.help.suspend_updates = True
+        try:
+            yield
+        finally:
+            self._batching = False
+            self.help.suspend_updates = False
+            self.page.update()
+
     def on_toggle_theme(self, new_name: str) -> None:
-        self.store.set_theme(new_name)
+        if new_name == self.store.theme_name:
+            return
 
-        self.page.bgcolor = self.store.theme["page_bg"]
-        self.page.theme_mode = ft.ThemeMode.DARK if self.store.theme_name == "dark" else ft.ThemeMode.LIGHT
-        self.page.window_icon = f"{self.assets_dir}/{self.current_logo_file()}"
+        with self._batch():
+            self.store.set_theme(new_name)
+            self._view_cache.clear()
 
-        self.sidebar.bgcolor = self.store.theme["sidebar"]
-        self.right_area.bgcolor = self.store.theme["background"]
-        self.root.bgcolor = self.store.theme["page_bg"]
+            self.page.bgcolor = self.store.theme.page_bg
+            self.page.theme_mode = ft.ThemeMode.DARK if self.store.theme_name == "dark" else ft.ThemeMode.LIGHT
+            self.page.window_icon = self._window_icons[self.store.theme_name]
 
-        self._render_header()
-        self._render_sidebar()
-        self._render_center()
-        self.help.rebuild()
-        self.page.update()
+            self._apply_theme_and_lang()
+            self._render_center()
 
     def on_lang_changed(self, new_lang: str) -> None:
-        self.store.set_lang(new_lang)
-        self.page.title = t(self.store.lang, "app.title")
+        if new_lang == self.store.lang:
+            return
+
+        with self._batch():
+            self.store.set_lang(new_lang)
+            self._view_cache.clear()
+            self.page.title = t(self.store.lang, "app.title")
+
+            self._apply_theme_and_lang()
+            self._render_center()
+
+    def _apply_theme_and_lang(self) -> None:
+        theme = self.store.theme
+
+        self.sidebar.bgcolor = theme.sidebar
+        self.right_area.bgcolor = theme.background
+        self.root.bgcolor = theme.page_bg
+
         self._render_header()
         self._render_sidebar()
-        self._render_center()
         self.help.rebuild()
-        self.page.update()
 
     def _render_header(self) -> None:
-        header_bg = self.store.theme.get("header", self.store.theme.get("surface", self.store.theme["page_bg"]))
-        logo_file = self.current_logo_file()
-
-        self.header_container.bgcolor = header_bg
-        self.header_container.padding = ft.padding.symmetric(horizontal=24, vertical=12)
-        self.header_container.content = ft.Row(
-            [
-                ft.Row(
-                    [
-                        ft.Image(
-                            src=f"/{logo_file}",
-                            width=LOGO_SIZE,
-                            height=LOGO_SIZE,
-                            fit=ft.ImageFit.CONTAIN,
-                        ),
-                        ft.Text(
-                            t(self.store.lang, "app.title"),
-                            size=LOGO_TEXT_SIZE,
-                            weight=ft.FontWeight.W_600,
-                            color=self.store.theme["text_primary"],
-                        ),
-                    ],
-                    spacing=10,
-                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                ),
-                ft.Container(expand=True),
-                self.help.build_help_button(),
-            ],
-            vertical_alignment=ft.CrossAxisAlignment.CENTER,
-        )
-
-    def _build_sidebar_controls(self) -> list[ft.Control]:
-        return [
-            nav_item(
-                ft.Icons.DASHBOARD_OUTLINED,
-                t(self.store.lang, "nav.dashboard"),
-                selected=self.current_view == "dashboard",
-                on_click=lambda _: self.set_view("dashboard"),
-                theme=self.store.theme,
-            ),
-            nav_item(
-                ft.Icons.VPN_KEY,
-                t(self.store.lang, "nav.vault"),
-                selected=self.current_view == "vault",
-                on_click=lambda _: self.set_view("vault"),
-                theme=self.store.theme,
-            ),
-            nav_item(
-                ft.Icons.BOOK_OUTLINED,
-                t(self.store.lang, "nav.dictionary"),
-                selected=self.current_view == "dictionary",
-                on_click=lambda _: self.set_view("dictionary"),
-                theme=self.store.theme,
-            ),
-            nav_item(
-                ft.Icons.SETTINGS_OUTLINED,
-                t(self.store.lang, "nav.settings"),
-                selected=self.current_view == "settings",
-                on_click=lambda _: self.set_view("settings"),
-                theme=self.store.theme,
-            ),
-        ]
+        theme = self.store.theme
+        lang = self.store.lang
+
+        self.header_container.bgcolor = theme.header
+        self._logo_img.src = self._logo_srcs[self.store.theme_name]
+        self._title_txt.value = t(lang, "app.title")
+        self._title_txt.color = theme.text_primary
+        self._help_button.icon_color = theme.icon_on_appbar
+        self._help_button.tooltip = t(lang, "help.icon.tooltip")
+
+    def _on_nav_click(self, view: str, _: ft.ControlEvent) -> None:
+        self.set_view(view)
+
+    def _build_sidebar_controls(self) -> dict[str, ft.Container]:
+        lang = self.store.lang
+        theme = self.store.theme
+        return {
+            view: nav_item(
+                icon,
+                t(lang, label_key),
+                selected=self.current_view == view,
+                on_click=partial(self._on_nav_click, view),
+                theme=theme,
+            )
+            for view, icon, label_key in NAV_ITEMS
+        }
 
     def _render_sidebar(self) -> None:
-        self.sidebar_list.controls = self._build_sidebar_controls()
+        if not self._nav_items:
+            self._nav_items = self._build_sidebar_controls()
+            self.sidebar_list.controls = list(self._nav_items.values())
+            return
+
+        lang = self.store.lang
+        theme = self.store.theme
+        for view, _, label_key in NAV_ITEMS:
+            update_nav_item(
+                self._nav_items[view],
+                t(lang, label_key),
+                selected=self.current_view == view,
+                theme=theme,
+            )
 
     def _render_center(self) -> None:
-        if self.current_view == "dashboard":
-            self.center.content = dashboard_view.view(self.page, self.store.theme, self.store)
+        key = (self.current_view, self.store.theme_name, self.store.lang)
+        cached = self._view_cache.get(key)
+        if cached is not None:
+            self.center.content = cached
             return
 
-        if self.current_view == "vault":
-            self.center.content = demask_view.view(self.page, self.store.theme, self.store)
-            return
+        self._build_center()
+
+        if self.current_view in CACHED_VIEWS:
+            self._view_cache[key] = self.center.content
+
+    def _view_factory(self, view: str) -> Callable[..., ft.Control] | None:
+        factory = self._view_factories.get(view)
+        if factory is None:
+            module_name = VIEW_MODULES.get(view)
+            if module_name is None:
+                return None
+            factory = import_module(module_name).view
+            self._view_factories[view] = factory
+        return factory
+
+    def _build_center(self) -> None:
+        factory = self._view_factory(self.current_view)
 
-        if self.current_view == "dictionary":
-            self.center.content = dictionary_view.view(self.page, self.store.theme, self.store)
+        if factory is None:
+            self.center.content = self._empty_view
             return
 
         if self.current_view == "settings":
-            self.center.content = settings_view.view(
+            self.center.content = factory(
                 self.page,
                 self.store.theme_name,
                 self.on_toggle_theme,
@@ -206,4 +274,4 @@ class Router:
             )
             return
 
-        self.center.content = ft.Container()
\ No newline at end of file
+        self.center.content = factory(self.page, self.store.theme, self.store)
@@ -1,104 +1,92 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 import flet as ft
 from ui.style.translations import t
 
+HELP_SECTIONS = (
+    ("help.dashboard.bullet", "help.dashboard.body"),
+    ("help.vault.bullet", "help.vault.body"),
+    ("help.dictionary.bullet", "help.dictionary.body"),
+    ("help.settings.bullet", "help.settings.body"),
+)
+
+
+@lru_cache(maxsize=4)
+def _help_texts(lang: str) -> tuple[str, str, str, tuple[tuple[str, str], ...]]:
+    return (
+        t(lang, "help.title"),
+        t(lang, "help.close"),
+        t(lang, "help.intro"),
+        tuple((t(lang, b), t(lang, k)) for b, k in HELP_SECTIONS),
+    )
+
 
 class HelpOverlay:
     def __init__(self, page: ft.Page, store):
         self.page = page
         self.store = store
+        self.suspend_updates = False
         self.overlay = ft.Container(visible=False, expand=True)
         self.overlay.on_click = self._close
-        self._rebuild()
+        self._stale = True
+        self._build()
+
+    def _update(self) -> None:
+        if not self.suspend_updates:
+            self.page.update()
 
     def _close(self, _: ft.ControlEvent) -> None:
         self.overlay.visible = False
-        self.page.update()
+        self._update()
 
     def open(self, _: ft.ControlEvent | None = None) -> None:
+        if self._stale:
+            self._rebuild()
         self.overlay.visible = True
-        self.page.update()
+        self._update()
 
     def rebuild(self) -> None:
+        if not self.overlay.visible:
+            self._stale = True
+            return
         self._rebuild()
-        self.page.update()
+        self._update()
 
-    def _rebuild(self) -> None:
-        lang = self.store.lang
-
-        title = t(lang, "help.title")
-        intro = t(lang, "help.intro")
-        dash = t(lang, "help.dashboard.body")
-        demask_txt = t(lang, "help.vault.body")
-        dictionary_txt = t(lang, "help.dictionary.body")
-        settings_txt = t(lang, "help.settings.body")
+    def _build(self) -> None:
+        self._title = ft.Text(size=18, weight=ft.FontWeight.W_600)
+        self._close_button = ft.IconButton(icon=ft.Icons.CLOSE, on_click=self._close)
+        self._intro = ft.Text(size=13)
 
-        bullet_dash = t(lang, "help.dashboard.bullet")
-        bullet_demask = t(lang, "help.vault.bullet")
-        bullet_dict = t(lang, "help.dictionary.bullet")
-        bullet_settings = t(lang, "help.settings.bullet")
-        close_tt = t(lang, "help.close")
+        self._sections: list[tuple[ft.Text, ft.Text]] = []
+        section_controls: list[ft.Control] = []
+        for i in range(len(HELP_SECTIONS)):
+            bullet = ft.Text(weight=ft.FontWeight.W_600, size=13)
+            body = ft.Text(size=13)
+            self._sections.append((bullet, body))
+            section_controls.append(ft.Container(height=18 if i == 0 else 10))
+            section_controls.append(bullet)
+            section_controls.append(body)
 
-        card = ft.Container(
+        self._card = ft.Container(
             width=720,
             padding=24,
-            bgcolor=self.store.theme["surface"],
             border_radius=16,
             on_click=lambda e: e.stop_propagation(),
             content=ft.Column(
                 [
                     ft.Row(
                         [
-                            ft.Text(
-                                title,
-                                size=18,
-                                weight=ft.FontWeight.W_600,
-                                color=self.store.theme["text_primary"],
-                            ),
+                            self._title,
                             ft.Container(expand=True),
-                            ft.IconButton(
-                                icon=ft.Icons.CLOSE,
-                                tooltip=close_tt,
-                                on_click=self._close,
-                            ),
+                            self._close_button,
                         ],
                         vertical_alignment=ft.CrossAxisAlignment.CENTER,
                     ),
                     ft.Container(height=12),
-                    ft.Text(intro, size=13, color=self.store.theme["text_secondary"]),
-                    ft.Container(height=18),
-                    ft.Text(
-                        bullet_dash,
-                        weight=ft.FontWeight.W_600,
-                        size=13,
-                        color=self.store.theme["text_primary"],
-                    ),
-                    ft.Text(dash, size=13, color=self.store.theme["text_secondary"]),
-                    ft.Container(height=10),
-                    ft.Text(
-                        bullet_demask,
-                        weight=ft.FontWeight.W_600,
-                        size=13,
-                        color=self.store.theme["text_primary"],
-                    ),
-                    ft.Text(demask_txt, size=13, color=self.store.theme["text_secondary"]),
-                    ft.Container(height=10),
-                    ft.Text(
-                        bullet_dict,
-                        weight=ft.FontWeight.W_600,
-                        size=13,
-                        color=self.store.theme["text_primary"],
-                    ),
-                    ft.Text(dictionary_txt, size=13, color=self.store.theme["text_secondary"]),
-                    ft.Container(height=10),
-                    ft.Text(
-                        bullet_settings,
-                        weight=ft.FontWeight.W_600,
-                        size=13,
-                        color=self.store.theme["text_primary"],
-                    ),
-                    ft.Text(settings_txt, size=13, color=self.store.theme["text_secondary"]),
+                    self._intro,
+                    *section_controls,
                 ],
                 spacing=4,
                 tight=True,
@@ -109,14 +97,35 @@ class HelpOverlay:
         self.overlay.content = ft.Container(
             expand=True,
             alignment=ft.alignment.center,
-            content=card,
+            content=self._card,
         )
 
+    def _rebuild(self) -> None:
+        self._stale = False
+        lang = self.store.lang
+        theme = self.store.theme
+
+        title, close, intro, sections = _help_texts(lang)
+
+        self._card.bgcolor = theme.surface
+
+        self._title.value = title
+        self._title.color = theme.text_primary
+        self._close_button.tooltip = close
+        self._intro.value = intro
+        self._intro.color = theme.text_secondary
+
+        for (bullet, body), (bullet_text, body_text) in zip(self._sections, sections):
+            bullet.value = bullet_text
+            bullet.color = theme.text_primary
+            body.value = body_text
+            body.color = theme.text_secondary
+
     def build_help_button(self) -> ft.Control:
         return ft.IconButton(
             icon=ft.Icons.HELP_OUTLINE,
             icon_size=24,
-            icon_color=self.store.theme["icon_on_appbar"],
+            icon_color=self.store.theme.icon_on_appbar,
             tooltip=t(self.store.lang, "help.icon.tooltip"),
             on_click=self.open,
-        )
\ No newline at end of file
+        )
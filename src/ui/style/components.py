@@ -1,128 +1,112 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
 
 import flet as ft
 
+from ui.style.theme import Theme
 
-def nav_item(icon, label: str, selected: bool, on_click, theme: dict) -> ft.Container:
-    return ft.Container(
+
+_NAV_PADDING = ft.padding.symmetric(10, 12)
+
+
+@dataclass(frozen=True)
+class _NavStyle:
+    bgcolor: str | None
+    icon_color: str
+    text_color: str
+
+
+@lru_cache(maxsize=8)
+def _nav_style(theme: Theme, selected: bool) -> _NavStyle:
+    return _NavStyle(
+        bgcolor=theme.sidebar_active if selected else None,
+        icon_color=theme.text_secondary,
+        text_color=theme.sidebar_text,
+    )
+
+
+def nav_item(icon, label: str, selected: bool, on_click, theme: Theme) -> ft.Container:
+    item = ft.Container(
         content=ft.Row(
             [
-                ft.Icon(icon, size=18, color=theme["text_secondary"]),
-                ft.Text(label, size=13, weight=ft.FontWeight.W_500, color=theme["sidebar_text"]),
+                ft.Icon(icon, size=18),
+                ft.Text(label, size=13, weight=ft.FontWeight.W_500),
             ],
             spacing=12,
             alignment=ft.MainAxisAlignment.START,
         ),
-        padding=ft.padding.symmetric(10, 12),
-        bgcolor=theme["sidebar_active"] if selected else None,
+        padding=_NAV_PADDING,
         border_radius=10,
         ink=True,
         on_click=on_click,
     )
+    update_nav_item(item, label, selected, theme)
+    return item
 
 
-def pill_button(
-    text: str,
-    icon=None,
-    on_click=None,
-    theme: dict | None = None,
-    scale: float = 1.0,
-) -> ft.Container:
-    if theme is None:
-        raise ValueError("pill_button requires a theme")
+def update_nav_item(item: ft.Container, label: str, selected: bool, theme: Theme) -> None:
+    style = _nav_style(theme, selected)
+    icon, text = item.content.controls
+    icon.color = style.icon_color
+    text.value = label
+    text.color = style.text_color
+    item.bgcolor = style.bgcolor
 
-    bg_default = theme["button_bg"]
-    outline_color = theme["button_outline"]
-    text_color = theme.get("button_text", theme["text_primary"])
-    hover_bg = theme["button_hover"]
 
-    base_pad_v = 10
-    base_pad_h = 18
-    base_radius = 10
-    base_icon_size = 16
-    base_font_size = 13
-    base_blur = 6
-    base_offset_y = 4
+_PILL_BASE = {
+    # pad_v, pad_h, radius, icon_size, font_size, blur, offset_y, spacing
+    "filled": (10, 18, 10, 16, 13, 6, 4, 8),
+    "outlined": (10, 14, 10, 13, 13, 6, 4, 8),
+}
 
-    pad_v = base_pad_v * scale
-    pad_h = base_pad_h * scale
-    radius = base_radius * scale
-    icon_size = base_icon_size * scale
-    font_size = base_font_size * scale
-    blur = base_blur * scale
-    offset_y = base_offset_y * scale
 
-    row_items: list[ft.Control] = []
-    if icon is not None:
-        row_items.append(ft.Icon(icon, size=icon_size, color=text_color))
-    row_items.append(
-        ft.Text(text, size=font_size, weight=ft.FontWeight.W_500, color=text_color)
-    )
+@lru_cache(maxsize=16)
+def _pill_metrics(variant: str, scale: float) -> tuple[float, ...]:
+    return tuple(v * scale for v in _PILL_BASE[variant])
 
-    content = ft.Row(
-        row_items,
-        spacing=8 * scale,
-        alignment=ft.MainAxisAlignment.CENTER,
-        vertical_alignment=ft.CrossAxisAlignment.CENTER,
-    )
 
-    def on_hover(e: ft.HoverEvent):
-        e.control.bgcolor = hover_bg if e.data == "true" else bg_default
-        e.control.update()
+@dataclass(frozen=True)
+class _Decor:
+    padding: ft.Padding
+    border: ft.Border
+    shadow: ft.BoxShadow
 
-    shadow_color = theme["shadow_color"]
-    shadow_opacity = theme["shadow_opacity"]
 
-    return ft.Container(
-        content=content,
+@lru_cache(maxsize=32)
+def _decor(theme: Theme, pad_v: float, pad_h: float, blur: float, offset_y: float) -> _Decor:
+    return _Decor(
         padding=ft.padding.symmetric(vertical=pad_v, horizontal=pad_h),
-        border_radius=radius,
-        bgcolor=bg_default,
-        border=ft.border.all(0.8, outline_color),
+        border=ft.border.all(0.8, theme.button_outline),
         shadow=ft.BoxShadow(
             spread_radius=0,
             blur_radius=blur,
-            color=ft.Colors.with_opacity(shadow_opacity, shadow_color),
+            color=theme.shadow_blend,
             offset=ft.Offset(0, offset_y),
         ),
-        ink=True,
-        on_click=on_click,
-        on_hover=on_hover,
     )
 
 
-def outlined_pill(
-    text: str,
-    icon=None,
-    on_click=None,
-    theme: dict | None = None,
-    scale: float = 0.7,
-) -> ft.Container:
-    if theme is None:
-        raise ValueError("outlined_pill requires a theme")
+def _hover_bg(e: ft.HoverEvent) -> None:
+    bg_default, hover_bg = e.control.data
+    e.control.bgcolor = hover_bg if e.data == "true" else bg_default
+    e.control.update()
 
-    bg_default = theme["button_bg"]
-    outline_color = theme["button_outline"]
-    text_color = theme.get("button_text", theme["text_primary"])
-    hover_bg = theme["button_hover"]
 
-    base_pad_v = 10
-    base_pad_h = 14
-    base_radius = 10
-    base_icon_size = 13
-    base_font_size = 13
-    base_blur = 6
-    base_offset_y = 4
+def _pill(
+    text: str,
+    icon,
+    on_click,
+    theme: Theme,
+    scale: float,
+    variant: str,
+) -> ft.Container:
+    pad_v, pad_h, radius, icon_size, font_size, blur, offset_y, spacing = _pill_metrics(variant, scale)
 
-    pad_v = base_pad_v * scale
-    pad_h = base_pad_h * scale
-    radius = base_radius * scale
-    icon_size = base_icon_size * scale
-    font_size = base_font_size * scale
-    blur = base_blur * scale
-    offset_y = base_offset_y * scale
+    bg_default = theme.button_bg
+    text_color = theme.button_text
 
     row_items: list[ft.Control] = []
     if icon is not None:
@@ -133,43 +117,58 @@ def outlined_pill(
 
     content = ft.Row(
         row_items,
-        spacing=8 * scale,
+        spacing=spacing,
         alignment=ft.MainAxisAlignment.CENTER,
         vertical_alignment=ft.CrossAxisAlignment.CENTER,
     )
 
-    def on_hover(e: ft.HoverEvent):
-        e.control.bgcolor = hover_bg if e.data == "true" else bg_default
-        e.control.update()
-
-    shadow_color = theme["shadow_color"]
-    shadow_opacity = theme["shadow_opacity"]
+    decor = _decor(theme, pad_v, pad_h, blur, offset_y)
 
     return ft.Container(
         content=content,
-        padding=ft.padding.symmetric(vertical=pad_v, horizontal=pad_h),
+        padding=decor.padding,
         border_radius=radius,
         bgcolor=bg_default,
-        border=ft.border.all(0.8, outline_color),
-        shadow=ft.BoxShadow(
-            spread_radius=0,
-            blur_radius=blur,
-            color=ft.Colors.with_opacity(shadow_opacity, shadow_color),
-            offset=ft.Offset(0, offset_y),
-        ),
+        border=decor.border,
+        shadow=decor.shadow,
         ink=True,
         on_click=on_click,
-        on_hover=on_hover,
+        on_hover=_hover_bg,
+        data=(bg_default, theme.button_hover),
     )
 
 
-def appbar(theme: dict, on_help=None) -> ft.AppBar:
+def pill_button(
+    text: str,
+    icon=None,
+    on_click=None,
+    theme: Theme | None = None,
+    scale: float = 1.0,
+) -> ft.Container:
+    if theme is None:
+        raise ValueError("pill_button requires a theme")
+    return _pill(text, icon, on_click, theme, scale, "filled")
+
+
+def outlined_pill(
+    text: str,
+    icon=None,
+    on_click=None,
+    theme: Theme | None = None,
+    scale: float = 0.7,
+) -> ft.Container:
+    if theme is None:
+        raise ValueError("outlined_pill requires a theme")
+    return _pill(text, icon, on_click, theme, scale, "outlined")
+
+
+def appbar(theme: Theme, on_help=None) -> ft.AppBar:
     def handle_help(e):
         if on_help:
             on_help(e)
 
     return ft.AppBar(
-        bgcolor=theme.get("appbar", theme.get("header", theme["background"])),
+        bgcolor=theme.header,
         elevation=0,
         center_title=False,
         leading=None,
@@ -177,19 +176,19 @@ def appbar(theme: dict, on_help=None) -> ft.AppBar:
             "anonymizer • Desktop",
             size=16,
             weight=ft.FontWeight.W_600,
-            color=theme["text_on_appbar"],
+            color=theme.text_on_appbar,
         ),
         actions=[
             ft.IconButton(
                 icon=ft.Icons.HELP_OUTLINE,
                 tooltip="Hilfe / Help",
-                icon_color=theme["icon_on_appbar"],
+                icon_color=theme.icon_on_appbar,
                 on_click=handle_help,
             ),
             ft.CircleAvatar(
-                content=ft.Text("P", size=14, color=theme["icon_on_appbar"]),
+                content=ft.Text("P", size=14, color=theme.icon_on_appbar),
                 radius=16,
-                bgcolor=theme["accent"],
+                bgcolor=theme.accent,
             ),
             ft.Container(width=14),
         ],
@@ -200,19 +199,17 @@ def pill_switch(
     label: str,
     value: bool,
     on_change: Callable | None,
-    theme: dict,
+    theme: Theme,
     scale: float = 1.0,
 ) -> ft.Container:
     switch_ref: ft.Ref[ft.Switch] = ft.Ref[ft.Switch]()
-    container_ref: ft.Ref[ft.Container] = ft.Ref[ft.Container]()
 
-    bg_default = theme["button_bg"]
-    outline_color = theme["button_outline"]
-    hover_bg = theme["button_hover"]
+    bg_default = theme.button_bg
+    hover_bg = theme.button_hover
 
-    active_track = theme["switch_track_active"]
-    inactive_track = theme["switch_track_inactive"]
-    inactive_thumb = theme["switch_thumb"]
+    active_track = theme.switch_track_active
+    inactive_track = theme.switch_track_inactive
+    inactive_thumb = theme.switch_thumb
 
     base_pad_v = 8
     base_pad_h = 18
@@ -242,11 +239,11 @@ def pill_switch(
         ref=switch_ref,
         value=value,
         on_change=handle_switch_change,
-        active_color=theme["switch_thumb"],
+        active_color=theme.switch_thumb,
         active_track_color=active_track,
         inactive_track_color=inactive_track,
         inactive_thumb_color=inactive_thumb,
-        thumb_color=theme["switch_thumb"],
+        thumb_color=theme.switch_thumb,
         scale=switch_scale,
     )
 
@@ -256,7 +253,7 @@ def pill_switch(
                 label,
                 size=font_size,
                 weight=ft.FontWeight.W_500,
-                color=theme["text_primary"],
+                color=theme.text_primary,
             ),
             sw,
         ],
@@ -264,11 +261,6 @@ def pill_switch(
         vertical_alignment=ft.CrossAxisAlignment.CENTER,
     )
 
-    def on_hover(e: ft.HoverEvent):
-        if container_ref.current:
-            container_ref.current.bgcolor = hover_bg if e.data == "true" else bg_default
-            container_ref.current.update()
-
     def toggle(e: ft.ControlEvent):
         if switch_ref.current is None:
             return
@@ -277,24 +269,18 @@ def pill_switch(
             on_change(switch_ref.current.value)
         e.page.update()
 
-    shadow_color = theme["shadow_color"]
-    shadow_opacity = theme["shadow_opacity"]
+    decor = _decor(theme, pad_v, pad_h, blur, offset_y)
 
     return ft.Container(
-        ref=container_ref,
         height=box_height,
-        padding=ft.padding.symmetric(vertical=pad_v, horizontal=pad_h),
+        padding=decor.padding,
         border_radius=radius,
         bgcolor=bg_default,
-        border=ft.border.all(0.8, outline_color),
-        shadow=ft.BoxShadow(
-            spread_radius=0,
-            blur_radius=blur,
-            color=ft.Colors.with_opacity(shadow_opacity, shadow_color),
-            offset=ft.Offset(0, offset_y),
-        ),
+        border=decor.border,
+        shadow=decor.shadow,
         ink=True,
         on_click=toggle,
-        on_hover=on_hover,
+        on_hover=_hover_bg,
+        data=(bg_default, hover_bg),
         content=row,
     )
\ No newline at end of file
@@ -1,83 +1,157 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Any
+
 import flet as ft
 
-THEMES = {
-    "light": {
-        "header": "#FFFFFF",
-        "sidebar": "#FFFFFF",
-        "sidebar_active": "#E5E7EB",
-        "sidebar_text": "#111827",
 
-        "background": "#FFFFFF",
-        "page_bg": "#E5E7EB",
-        "surface": "#FFFFFF",
-        "surface_muted": "#F3F4F6",
+@dataclass(frozen=True, slots=True)
+class Theme:
+    header: str
+    sidebar: str
+    sidebar_active: str
+    sidebar_text: str
+
+    background: str
+    page_bg: str
+    surface: str
+    surface_muted: str
+
+    accent: str
+    danger: str
+    warning: str
+    success: str
+
+    text_primary: str
+    text_secondary: str
+
+    icon_on_appbar: str
+    text_on_appbar: str
+
+    button_outline: str
+    button_bg: str
+    button_hover: str
+    button_text: str
+
+    switch_track_active: str
+    switch_track_inactive: str
+    switch_thumb: str
+
+    input_placeholder_title: str
+    input_placeholder_sub: str
+
+    shadow_color: str
+    shadow_opacity: float
+
+    divider: str
+
+    shadow_blend: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        for f in fields(self):
+            if f.init:
+                value = getattr(self, f.name)
+                if type(value) is str:
+                    object.__setattr__(self, f.name, sys.intern(value))
+        object.__setattr__(self, "shadow_blend", sys.intern(ft.Colors.with_opacity(self.shadow_opacity, self.shadow_color)))
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and key in _THEME_KEYS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+
+_THEME_KEYS = frozenset(f.name for f in fields(Theme))
+
+
+THEMES = MappingProxyType({
+    "light": Theme(
+        header="#FFFFFF",
+        sidebar="#FFFFFF",
+        sidebar_active="#E5E7EB",
+        sidebar_text="#111827",
+
+        background="#FFFFFF",
+        page_bg="#E5E7EB",
+        surface="#FFFFFF",
+        surface_muted="#F3F4F6",
 
-        "accent": "#2563EB",
-        "danger": "#DC2626",
-        "warning": "#F59E0B",
-        "success": "#16A34A",
+        accent="#2563EB",
+        danger="#DC2626",
+        warning="#F59E0B",
+        success="#16A34A",
 
-        "text_primary": "#202124",
-        "text_secondary": "#5F6368",
+        text_primary="#202124",
+        text_secondary="#5F6368",
 
-        "icon_on_appbar": ft.Colors.BLACK,
-        "text_on_appbar": "#202124",
+        icon_on_appbar=ft.Colors.BLACK,
+        text_on_appbar="#202124",
 
-        "button_outline": "#D1D5DB",
-        "button_bg": "#FFFFFF",
-        "button_hover": "#F7F8FA",
-        "button_text": "#111827",
+        button_outline="#D1D5DB",
+        button_bg="#FFFFFF",
+        button_hover="#F7F8FA",
+        button_text="#111827",
 
-        "switch_track_active": "#2563EB",
-        "switch_track_inactive": "#D1D5DB",
-        "switch_thumb": "#FFFFFF",
+        switch_track_active="#2563EB",
+        switch_track_inactive="#D1D5DB",
+        switch_thumb="#FFFFFF",
 
-        "input_placeholder_title": "#374151",
-        "input_placeholder_sub": "#6B7280",
+        input_placeholder_title="#374151",
+        input_placeholder_sub="#6B7280",
 
-        "shadow_color": ft.Colors.BLACK,
-        "shadow_opacity": 0.06,
+        shadow_color=ft.Colors.BLACK,
+        shadow_opacity=0.06,
 
-        "divider": "#E5E7EB",
-    },
+        divider="#E5E7EB",
+    ),
 
-    "dark": {
-        "header": "#0B1220",
-        "sidebar": "#0B1220",
-        "sidebar_active": "#1E293B",
-        "sidebar_text": "#E2E8F0",
+    "dark": Theme(
+        header="#0B1220",
+        sidebar="#0B1220",
+        sidebar_active="#1E293B",
+        sidebar_text="#E2E8F0",
 
-        "background": "#0B1220",
-        "page_bg": "#0B1220",
-        "surface": "#111827",
-        "surface_muted": "#0F172A",
+        background="#0B1220",
+        page_bg="#0B1220",
+        surface="#111827",
+        surface_muted="#0F172A",
 
-        "accent": "#60A5FA",
-        "danger": "#EF4444",
-        "warning": "#F59E0B",
-        "success": "#22C55E",
+        accent="#60A5FA",
+        danger="#EF4444",
+        warning="#F59E0B",
+        success="#22C55E",
 
-        "text_primary": "#E5E7EB",
-        "text_secondary": "#94A3B8",
+        text_primary="#E5E7EB",
+        text_secondary="#94A3B8",
 
-        "icon_on_appbar": ft.Colors.WHITE,
-        "text_on_appbar": ft.Colors.WHITE,
+        icon_on_appbar=ft.Colors.WHITE,
+        text_on_appbar=ft.Colors.WHITE,
 
-        "button_outline": "#1F2937",
-        "button_bg": "#111827",
-        "button_hover": "#1F2937",
-        "button_text": "#E5E7EB",
+        button_outline="#1F2937",
+        button_bg="#111827",
+        button_hover="#1F2937",
+        button_text="#E5E7EB",
 
-        "switch_track_active": "#60A5FA",
-        "switch_track_inactive": "#374151",
-        "switch_thumb": "#0B1220",
+        switch_track_active="#60A5FA",
+        switch_track_inactive="#374151",
+        switch_thumb="#0B1220",
 
-        "input_placeholder_title": "#E5E7EB",
-        "input_placeholder_sub": "#9CA3AF",
+        input_placeholder_title="#E5E7EB",
+        input_placeholder_sub="#9CA3AF",
 
-        "shadow_color": ft.Colors.BLACK,
-        "shadow_opacity": 0.06,
+        shadow_color=ft.Colors.BLACK,
+        shadow_opacity=0.06,
 
-        "divider": "#1F2937",
-    },
-}
\ No newline at end of file
+        divider="#1F2937",
+    ),
+})
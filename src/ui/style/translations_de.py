@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+STRINGS = {
+    "app.title": "anonymizer • Desktop",
+    "dark_mode": "Dunkler Modus",
+    "language": "Sprache",
+    "lang.de": "Deutsch",
+    "lang.en": "Englisch",
+    "save": "Speichern",
+    "saved": "Einstellungen gespeichert",
+    "apply": "Modell anwenden",
+    "loaded": "Geladen",
+    "use_regex": "Regex verwenden",
+    "use_ner": "NER verwenden",
+    "debug_mask": "Debug_MASK",
+    "ner_postprocessing": "NER-Postprocessing (empfohlen)",
+
+    "settings.title": "Einstellungen",
+    "settings.all": "Alle",
+    "settings.none": "Keine",
+    "settings.recommended": "Empfohlen",
+    "settings.minimal": "Minimal",
+    "settings.general": "Allgemeine Einstellungen",
+    "settings.saved": "Gespeichert",
+    "settings.copy_ai_prompt": "KI Prompt Ergänzung bei Kopieren",
+    "settings.postcode": "PLZ-Validierung",
+    "settings.postcode_ml": "PLZ-ML-Validierung aktivieren",
+    "settings.postcode_manual_threshold": "Manuellen PLZ-Threshold verwenden",
+    "settings.postcode_threshold": "PLZ Threshold (0.0 - 1.0)",
+    "settings.postcode_threshold_hint": "Niedrigerer Threshold erhöht Trefferquote, aber auch False Positives.",
+    "settings.backend_error": "NER-Backend konnte nicht gesetzt werden: {error}",
+    "settings.model_error": "NER-Modell konnte nicht geladen werden: {error}",
+    "settings.no_model": "Kein passendes NER-Modell installiert",
+    "settings.ner_section": "NER-basiert",
+    "settings.regex_section": "Regex-basiert",
+    "ner_model": "NER-Modell",
+    "ner_model.fast": "Kleiner & schneller (weniger genau)",
+    "ner_model.large": "Größer & langsamer (genauer)",
+    "ner_set_ok": "NER-Modell gesetzt",
+    "ner_set_fail": "Modellwechsel fehlgeschlagen",
+
+    "reversible": "Reversible Maskierung",
+    "input.label": "Eingabe",
+    "input.hint": "Text einfügen oder schreiben…",
+    "output.label": "Ausgabe (maskiert)",
+
+    "btn.mask": "Text maskieren",
+    "btn.clear": "Leeren",
+    "btn.copy_out": "Ausgabe kopieren",
+
+    "status.no_input": "Keine Eingabe.",
+    "status.masked_base": "Maskiert: {total} | {src} | cfg: regex={rx} ner={ner} debug_mask={dbg}",
+    "status.masked_rev":  "Maskiert: {total} | reversibel: {ids} IDs | {src} | cfg: regex={rx} ner={ner} debug_mask={dbg}",
+
+    "status.banner.none": "Keine DSGVO-relevanten Treffer in diesem Text gefunden.",
+    "status.banner.one": "Es wurde 1 DSGVO-relevanter Treffer gefunden.",
+    "status.banner.some": "Es wurden {total} DSGVO-relevante Treffer gefunden.",
+
+    "vault.apply_active": "Text demaskieren",
+    "vault.active_map": "Aktives Mapping (JSON)",
+    "vault.masked_in": "Hier maskierten Text einfügen",
+    "vault.demasked_out": "Demaskierte Ausgabe",
+
+    "dash.input.title": "Text hier eingeben oder einfügen",
+    "dash.input.sub": (
+        "Füge vertrauliche Inhalte ein, die DSGVO-konform maskiert werden sollen. "
+        "Links siehst du den Originaltext, rechts erscheint die maskierte Ausgabe."
+    ),
+    "dash.value_empty": "Der Wert darf nicht leer sein.",
+    "dash.value_not_found": "Der angegebene Text wurde im Eingabetext nicht gefunden.",
+    "dash.manual_token_empty": "Bitte Text für den Token eingeben oder einfügen.",
+    "dash.manual_token_not_found": "Der angegebene Text wurde im Eingabetext nicht als eigenständiger Treffer gefunden.",
+    "manual.token.hint": "Text für neuen Token…",
+    "manual.token.add": "Hinzufügen",
+    "manual.tokens.header": "Erkannte Tokens bearbeiten",
+
+    "vault.input.title": "Maskierten Text hier eingeben oder einfügen",
+    "vault.input.sub": (
+        "Füge bereits anonymisierten Text ein, der mithilfe der aktiven Zuordnung wieder in Klartext "
+        "umgewandelt werden soll. Links siehst du den maskierten Text, rechts die demaskierte Ausgabe."
+    ),
+    "vault.live_demask": "Live demaskieren",
+    "search.placeholder": "Suchen…",
+
+    "sb.no_mapping": "Kein Mapping vorhanden",
+    "sb.map_copied": "Mapping in Zwischenablage kopiert",
+    "sb.map_saved": "Mapping gespeichert nach {path}",
+    "sb.map_save_fail": "Speichern fehlgeschlagen: {err}",
+
+    "nav.dashboard": "Dashboard",
+    "nav.vault": "Demaskieren",
+    "nav.dictionary": "Wörterbuch",
+    "nav.settings": "Einstellungen",
+
+    "help.icon.tooltip": "Hilfe",
+
+    "token.src.ner": "NER",
+    "token.src.regex": "Regex",
+    "token.src.auto": "Automatisch",
+}
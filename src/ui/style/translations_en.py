@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+STRINGS = {
+    "app.title": "anonymizer • Desktop",
+    "dark_mode": "Dark Mode",
+    "language": "Language",
+    "lang.de": "German",
+    "lang.en": "English",
+    "save": "Save",
+    "saved": "Settings saved",
+    "apply": "Apply model",
+    "loaded": "Loaded",
+    "use_regex": "Use Regex",
+    "use_ner": "Use NER",
+    "debug_mask": "Debug_MASK",
+    "ner_postprocessing": "NER postprocessing (recommended)",
+
+    "settings.title": "Settings",
+    "settings.all": "All",
+    "settings.none": "None",
+    "settings.recommended": "Recommended",
+    "settings.minimal": "Minimal",
+    "settings.general": "General settings",
+    "settings.saved": "Saved",
+    "settings.copy_ai_prompt": "Add AI prompt when copying",
+    "settings.postcode": "Postcode validation",
+    "settings.postcode_ml": "Enable postcode ML validation",
+    "settings.postcode_manual_threshold": "Use manual postcode threshold",
+    "settings.postcode_threshold": "Postcode threshold (0.0 - 1.0)",
+    "settings.postcode_threshold_hint": "Lower threshold increases recall, but also false positives.",
+    "settings.backend_error": "Failed to set NER backend: {error}",
+    "settings.model_error": "Failed to load NER model: {error}",
+    "settings.no_model": "No matching NER model installed",
+    "settings.ner_section": "NER-based",
+    "settings.regex_section": "Regex-based",
+    "ner_model": "NER model",
+    "ner_model.fast": "Smaller & faster (less accurate)",
+    "ner_model.large": "Larger & slower (more accurate)",
+    "ner_set_ok": "NER model set",
+    "ner_set_fail": "Model change failed",
+
+    "reversible": "Reversible masking",
+    "input.label": "Input",
+    "input.hint": "Paste or type text…",
+    "output.label": "Output (masked)",
+
+    "btn.mask": "Mask text",
+    "btn.clear": "Clear",
+    "btn.copy_out": "Copy output",
+
+    "status.no_input": "No input.",
+    "status.masked_base": "Masked: {total} | {src} | cfg: regex={rx} ner={ner} debug_mask={dbg}",
+    "status.masked_rev":  "Masked: {total} | reversible: {ids} IDs | {src} | cfg: regex={rx} ner={ner} debug_mask={dbg}",
+
+    "status.banner.none": "No GDPR-relevant findings in this text.",
+    "status.banner.one": "Found 1 potential GDPR-relevant finding.",
+    "status.banner.some": "Found {total} potential GDPR-relevant findings.",
+
+    "vault.apply_active": "Unmask text",
+    "vault.active_map": "Active mapping (JSON)",
+    "vault.masked_in": "Paste masked text here",
+    "vault.demasked_out": "De-masked output",
+
+    "dash.input.title": "Type or paste text here",
+    "dash.input.sub": (
+        "Paste sensitive text you want to anonymize. "
+        "The original text is shown on the left, the masked output on the right."
+    ),
+    "dash.value_empty": "Value must not be empty.",
+    "dash.value_not_found": "The given text was not found in the input.",
+    "dash.manual_token_empty": "Please enter or paste text for the token.",
+    "dash.manual_token_not_found": "The given text was not found as a standalone match in the input.",
+    "manual.token.hint": "Text for new token…",
+    "manual.token.add": "Add",
+    "manual.tokens.header": "Review detected tokens",
+
+    "vault.input.title": "Paste masked text here",
+    "vault.input.sub": (
+        "Paste already anonymized text that should be restored to clear text using the active mapping. "
+        "On the left you see the masked input, on the right the de-masked output."
+    ),
+    "vault.live_demask": "Live unmask",
+    "search.placeholder": "Search…",
+
+    "sb.no_mapping": "No mapping available",
+    "sb.map_copied": "Mapping copied to clipboard",
+    "sb.map_saved": "Saved mapping to {path}",
+    "sb.map_save_fail": "Save failed: {err}",
+
+    "nav.dashboard": "Dashboard",
+    "nav.vault": "Unmask",
+    "nav.dictionary": "Dictionary",
+    "nav.settings": "Settings",
+
+    "help.icon.tooltip": "Help",
+
+    "token.src.ner": "NER",
+    "token.src.regex": "Regex",
+    "token.src.auto": "Automatic",
+}
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+STRINGS = {
+    "help.title": "Willkommen im anonymizer",
+    "help.intro": (
+        "Diese App hilft dir dabei, sensible Informationen in Texten zu maskieren und bei Bedarf wieder zu "
+        "demaskieren. So kannst du echte Inhalte sicher mit anderen teilen, ohne die Originaldaten offenzulegen."
+    ),
+    "help.dashboard.body": (
+        "Hier arbeitest du mit dem ursprünglichen Text: Du fügst deinen Inhalt ein, startest die automatische "
+        "Maskierung und siehst anschließend alle erkannten Tokens. Du kannst Tokens bearbeiten, neue hinzufügen "
+        "und direkt verfolgen, wie sich die Ausgabe im rechten Feld verändert."
+    ),
+    "help.vault.body": (
+        "In diesem Bereich fügst du bereits maskierten Text ein, zum Beispiel aus dem Dashboard oder aus einer "
+        "Datei. Mithilfe des aktuell aktiven Mappings werden die Platzhalter wieder in die ursprünglichen Werte "
+        "zurückverwandelt – ideal, wenn du maskierte Texte später intern wieder im Klartext benötigst."
+    ),
+    "help.dictionary.body": (
+        "Im Wörterbuch verwaltest du eigene Begriffe, Namen oder Muster, die bei der Maskierung zusätzlich "
+        "berücksichtigt werden sollen. So kannst du wiederkehrende Fachbegriffe, Projektnamen oder firmenspezifische "
+        "Informationen konsistent behandeln, auch wenn sie vom Standardmodell nicht automatisch erkannt werden."
+    ),
+    "help.settings.body": (
+        "Unter Einstellungen legst du Sprache, NER-Modell und die zu verwendenden Entity- und Regex-Typen fest. "
+        "Du kannst hier also feinsteuern, welche Kategorien überhaupt erkannt und maskiert werden sollen – zum "
+        "Beispiel nur Personen und E-Mail-Adressen oder ein umfangreicheres Set inklusive IBAN, Rechnungsnummern "
+        "und mehr."
+    ),
+    "help.close": "Schließen",
+
+    "help.dashboard.bullet": "Dashboard",
+    "help.vault.bullet": "Demaskieren",
+    "help.dictionary.bullet": "Wörterbuch",
+    "help.settings.bullet": "Einstellungen",
+}
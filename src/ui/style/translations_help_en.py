@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+STRINGS = {
+    "help.title": "Welcome to anonymizer",
+    "help.intro": (
+        "This app helps you mask sensitive information in text and unmask it again when needed. "
+        "You can safely share real content without exposing the original data."
+    ),
+    "help.dashboard.body": (
+        "Here you work with the original text: paste your content, run automatic masking and review all "
+        "detected tokens. You can edit tokens, add new ones manually and immediately see how the masked "
+        "output on the right changes."
+    ),
+    "help.vault.body": (
+        "In this view you paste already masked text, for example from the Dashboard or from a file. Using "
+        "the currently active mapping, placeholders are converted back to their original values – useful when "
+        "you later need the full clear-text version internally."
+    ),
+    "help.dictionary.body": (
+        "Manage your own terms, names or patterns that should be taken into account during masking. This lets "
+        "you handle recurring domain-specific terms, project names or internal identifiers consistently, even if "
+        "the standard model does not detect them automatically."
+    ),
+    "help.settings.body": (
+        "Configure language, the NER model and which entity / regex types are used. You can fine-tune which "
+        "categories should be detected and masked – for example only people and email addresses, or a richer "
+        "set including IBANs, invoice numbers and more."
+    ),
+    "help.close": "Close",
+
+    "help.dashboard.bullet": "Dashboard",
+    "help.vault.bullet": "Unmask",
+    "help.dictionary.bullet": "Dictionary",
+    "help.settings.bullet": "Settings",
+}
@@ -1,28 +1,31 @@
 from __future__ import annotations
 
-import re
+from functools import lru_cache, partial
 
 import flet as ft
 from core import config
-from services.manual_categories import get_all_types as get_custom_types
+from services.manual_categories import get_types as get_custom_types
 from services.manual_tokens import add_manual_token as persist_manual_token
 from ui.helpers.dashboard_helpers import (
+    is_nonblank,
     synced_textfield_height,
     type_label,
 )
 from ui.helpers.dashboard_context import DashboardContext
 from ui.helpers.dashboard_actions import (
     add_manual_token as ui_add_manual_token,
+    batched_updates,
     clear_both as ui_clear_both,
+    flush,
     handle_input_change,
     refresh_tokens_from_store,
     run_masking_internal,
     update_add_button_state,
 )
 from ui.style.components import outlined_pill, pill_button
-from ui.style.translations import t
+from ui.style.translations import bind
 
-BASE_TYPES = [
+BASE_TYPES = (
     "E_MAIL",
     "TELEFON",
     "IBAN",
@@ -34,16 +37,214 @@ BASE_TYPES = [
     "LOC",
     "STRASSE",
     "MISC",
-]
+)
+BASE_TYPES_SET = frozenset(BASE_TYPES)
+
+_CARD_PADDING = ft.padding.only(left=18, right=18, top=18, bottom=24)
+_CARD_SHADOW_OFFSET = ft.Offset(0, 8)
+_INPUT_CONTENT_PADDING = ft.padding.only(right=4)
+_PLACEHOLDER_PADDING = ft.padding.only(top=-4)
+_CLEAR_BUTTON_PADDING = ft.padding.only(top=-10, right=-10)
+_BANNER_MARGIN = ft.margin.only(top=12, bottom=4)
+_BANNER_PADDING = ft.padding.symmetric(20, 20)
+_TOKENS_PADDING = ft.padding.all(16)
+_SECTION_MARGIN = ft.margin.only(left=4, right=4)
+
+
+@lru_cache(maxsize=8)
+def _merge_types(custom: tuple[str, ...]) -> tuple[str, ...]:
+    return BASE_TYPES + tuple(dict.fromkeys(c for c in custom if c not in BASE_TYPES_SET))
+
+
+def _all_types() -> tuple[str, ...]:
+    return _merge_types(get_custom_types())
+
+
+@lru_cache(maxsize=4)
+def _card_style(theme) -> tuple[ft.Border, ft.Padding, ft.BoxShadow]:
+    return (
+        ft.border.all(1, theme["divider"]),
+        _CARD_PADDING,
+        ft.BoxShadow(
+            spread_radius=0,
+            blur_radius=8,
+            color=theme["shadow_blend"],
+            offset=_CARD_SHADOW_OFFSET,
+        ),
+    )
+
+
+@lru_cache(maxsize=8)
+def _type_option_labels(lang: str, types: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    return tuple((v, type_label(lang, v)) for v in types)
+
+
+def _update_clear_icon(ctx: DashboardContext) -> None:
+    ctx.clear_button.visible = ctx.input_nonblank
+
+
+def _update_placeholder(ctx: DashboardContext) -> None:
+    if ctx.placeholder is not None:
+        ctx.placeholder.visible = not ctx.input_nonblank
+    _update_clear_icon(ctx)
+
+
+def _focus_input(ctx: DashboardContext, _: ft.ControlEvent) -> None:
+    ctx.input_field.focus()
+    if ctx.placeholder is not None:
+        ctx.placeholder.visible = False
+    ctx.page.update()
+
+
+def _sync_equal_height(ctx: DashboardContext) -> None:
+    input_field = ctx.input_field
+    output_field = ctx.output_field
+
+    if ctx.input_nonblank:
+        left_preview = (input_field.value or "").strip()
+    else:
+        left_preview = f"{ctx.input_title}\n{ctx.input_sub}"
+    right_preview = (output_field.value or "").strip()
+    h = synced_textfield_height(
+        left_preview,
+        right_preview,
+        ctx.page.window_width or 1200,
+    )
+    input_field.min_lines = h
+    output_field.min_lines = h
+    input_field.max_lines = None
+    output_field.max_lines = None
+
+
+def _set_phase_text(ctx: DashboardContext, value: str) -> None:
+    phase_text = ctx.phase_text
+
+    if not ctx.show_masking_phase_text:
+        phase_text.visible = False
+        phase_text.value = ""
+    else:
+        phase_text.value = value or ""
+        phase_text.visible = bool(value)
+
+    flush(ctx)
+
+
+def _set_busy(ctx: DashboardContext, is_busy: bool) -> None:
+    if is_busy:
+        ctx.busy_count += 1
+    else:
+        ctx.busy_count = max(0, ctx.busy_count - 1)
 
+    visible = ctx.busy_count > 0
+    ctx.progress_ring.visible = visible
+    ctx.progress_host.visible = visible
 
-def _all_types() -> list[str]:
-    custom = get_custom_types()
-    all_types = list(BASE_TYPES)
-    for c in custom:
-        if c not in all_types:
-            all_types.append(c)
-    return all_types
+    if not visible:
+        ctx.phase_text.value = ""
+        ctx.phase_text.visible = False
+
+    flush(ctx)
+
+
+def _masking_worker(ctx: DashboardContext) -> None:
+    run_masking_internal(ctx, auto=False)
+    _update_clear_icon(ctx)
+    flush(ctx)
+
+
+def _on_run_masking(ctx: DashboardContext, _: ft.ControlEvent) -> None:
+    ctx.page.run_thread(partial(_masking_worker, ctx))
+
+
+def _on_clear(ctx: DashboardContext, _: ft.ControlEvent) -> None:
+    with batched_updates(ctx):
+        ui_clear_both(ctx)
+        _update_clear_icon(ctx)
+
+
+def _on_input_change(ctx: DashboardContext, _: ft.ControlEvent) -> None:
+    with batched_updates(ctx):
+        handle_input_change(ctx)
+        _update_clear_icon(ctx)
+
+
+def _on_manual_text_change(ctx: DashboardContext, _: ft.ControlEvent) -> None:
+    update_add_button_state(ctx)
+
+
+def _on_manual_type_change(ctx: DashboardContext, e: ft.ControlEvent) -> None:
+    ctx.manual_token_type_value[0] = e.control.value or ctx.manual_token_type_value[0]
+    update_add_button_state(ctx)
+
+
+def _on_add_manual_token(ctx: DashboardContext, _: ft.ControlEvent) -> None:
+    page = ctx.page
+    text = (ctx.manual_token_text.value or "").strip()
+    if not text:
+        return
+
+    token_type = ctx.manual_token_type.value or ctx.manual_token_type_value[0] or "MISC"
+
+    with batched_updates(ctx):
+        try:
+            persist_manual_token(token_type, text)
+        except Exception as e:
+            page.snack_bar = ft.SnackBar(
+                content=ft.Text(str(e)),
+                bgcolor=ctx.theme.get("danger", ft.Colors.RED),
+            )
+            page.snack_bar.open = True
+            return
+
+        ui_add_manual_token(ctx)
+        ctx.manual_token_text.value = ""
+        update_add_button_state(ctx)
+
+
+def _on_resize(ctx: DashboardContext, _: ft.ControlEvent) -> None:
+    _sync_equal_height(ctx)
+    ctx.page.update()
+
+
+def _on_search_change(ctx: DashboardContext, _: ft.ControlEvent) -> None:
+    refresh_tokens_from_store(ctx)
+    flush(ctx)
+
+
+def _build_ai_prompt(masked_text: str) -> str:
+    prompt = (
+        "---\n"
+        "KI-PROMPT\n"
+        "---\n\n"
+        "Der folgende Text enthält anonymisierte Tokens.\n\n"
+        "Tokenformat:\n"
+        "[TYPE_HASH]\n\n"
+        "Beispiele:\n"
+        "[PER_123456]\n"
+        "[E_MAIL_abc123]\n\n"
+        "Regeln:\n"
+        "- Tokens repräsentieren personenbezogene Daten.\n"
+        "- Tokens dürfen als Kontext verwendet werden.\n"
+        "- Tokens dürfen NICHT verändert werden.\n"
+        "- Das Tokenformat muss exakt erhalten bleiben.\n\n"
+        "Beispiel:\n"
+        "Input: Brief an [PER_123456]\n"
+        "Antwort: Der Brief wurde an [PER_123456] gesendet.\n\n"
+        "---\n"
+        "TEXT\n"
+        "---\n\n"
+    )
+
+    return prompt + masked_text
+
+
+def _copy_output(ctx: DashboardContext, _: ft.ControlEvent) -> None:
+    text = ctx.output_field.value or ""
+
+    if config.get("copy_ai_prompt_enabled", False):
+        text = _build_ai_prompt(text)
+
+    ctx.page.set_clipboard(text)
 
 
 def view(page: ft.Page, theme: dict, store) -> ft.Control:
@@ -51,18 +252,10 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
     if lang not in ("de", "en"):
         lang = "de"
 
-    if lang == "de":
-        input_title = "Text hier eingeben oder einfügen"
-        input_sub = (
-            "Füge vertrauliche Inhalte ein, die DSGVO-konform maskiert werden sollen. "
-            "Links siehst du den Originaltext, rechts erscheint die maskierte Ausgabe."
-        )
-    else:
-        input_title = "Type or paste text here"
-        input_sub = (
-            "Paste sensitive text you want to anonymize. "
-            "The original text is shown on the left, the masked output on the right."
-        )
+    T = bind(lang)
+
+    input_title = T.dash_input_title
+    input_sub = T.dash_input_sub
 
     if not hasattr(store, "reversible"):
         setattr(store, "reversible", config.get("reversible_masking", True))
@@ -72,11 +265,7 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
 
     accent = theme.get("accent", theme.get("text_primary"))
 
-    input_ref: ft.Ref[ft.TextField] = ft.Ref[ft.TextField]()
-    placeholder_ref: ft.Ref[ft.Column] = ft.Ref[ft.Column]()
-
     input_field = ft.TextField(
-        ref=input_ref,
         hint_text="",
         multiline=True,
         min_lines=18,
@@ -85,7 +274,7 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
         bgcolor=ft.Colors.TRANSPARENT,
         filled=False,
         text_vertical_align=ft.VerticalAlignment.START,
-        content_padding=ft.padding.only(right=4),
+        content_padding=_INPUT_CONTENT_PADDING,
         value=getattr(store, "dash_input_text", "") or "",
         text_style=ft.TextStyle(color=theme["text_primary"]),
         cursor_color=accent,
@@ -104,7 +293,6 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
     )
 
     placeholder_column = ft.Column(
-        ref=placeholder_ref,
         controls=[placeholder_title, placeholder_sub],
         spacing=4,
         alignment=ft.MainAxisAlignment.START,
@@ -115,37 +303,21 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
         icon=ft.Icons.CLOSE,
         icon_size=18,
         icon_color=theme["text_secondary"],
-        tooltip=t(lang, "btn.clear"),
-        visible=bool((getattr(store, "dash_input_text", "") or "").strip()),
+        tooltip=T.btn_clear,
+        visible=is_nonblank(getattr(store, "dash_input_text", "")),
     )
 
-    def update_clear_icon() -> None:
-        clear_button.visible = bool((input_field.value or "").strip())
-
-    def update_placeholder() -> None:
-        if placeholder_ref.current:
-            is_empty = not (input_field.value or "").strip()
-            placeholder_ref.current.visible = is_empty
-        update_clear_icon()
-
-    def focus_input(_: ft.ControlEvent) -> None:
-        if input_ref.current:
-            input_ref.current.focus()
-        if placeholder_ref.current:
-            placeholder_ref.current.visible = False
-        page.update()
+    card_border, card_padding, card_shadow = _card_style(theme)
 
-    shadow_color = theme["shadow_color"]
-    card_shadow_color = ft.Colors.with_opacity(theme["shadow_opacity"], shadow_color)
+    placeholder_host = ft.Container(
+        content=placeholder_column,
+        alignment=ft.alignment.top_left,
+        padding=_PLACEHOLDER_PADDING,
+    )
 
     field_stack = ft.Stack(
         controls=[
-            ft.Container(
-                content=placeholder_column,
-                alignment=ft.alignment.top_left,
-                padding=ft.padding.only(top=-4),
-                on_click=focus_input,
-            ),
+            placeholder_host,
             input_field,
         ]
     )
@@ -159,7 +331,7 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
             ft.Container(
                 content=clear_button,
                 alignment=ft.alignment.top_right,
-                padding=ft.padding.only(top=-10, right=-10),
+                padding=_CLEAR_BUTTON_PADDING,
             ),
         ],
         spacing=0,
@@ -170,15 +342,9 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
         content=input_stack,
         border_radius=8,
         bgcolor=theme["surface"],
-        border=ft.border.all(1, theme["divider"]),
-        padding=ft.padding.only(left=18, right=18, top=18, bottom=24),
-        shadow=ft.BoxShadow(
-            spread_radius=0,
-            blur_radius=8,
-            color=card_shadow_color,
-            offset=ft.Offset(0, 8),
-        ),
-        on_click=focus_input,
+        border=card_border,
+        padding=card_padding,
+        shadow=card_shadow,
     )
 
     output_field = ft.TextField(
@@ -201,31 +367,11 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
         content=output_field,
         border_radius=8,
         bgcolor=theme["surface"],
-        border=ft.border.all(1, theme["divider"]),
-        padding=ft.padding.only(left=18, right=18, top=18, bottom=24),
-        shadow=ft.BoxShadow(
-            spread_radius=0,
-            blur_radius=8,
-            color=card_shadow_color,
-            offset=ft.Offset(0, 8),
-        ),
+        border=card_border,
+        padding=card_padding,
+        shadow=card_shadow,
     )
 
-    def sync_equal_height() -> None:
-        left_preview = (input_field.value or "").strip()
-        if not left_preview:
-            left_preview = f"{input_title}\n{input_sub}"
-        right_preview = (output_field.value or "").strip()
-        h = synced_textfield_height(
-            left_preview,
-            right_preview,
-            page.window_width or 1200,
-        )
-        input_field.min_lines = h
-        output_field.min_lines = h
-        input_field.max_lines = None
-        output_field.max_lines = None
-
     initial_status = getattr(store, "dash_status_text", "") or ""
 
     results_icon = ft.Icon(ft.Icons.SHIELD_OUTLINED, size=23, color=theme["text_secondary"])
@@ -237,8 +383,8 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
     )
     results_banner = ft.Container(
         visible=bool(initial_status),
-        margin=ft.margin.only(top=12, bottom=4),
-        padding=ft.padding.symmetric(20, 20),
+        margin=_BANNER_MARGIN,
+        padding=_BANNER_PADDING,
         border_radius=10,
         bgcolor=theme["surface_muted"],
         content=ft.Row(
@@ -252,16 +398,16 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
 
     token_groups_col = ft.Column(spacing=10)
     tokens_host = ft.Container(
-        padding=ft.padding.all(16),
+        padding=_TOKENS_PADDING,
         border_radius=12,
         bgcolor=theme["surface"],
-        border=ft.border.all(1, theme["divider"]),
+        border=card_border,
         content=token_groups_col,
         visible=False,
     )
 
     search_box = ft.TextField(
-        hint_text=("Suchen…" if lang == "de" else "Search…"),
+        hint_text=T.search_placeholder,
         prefix_icon=ft.Icons.SEARCH,
         bgcolor=theme["background"],
         border_radius=999,
@@ -274,7 +420,7 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
     )
 
     manual_token_text = ft.TextField(
-        hint_text="Text für neuen Token…" if lang == "de" else "Text for new token…",
+        hint_text=T.manual_token_hint,
         bgcolor=theme["background"],
         border_radius=8,
         border=ft.InputBorder.OUTLINE,
@@ -291,7 +437,10 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
     manual_token_type_value = ["MISC" if "MISC" in manual_token_type_values else manual_token_type_values[0]]
 
     manual_token_type = ft.Dropdown(
-        options=[ft.dropdown.Option(v, text=type_label(lang, v)) for v in manual_token_type_values],
+        options=[
+            ft.dropdown.Option(v, text=label)
+            for v, label in _type_option_labels(lang, manual_token_type_values)
+        ],
         value=manual_token_type_value[0],
         dense=False,
         text_size=12,
@@ -309,7 +458,7 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
     )
 
     add_button = ft.FilledButton(
-        "Hinzufügen" if lang == "de" else "Add",
+        T.manual_token_add,
         icon=ft.Icons.ADD,
         disabled=True,
         height=40,
@@ -317,7 +466,7 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
     )
 
     group_title = ft.Text(
-        "Erkannte Tokens bearbeiten" if lang == "de" else "Review detected tokens",
+        T.manual_tokens_header,
         weight=ft.FontWeight.W_600,
         color=theme["text_primary"],
     )
@@ -355,37 +504,6 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
         visible=False,
     )
 
-    ctx = DashboardContext(
-        page=page,
-        theme=theme,
-        store=store,
-        lang=lang,
-        accent=accent,
-        input_title=input_title,
-        input_sub=input_sub,
-        input_field=input_field,
-        output_field=output_field,
-        results_text=results_text,
-        results_banner=results_banner,
-        token_groups_col=token_groups_col,
-        tokens_host=tokens_host,
-        tokens_section=tokens_section,
-        search_box=search_box,
-        manual_token_text=manual_token_text,
-        manual_token_type=manual_token_type,
-        manual_token_type_values=manual_token_type_values,
-        manual_token_type_value=manual_token_type_value,
-        add_button=add_button,
-        sync_equal_height=sync_equal_height,
-        update_placeholder=update_placeholder,
-    )
-
-    setattr(store, "dashboard_ctx", ctx)
-
-    busy_count = [0]
-
-    show_masking_phase_text = bool(config.get("show_masking_phase_text", True))
-
     progress_ring = ft.ProgressRing(
         width=14,
         height=14,
@@ -416,149 +534,70 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
         vertical_alignment=ft.CrossAxisAlignment.CENTER,
     )
 
-    def _set_phase_text(value: str) -> None:
-        if not show_masking_phase_text:
-            phase_text.visible = False
-            phase_text.value = ""
-            page.update()
-            return
-
-        phase_text.value = value or ""
-        phase_text.visible = bool(value)
-        page.update()
-
-    def _set_busy(is_busy: bool) -> None:
-        if is_busy:
-            busy_count[0] += 1
-        else:
-            busy_count[0] = max(0, busy_count[0] - 1)
-
-        visible = busy_count[0] > 0
-        progress_ring.visible = visible
-        progress_host.visible = visible
-
-        if not visible:
-            phase_text.value = ""
-            phase_text.visible = False
-
-        page.update()
-
-    ctx.on_masking_state = _set_busy
-    ctx.on_masking_phase = _set_phase_text
-
-    def run_masking(_: ft.ControlEvent) -> None:
-        def _worker() -> None:
-            run_masking_internal(ctx, auto=False)
-            update_clear_icon()
-            page.update()
-
-        page.run_thread(_worker)
-
-    def clear_both(_: ft.ControlEvent) -> None:
-        ui_clear_both(ctx)
-        update_clear_icon()
-        page.update()
-
-    clear_button.on_click = clear_both
-
-    def on_input_change(_: ft.ControlEvent) -> None:
-        handle_input_change(ctx)
-        update_clear_icon()
-
-    def on_manual_text_change(_: ft.ControlEvent) -> None:
-        update_add_button_state(ctx)
-
-    def on_manual_type_change(e: ft.ControlEvent) -> None:
-        manual_token_type_value[0] = e.control.value or manual_token_type_value[0]
-        update_add_button_state(ctx)
-
-    manual_token_text.on_change = on_manual_text_change
-    manual_token_type.on_change = on_manual_type_change
-    input_field.on_change = on_input_change
-
-    def on_add_manual_token(_: ft.ControlEvent) -> None:
-        text = (manual_token_text.value or "").strip()
-        if not text:
-            return
-
-        token_type = manual_token_type.value or manual_token_type_value[0] or "MISC"
-
-        try:
-            persist_manual_token(token_type, text)
-        except Exception as e:
-            page.snack_bar = ft.SnackBar(
-                content=ft.Text(str(e)),
-                bgcolor=theme.get("danger", ft.Colors.RED),
-            )
-            page.snack_bar.open = True
-            page.update()
-            return
-
-        ui_add_manual_token(ctx)
-        manual_token_text.value = ""
-        update_add_button_state(ctx)
-        page.update()
-
-    add_button.on_click = on_add_manual_token
-
-    page.on_resize = lambda _: (sync_equal_height(), page.update())
-
-    def on_search_change(_: ft.ControlEvent) -> None:
-        refresh_tokens_from_store(ctx)
-
-    search_box.on_change = on_search_change
-
-    _TOKEN_PATTERN = re.compile(r"\[[A-Z_]+_[0-9a-fA-F]+\]")
-
-    def build_ai_prompt(masked_text: str) -> str:
-        prompt = (
-            "---\n"
-            "KI-PROMPT\n"
-            "---\n\n"
-            "Der folgende Text enthält anonymisierte Tokens.\n\n"
-            "Tokenformat:\n"
-            "[TYPE_HASH]\n\n"
-            "Beispiele:\n"
-            "[PER_123456]\n"
-            "[E_MAIL_abc123]\n\n"
-            "Regeln:\n"
-            "- Tokens repräsentieren personenbezogene Daten.\n"
-            "- Tokens dürfen als Kontext verwendet werden.\n"
-            "- Tokens dürfen NICHT verändert werden.\n"
-            "- Das Tokenformat muss exakt erhalten bleiben.\n\n"
-            "Beispiel:\n"
-            "Input: Brief an [PER_123456]\n"
-            "Antwort: Der Brief wurde an [PER_123456] gesendet.\n\n"
-            "---\n"
-            "TEXT\n"
-            "---\n\n"
-        )
+    ctx = DashboardContext(
+        page=page,
+        theme=theme,
+        store=store,
+        lang=lang,
+        accent=accent,
+        input_title=input_title,
+        input_sub=input_sub,
+        input_field=input_field,
+        output_field=output_field,
+        results_text=results_text,
+        results_banner=results_banner,
+        token_groups_col=token_groups_col,
+        tokens_host=tokens_host,
+        tokens_section=tokens_section,
+        search_box=search_box,
+        manual_token_text=manual_token_text,
+        manual_token_type=manual_token_type,
+        manual_token_type_values=manual_token_type_values,
+        manual_token_type_value=manual_token_type_value,
+        add_button=add_button,
+        clear_button=clear_button,
+        placeholder=placeholder_column,
+        progress_ring=progress_ring,
+        progress_host=progress_host,
+        phase_text=phase_text,
+        show_masking_phase_text=bool(config.get("show_masking_phase_text", True)),
+        input_nonblank=is_nonblank(input_field.value),
+    )
+    ctx.sync_equal_height = partial(_sync_equal_height, ctx)
+    ctx.update_placeholder = partial(_update_placeholder, ctx)
+    ctx.on_masking_state = partial(_set_busy, ctx)
+    ctx.on_masking_phase = partial(_set_phase_text, ctx)
 
-        return prompt + masked_text
+    setattr(store, "dashboard_ctx", ctx)
 
-    def copy_output(_: ft.ControlEvent):
-        text = output_field.value or ""
+    focus_input = partial(_focus_input, ctx)
+    placeholder_host.on_click = focus_input
+    input_box.on_click = focus_input
 
-        if config.get("copy_ai_prompt_enabled", False):
-            text = build_ai_prompt(text)
+    clear_button.on_click = partial(_on_clear, ctx)
+    input_field.on_change = partial(_on_input_change, ctx)
+    manual_token_text.on_change = partial(_on_manual_text_change, ctx)
+    manual_token_type.on_change = partial(_on_manual_type_change, ctx)
+    add_button.on_click = partial(_on_add_manual_token, ctx)
+    search_box.on_change = partial(_on_search_change, ctx)
 
-        page.set_clipboard(text)
+    page.on_resize = partial(_on_resize, ctx)
 
     actions = ft.Row(
         [
             ft.Row(
                 [
                     pill_button(
-                        t(lang, "btn.mask"),
+                        T.btn_mask,
                         icon=ft.Icons.PLAY_ARROW,
-                        on_click=run_masking,
+                        on_click=partial(_on_run_masking, ctx),
                         theme=theme,
                         scale=1.05,
                     ),
                     outlined_pill(
-                        t(lang, "btn.copy_out"),
+                        T.btn_copy_out,
                         icon=ft.Icons.CONTENT_COPY,
-                        on_click=copy_output,
+                        on_click=partial(_copy_output, ctx),
                         theme=theme,
                         scale=1.05,
                     ),
@@ -583,22 +622,20 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
         vertical_alignment=ft.CrossAxisAlignment.START,
     )
 
-    update_placeholder()
-    sync_equal_height()
+    _update_placeholder(ctx)
+    _sync_equal_height(ctx)
     refresh_tokens_from_store(ctx)
-    update_clear_icon()
+    _update_clear_icon(ctx)
     update_add_button_state(ctx)
 
-    base_margin = ft.margin.only(left=4, right=4)
-
     content_column = ft.Column(
         [
-            ft.Container(content=actions, margin=base_margin),
+            ft.Container(content=actions, margin=_SECTION_MARGIN),
             ft.Container(height=5),
-            ft.Container(content=editors, margin=base_margin),
-            ft.Container(content=results_banner, margin=base_margin),
+            ft.Container(content=editors, margin=_SECTION_MARGIN),
+            ft.Container(content=results_banner, margin=_SECTION_MARGIN),
             ft.Container(height=20),
-            ft.Container(content=tokens_section, margin=base_margin),
+            ft.Container(content=tokens_section, margin=_SECTION_MARGIN),
             ft.Container(height=30),
         ],
         spacing=8,
@@ -2,15 +2,158 @@ from __future__ import annotations
 
 import json
 import re
+import sys
+import threading
+from functools import lru_cache
+
 import flet as ft
 from ui.style.components import pill_button, outlined_pill
-from services.anonymizer import de_anonymize
+from services.anonymizer import de_anonymize, find_tokens
 from ui.style.translations import t
 from core import config
-from ui.helpers.dashboard_helpers import synced_textfield_height
+from ui.helpers.dashboard_helpers import is_nonblank, synced_textfield_height
+
+
+DEMASK_DEBOUNCE_SECONDS = 0.12
+
+_PENDING_REFRESH: dict = {"timer": None}
+
+_TYPE_RE = re.compile(r"^\[([A-ZÄÖÜa-zäöü_]+)(?:_[^\]]+)?\]$")
+
+_TYPE_LABELS_DE = {
+    "E_MAIL": "E-Mail",
+    "TELEFON": "Telefon",
+    "IBAN": "IBAN",
+    "URL": "URL",
+    "RECHNUNGS_NUMMER": "Rechnungsnummer",
+    "PLZ": "PLZ",
+    "DATUM": "Datum",
+    "PER": "Person",
+    "ORG": "Organisation",
+    "LOC": "Ort",
+    "MISC": "Sonstiges",
+}
+_TYPE_LABELS_EN = {
+    "E_MAIL": "E-mail",
+    "TELEFON": "Phone",
+    "IBAN": "IBAN",
+    "URL": "URL",
+    "RECHNUNGS_NUMMER": "Invoice No.",
+    "PLZ": "ZIP",
+    "DATUM": "Date",
+    "PER": "Person",
+    "ORG": "Organization",
+    "LOC": "Location",
+    "MISC": "Other",
+}
+
+_GROUP_ORDER = (
+    "E_MAIL",
+    "TELEFON",
+    "IBAN",
+    "URL",
+    "RECHNUNGS_NUMMER",
+    "PLZ",
+    "DATUM",
+    "PER",
+    "ORG",
+    "LOC",
+    "MISC",
+)
+_GROUP_INDEX = {typ: i for i, typ in enumerate(_GROUP_ORDER)}
+
+_CARD_PADDING = ft.padding.only(left=18, right=18, top=18, bottom=24)
+_CARD_SHADOW_OFFSET = ft.Offset(0, 8)
+_INPUT_CONTENT_PADDING = ft.padding.only(right=4)
+_PLACEHOLDER_PADDING = ft.padding.only(top=-4)
+_CLEAR_BUTTON_PADDING = ft.padding.only(top=-10, right=-10)
+_ROW_PADDING = ft.padding.symmetric(10, 12)
+_ROW_VALUE_PADDING = ft.padding.only(left=20, right=28)
+_BADGE_PADDING = ft.padding.symmetric(2, 8)
+_SECTION_MARGIN = ft.margin.only(left=4, right=4)
+
+
+@lru_cache(maxsize=4)
+def _card_style(theme) -> tuple[ft.Border, ft.BoxShadow]:
+    return (
+        ft.border.all(1, theme["divider"]),
+        ft.BoxShadow(
+            spread_radius=0,
+            blur_radius=8,
+            color=theme["shadow_blend"],
+            offset=_CARD_SHADOW_OFFSET,
+        ),
+    )
+
+
+@lru_cache(maxsize=4)
+def _text_styles(theme) -> tuple[ft.TextStyle, ft.TextStyle]:
+    return (
+        ft.TextStyle(color=theme["text_primary"]),
+        ft.TextStyle(color=theme["text_secondary"]),
+    )
+
+
+_json_dumps = json.dumps
+
+
+def _as_text(v) -> str:
+    if isinstance(v, str):
+        return v
+    if isinstance(v, (int, float, bool)) or v is None:
+        return str(v if v is not None else "")
+    if not v:
+        return ""
+    if isinstance(v, (list, tuple)) and all(isinstance(x, str) for x in v):
+        return ", ".join(v)
+    try:
+        return _json_dumps(v, ensure_ascii=False)
+    except Exception:
+        return str(v)
+
+
+def _extract_type(key: str) -> str:
+    s = key.strip()
+    if s[:1] == "[" and s[-1:] == "]" and s.isascii():
+        inner = s[1:-1]
+        if "]" not in inner:
+            if inner.replace("_", "").isalpha():
+                return inner.upper()
+            head, _, tail = inner.rpartition("_")
+            if tail and head.replace("_", "").isalpha():
+                return head.upper()
+    m = _TYPE_RE.match(s)
+    if not m:
+        return "MISC"
+    return m.group(1).upper()
+
+
+def _group_sort_key(typ: str) -> tuple[int, str]:
+    return (_GROUP_INDEX.get(typ, len(_GROUP_ORDER)), typ)
+
+
+def _typed_groups(mapping: dict[str, str]) -> list[tuple[str, list[tuple[str, str, str, str]]]]:
+    buckets: dict[str, list[tuple[str, str, str, str]]] = {}
+    for k, v in mapping.items():
+        k = sys.intern(k)
+        kv = _as_text(v)
+        buckets.setdefault(_extract_type(k), []).append((k, kv, k.lower(), kv.lower()))
+    for entries in buckets.values():
+        entries.sort(key=lambda e: e[2])
+    return [(typ, buckets[typ]) for typ in sorted(buckets, key=_group_sort_key)]
+
+
+def _cancel_pending_refresh() -> None:
+    timer = _PENDING_REFRESH["timer"]
+    if timer is not None:
+        timer.cancel()
+        _PENDING_REFRESH["timer"] = None
 
 
 def view(page: ft.Page, theme: dict, store) -> ft.Control:
+    _cancel_pending_refresh()
+    state_lock = threading.Lock()
+
     lang = getattr(store, "lang", None) or config.get("lang", "de")
     if lang not in ("de", "en"):
         lang = "de"
@@ -21,63 +164,13 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
     if not hasattr(store, "auto_demask_enabled"):
         setattr(store, "auto_demask_enabled", config.get("auto_demask_enabled", True))
 
-    _type_re = re.compile(r"^\[([A-ZÄÖÜa-zäöü_]+)(?:_[^\]]+)?\]$")
-
-    def extract_type(key: str) -> str:
-        m = _type_re.match(key.strip())
-        if not m:
-            return "MISC"
-        return m.group(1).upper()
-
-    TYPE_LABELS_DE = {
-        "E_MAIL": "E-Mail",
-        "TELEFON": "Telefon",
-        "IBAN": "IBAN",
-        "URL": "URL",
-        "RECHNUNGS_NUMMER": "Rechnungsnummer",
-        "PLZ": "PLZ",
-        "DATUM": "Datum",
-        "PER": "Person",
-        "ORG": "Organisation",
-        "LOC": "Ort",
-        "MISC": "Sonstiges",
-    }
-    TYPE_LABELS_EN = {
-        "E_MAIL": "E-mail",
-        "TELEFON": "Phone",
-        "IBAN": "IBAN",
-        "URL": "URL",
-        "RECHNUNGS_NUMMER": "Invoice No.",
-        "PLZ": "ZIP",
-        "DATUM": "Date",
-        "PER": "Person",
-        "ORG": "Organization",
-        "LOC": "Location",
-        "MISC": "Other",
-    }
+    type_labels = _TYPE_LABELS_DE if lang == "de" else _TYPE_LABELS_EN
 
     def type_label(typ: str) -> str:
-        return (TYPE_LABELS_DE if lang == "de" else TYPE_LABELS_EN).get(typ, typ.title())
-
-    GROUP_ORDER = [
-        "E_MAIL",
-        "TELEFON",
-        "IBAN",
-        "URL",
-        "RECHNUNGS_NUMMER",
-        "PLZ",
-        "DATUM",
-        "PER",
-        "ORG",
-        "LOC",
-        "MISC",
-    ]
-
-    def group_sort_key(typ: str) -> tuple[int, str]:
-        try:
-            return (GROUP_ORDER.index(typ), typ)
-        except ValueError:
-            return (len(GROUP_ORDER), typ)
+        return type_labels.get(typ, typ.title())
+
+    text_style, hint_style = _text_styles(theme)
+    card_border, card_shadow = _card_style(theme)
 
     input_ref: ft.Ref[ft.TextField] = ft.Ref[ft.TextField]()
     placeholder_ref: ft.Ref[ft.Column] = ft.Ref[ft.Column]()
@@ -92,8 +185,8 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
         bgcolor=ft.Colors.TRANSPARENT,
         filled=False,
         text_vertical_align=ft.VerticalAlignment.START,
-        content_padding=ft.padding.only(right=4),
-        text_style=ft.TextStyle(color=theme["text_primary"]),
+        content_padding=_INPUT_CONTENT_PADDING,
+        text_style=text_style,
         cursor_color=theme["accent"],
         value=getattr(store, "demask_input_text", "") or "",
     )
@@ -109,7 +202,7 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
         filled=False,
         text_vertical_align=ft.VerticalAlignment.START,
         content_padding=0,
-        text_style=ft.TextStyle(color=theme["text_primary"]),
+        text_style=text_style,
         cursor_color=theme["accent"],
         value=getattr(store, "demask_output_text", "") or "",
     )
@@ -139,17 +232,17 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
         icon_size=18,
         icon_color=theme["text_secondary"],
         tooltip=t(lang, "btn.clear"),
-        visible=bool((getattr(store, "demask_input_text", "") or "").strip()),
+        visible=is_nonblank(getattr(store, "demask_input_text", "")),
     )
 
     def update_clear_icon():
-        clear_button.visible = bool((masked_input_field.value or "").strip())
+        clear_button.visible = is_nonblank(masked_input_field.value)
 
     def update_placeholder():
+        has_content = is_nonblank(masked_input_field.value)
         if placeholder_ref.current:
-            is_empty = not (masked_input_field.value or "").strip()
-            placeholder_ref.current.visible = is_empty
-        update_clear_icon()
+            placeholder_ref.current.visible = not has_content
+        clear_button.visible = has_content
 
     def focus_input(_):
         if input_ref.current:
@@ -158,15 +251,12 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
             placeholder_ref.current.visible = False
         page.update()
 
-    shadow_color = theme["shadow_color"]
-    card_shadow_color = ft.Colors.with_opacity(theme["shadow_opacity"], shadow_color)
-
     field_stack = ft.Stack(
         controls=[
             ft.Container(
                 content=placeholder_column,
                 alignment=ft.alignment.top_left,
-                padding=ft.padding.only(top=-4),
+                padding=_PLACEHOLDER_PADDING,
                 on_click=focus_input,
             ),
             masked_input_field,
@@ -182,7 +272,7 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
             ft.Container(
                 content=clear_button,
                 alignment=ft.alignment.top_right,
-                padding=ft.padding.only(top=-10, right=-10),
+                padding=_CLEAR_BUTTON_PADDING,
             ),
         ],
         spacing=0,
@@ -193,14 +283,9 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
         content=input_stack,
         border_radius=8,
         bgcolor=theme["surface"],
-        border=ft.border.all(1, theme["divider"]),
-        padding=ft.padding.only(left=18, right=18, top=18, bottom=24),
-        shadow=ft.BoxShadow(
-            spread_radius=0,
-            blur_radius=8,
-            color=card_shadow_color,
-            offset=ft.Offset(0, 8),
-        ),
+        border=card_border,
+        padding=_CARD_PADDING,
+        shadow=card_shadow,
         on_click=focus_input,
     )
 
@@ -208,96 +293,159 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
         content=unmasked_output_field,
         border_radius=8,
         bgcolor=theme["surface"],
-        border=ft.border.all(1, theme["divider"]),
-        padding=ft.padding.only(left=18, right=18, top=18, bottom=24),
-        shadow=ft.BoxShadow(
-            spread_radius=0,
-            blur_radius=8,
-            color=card_shadow_color,
-            offset=ft.Offset(0, 8),
-        ),
+        border=card_border,
+        padding=_CARD_PADDING,
+        shadow=card_shadow,
     )
 
+    height_cache: dict = {"sig": None}
+
     def sync_equal_height():
-        left_preview = (masked_input_field.value or "").strip()
-        if not left_preview:
+        if is_nonblank(masked_input_field.value):
+            left_preview = masked_input_field.value.strip()
+        else:
             left_preview = f"{masked_title}\n{masked_sub}"
         right_preview = (unmasked_output_field.value or "").strip()
+        width = page.window_width or 1200
+        sig = (left_preview, right_preview, width)
+        if sig == height_cache["sig"]:
+            return
+        height_cache["sig"] = sig
         h = synced_textfield_height(
             left_preview,
             right_preview,
-            page.window_width or 1200,
+            width,
         )
         masked_input_field.min_lines = masked_input_field.max_lines = h
         unmasked_output_field.min_lines = unmasked_output_field.max_lines = h
 
+    full_mapping_cache: dict = {"rev": None, "src": None, "dict": {}, "groups": []}
+
     # HIER die einzige fachliche Änderung:
     def full_mapping() -> dict[str, str]:
-        mapping: dict[str, str] = {}
-
         session_mgr = getattr(store, "session_mgr", None)
+        current = getattr(store, "last_mapping", None)
+        if not isinstance(current, dict):
+            current = None
+
+        # list_sessions() räumt abgelaufene Sessions auf und erhöht dabei die Revision
+        sessions: list = []
         if session_mgr is not None:
             try:
                 sessions = session_mgr.list_sessions()
             except Exception:
                 sessions = []
-            for sess in sessions:
-                sess_mapping = sess.get("mapping") or {}
-                if isinstance(sess_mapping, dict):
-                    mapping.update(sess_mapping)
 
-        current = getattr(store, "last_mapping", None) or {}
-        if isinstance(current, dict):
+        rev = (
+            session_mgr.revision if session_mgr is not None else None,
+            id(current),
+            len(current) if current is not None else 0,
+        )
+        if rev == full_mapping_cache["rev"]:
+            return full_mapping_cache["dict"]
+
+        mapping: dict[str, str] = {}
+
+        for sess in sessions:
+            sess_mapping = sess.get("mapping") or {}
+            if isinstance(sess_mapping, dict):
+                mapping.update(sess_mapping)
+
+        if current is not None:
             mapping.update(current)
 
+        full_mapping_cache.update(
+            rev=rev,
+            src=current,
+            dict=mapping,
+            groups=_typed_groups(mapping),
+        )
         return mapping
 
-    def ui_mapping() -> dict[str, str]:
+    demask_cache: dict = {"text": None, "mapping": None, "out": ""}
+
+    def demask(text: str, mapping: dict[str, str]) -> str:
+        if demask_cache["text"] == text and demask_cache["mapping"] is mapping:
+            return demask_cache["out"]
+        out = de_anonymize(text, mapping)
+        demask_cache.update(text=text, mapping=mapping, out=out)
+        return out
+
+    presence_cache: dict = {"text": None, "mapping": None, "present": set()}
+
+    def present_tokens() -> set[str]:
         base = full_mapping()
         text = masked_input_field.value or ""
         if not base or not text:
-            return {}
-        return {k: v for k, v in base.items() if k in text}
+            return set()
+        if presence_cache["text"] != text or presence_cache["mapping"] is not base:
+            presence_cache.update(text=text, mapping=base, present=find_tokens(text, base))
+        return presence_cache["present"]
 
     def apply_active_mapping(_):
-        mapping = full_mapping()
-        unmasked_output_field.value = de_anonymize(masked_input_field.value or "", mapping)
-        setattr(store, "demask_input_text", masked_input_field.value or "")
-        setattr(store, "demask_output_text", unmasked_output_field.value or "")
-        sync_equal_height()
-        rebuild_mapping_rows()
-        update_clear_icon()
-        page.update()
+        with state_lock:
+            _cancel_pending_refresh()
+            mapping = full_mapping()
+            unmasked_output_field.value = demask(masked_input_field.value or "", mapping)
+            setattr(store, "demask_input_text", masked_input_field.value or "")
+            setattr(store, "demask_output_text", unmasked_output_field.value or "")
+            sync_equal_height()
+            rebuild_mapping_rows()
+            update_clear_icon()
+            page.update()
 
     def clear_fields(_):
-        masked_input_field.value = ""
-        unmasked_output_field.value = ""
-        setattr(store, "demask_input_text", "")
-        setattr(store, "demask_output_text", "")
-        update_placeholder()
-        sync_equal_height()
-        rebuild_mapping_rows()
-        page.update()
+        with state_lock:
+            _cancel_pending_refresh()
+            masked_input_field.value = ""
+            unmasked_output_field.value = ""
+            setattr(store, "demask_input_text", "")
+            setattr(store, "demask_output_text", "")
+            demask_cache.update(text=None, mapping=None, out="")
+            rebuild_state.update(groups=None, q=None, present=None)
+            update_placeholder()
+            sync_equal_height()
+            rebuild_mapping_rows()
+            page.update()
 
     clear_button.on_click = clear_fields
 
     def copy_output(_):
         page.set_clipboard(unmasked_output_field.value or "")
 
+    def refresh_after_input() -> None:
+        with state_lock:
+            if _PENDING_REFRESH["timer"] is not threading.current_thread():
+                return
+            _PENDING_REFRESH["timer"] = None
+            mapping = full_mapping()
+            if getattr(store, "auto_demask_enabled", False) and mapping:
+                unmasked_output_field.value = demask(masked_input_field.value or "", mapping)
+                setattr(store, "demask_output_text", unmasked_output_field.value or "")
+            sync_equal_height()
+            rebuild_mapping_rows()
+            page.update()
+
     def on_masked_change(_):
-        setattr(store, "demask_input_text", masked_input_field.value or "")
-        mapping = full_mapping()
-        if getattr(store, "auto_demask_enabled", False) and mapping:
-            unmasked_output_field.value = de_anonymize(masked_input_field.value or "", mapping)
-            setattr(store, "demask_output_text", unmasked_output_field.value or "")
-        sync_equal_height()
-        update_placeholder()
-        rebuild_mapping_rows()
-        page.update()
+        with state_lock:
+            setattr(store, "demask_input_text", masked_input_field.value or "")
+            update_placeholder()
+            page.update()
+
+            _cancel_pending_refresh()
+            timer = threading.Timer(DEMASK_DEBOUNCE_SECONDS, refresh_after_input)
+            timer.daemon = True
+            _PENDING_REFRESH["timer"] = timer
+            timer.start()
 
     masked_input_field.on_change = on_masked_change
 
-    page.on_resize = lambda _: (sync_equal_height(), page.update())
+    def on_resize(_):
+        with state_lock:
+            sync_equal_height()
+            page.update()
+
+    page.on_resize = on_resize
 
     actions_top = ft.Row(
         [
@@ -350,32 +498,24 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
         border_radius=10,
         filled=True,
         dense=True,
-        text_style=ft.TextStyle(color=theme["text_primary"]),
-        hint_style=ft.TextStyle(color=theme["text_secondary"]),
+        text_style=text_style,
+        hint_style=hint_style,
         cursor_color=theme["accent"],
     )
 
     mapping_list = ft.Column(spacing=10)
 
-    def as_text(v) -> str:
-        if isinstance(v, (str, int, float, bool)) or v is None:
-            return str(v if v is not None else "")
-        try:
-            return json.dumps(v, ensure_ascii=False)
-        except Exception:
-            return str(v)
-
-    def make_row(k: str, v) -> ft.Control:
+    def make_row(k: str, v_str: str) -> ft.Control:
         return ft.Container(
             bgcolor=theme["surface"],
             border_radius=8,
-            padding=ft.padding.symmetric(10, 12),
+            padding=_ROW_PADDING,
             content=ft.Row(
                 [
                     ft.Container(ft.Text(k, selectable=False, color=theme["text_primary"]), expand=1),
                     ft.Container(
                         ft.Text(
-                            as_text(v),
+                            v_str,
                             selectable=False,
                             color=theme["text_primary"],
                             overflow=ft.TextOverflow.VISIBLE,
@@ -384,7 +524,7 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
                         ),
                         expand=1,
                         alignment=ft.alignment.center_left,
-                        padding=ft.padding.only(left=20, right=28),
+                        padding=_ROW_VALUE_PADDING,
                     ),
                 ],
                 vertical_alignment=ft.CrossAxisAlignment.CENTER,
@@ -393,7 +533,7 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
 
     def group_header(typ: str, count: int) -> ft.Control:
         badge = ft.Container(
-            padding=ft.padding.symmetric(2, 8),
+            padding=_BADGE_PADDING,
             bgcolor=theme["surface_muted"],
             border_radius=20,
             content=ft.Text(str(count), size=12, color=theme["text_secondary"]),
@@ -439,51 +579,69 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
         visible=False,
     )
 
+    group_cache: dict[tuple, ft.Control] = {}
+    rebuild_state: dict = {"groups": None, "q": None, "present": None}
+
     def rebuild_mapping_rows() -> None:
-        mapping = ui_mapping()
+        present = present_tokens()
         q = (search_box.value or "").strip().lower()
-
-        filtered: list[tuple[str, str, str]] = []
-        for k in mapping.keys():
-            v = mapping[k]
-            kv = as_text(v)
-            if q and (q not in k.lower()) and (q not in kv.lower()):
-                continue
-            typ = extract_type(k)
-            filtered.append((typ, k, v))
-
-        groups: dict[str, list[tuple[str, str]]] = {}
-        for typ, k, v in filtered:
-            groups.setdefault(typ, []).append((k, v))
-
-        ordered_types = sorted(groups.keys(), key=group_sort_key)
+        typed_groups = full_mapping_cache["groups"]
+
+        if (
+            rebuild_state["groups"] is typed_groups
+            and rebuild_state["q"] == q
+            and rebuild_state["present"] == present
+        ):
+            return
+        rebuild_state.update(groups=typed_groups, q=q, present=present)
+
+        groups: list[tuple[str, list[tuple[str, str]]]] = []
+        if present:
+            for typ, entries in typed_groups:
+                items = [
+                    (k, kv)
+                    for k, kv, k_l, kv_l in entries
+                    if k in present and (not q or q in k_l or q in kv_l)
+                ]
+                if items:
+                    groups.append((typ, items))
 
         controls: list[ft.Control] = []
-        for i, typ in enumerate(ordered_types):
-            items = sorted(groups[typ], key=lambda kv: kv[0].lower())
-            controls.append(build_group(typ, items))
-            if i < len(ordered_types) - 1:
+        used: dict[tuple, ft.Control] = {}
+        for i, (typ, items) in enumerate(groups):
+            sig = (typ, tuple(items))
+            group = group_cache.get(sig)
+            if group is None:
+                group = build_group(typ, items)
+            used[sig] = group
+            controls.append(group)
+            if i < len(groups) - 1:
                 controls.append(ft.Container(height=12))
 
+        group_cache.clear()
+        group_cache.update(used)
+
         mapping_list.controls = controls
-        mapping_block.visible = bool(mapping)
-        page.update()
+        mapping_block.visible = bool(present)
+
+    def on_search_change(_):
+        with state_lock:
+            rebuild_mapping_rows()
+            page.update()
 
-    search_box.on_change = lambda _: rebuild_mapping_rows()
+    search_box.on_change = on_search_change
 
     rebuild_mapping_rows()
     update_placeholder()
     sync_equal_height()
 
-    base_margin = ft.margin.only(left=4, right=4)
-
     content_column = ft.Column(
         [
-            ft.Container(content=actions_top, margin=base_margin),
+            ft.Container(content=actions_top, margin=_SECTION_MARGIN),
             ft.Container(height=5),
-            ft.Container(content=editors_row, margin=base_margin),
+            ft.Container(content=editors_row, margin=_SECTION_MARGIN),
             ft.Container(height=16),
-            ft.Container(content=mapping_block, margin=base_margin),
+            ft.Container(content=mapping_block, margin=_SECTION_MARGIN),
         ],
         spacing=8,
         expand=True,
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import time
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+from typing import Iterator
 
 import flet as ft
 from core import config
@@ -11,15 +14,21 @@ from ui.helpers.dashboard_actions import (
     refresh_tokens_from_store,
     run_masking_internal,
 )
-from services.manual_tokens import get_all, add_manual_token, remove_manual_token, ManualToken
+from services.manual_tokens import (
+    get_all,
+    add_manual_token,
+    remove_manual_token,
+    remove_manual_tokens_by_type,
+    ManualToken,
+)
 from services.manual_categories import (
-    get_all_types as get_custom_types,
+    get_types as get_custom_types,
     add_type as add_custom_type,
     remove_type as remove_custom_type,
 )
 from services.session_manager import SESSION_TTL_SECONDS
 
-BASE_TYPES = [
+BASE_TYPES = (
     "E_MAIL",
     "TELEFON",
     "IBAN",
@@ -31,18 +40,94 @@ BASE_TYPES = [
     "ORG",
     "LOC",
     "MISC",
-]
-
-
-def _all_types() -> list[str]:
-    custom = get_custom_types()
-    all_types = list(BASE_TYPES)
-    for c in custom:
-        if c not in all_types:
-            all_types.append(c)
-    return all_types
-
-
+)
+BASE_TYPES_SET = frozenset(BASE_TYPES)
+
+
+@lru_cache(maxsize=8)
+def _merge_types(custom: tuple[str, ...]) -> tuple[str, ...]:
+    return BASE_TYPES + tuple(dict.fromkeys(c for c in custom if c not in BASE_TYPES_SET))
+
+
+def _all_types() -> tuple[str, ...]:
+    return _merge_types(get_custom_types())
+
+
+SESSION_MAPPING_WINDOW = 200
+
+_LABELS: dict[str, dict[str, str]] = {
+    "de": {
+        "subtitle_text": "Verwalte eigene Wörter und Tokens, die bei der Maskierung verwendet werden.",
+        "add_label": "Neuen Eintrag hinzufügen",
+        "value_hint": "Wort oder Ausdruck…",
+        "new_type_hint": "Neue Kategorie (z. B. KUNDENNUMMER)…",
+        "save_button": "Speichern",
+        "cancel_button": "Abbrechen",
+        "delete_button": "Löschen",
+        "edit_button_tooltip": "Bearbeiten",
+        "empty_text": "Es sind noch keine eigenen Tokens vorhanden.",
+        "add_type_label": "Kategorie hinzufügen",
+        "categories_title": "Eigene Kategorien",
+        "delete_token_msg": "Eintrag gelöscht.",
+        "delete_type_msg": "Kategorie und zugehörige Einträge gelöscht.",
+        "sessions_title": "Maskierungssessions",
+        "sessions_empty_text": "Es sind noch keine Sessions vorhanden.",
+        "session_active_label": "Aktive Session",
+        "session_closed_label": "Abgeschlossene Session",
+        "session_tokens_label": "Tokens",
+        "session_created_label": "Erstellt",
+        "session_closed_at_label": "Beendet",
+        "session_tokens_heading": "Token-Mapping",
+        "session_token_id_header": "Token",
+        "session_token_value_header": "Originalwert",
+        "session_delete_tooltip": "Session löschen",
+        "session_delete_msg": "Session gelöscht.",
+        "session_show_more": "Weitere {n} anzeigen",
+        "session_expand_tooltip": "Aufklappen",
+        "session_expired": "abgelaufen",
+        "session_expires_hm": "läuft in {h}h {m}min ab",
+        "session_expires_m": "läuft in {m}min ab",
+        "value_required_msg": "Bitte einen Wert eingeben.",
+        "category_required_msg": "Bitte eine Kategorie eingeben.",
+    },
+    "en": {
+        "subtitle_text": "Manage custom words and tokens used for masking.",
+        "add_label": "Add new entry",
+        "value_hint": "Word or phrase…",
+        "new_type_hint": "New category (e.g. CUSTOMER_ID)…",
+        "save_button": "Save",
+        "cancel_button": "Cancel",
+        "delete_button": "Delete",
+        "edit_button_tooltip": "Edit",
+        "empty_text": "No custom tokens yet.",
+        "add_type_label": "Add category",
+        "categories_title": "Custom categories",
+        "delete_token_msg": "Entry deleted.",
+        "delete_type_msg": "Category and related entries deleted.",
+        "sessions_title": "Masking sessions",
+        "sessions_empty_text": "No sessions yet.",
+        "session_active_label": "Active session",
+        "session_closed_label": "Closed session",
+        "session_tokens_label": "Tokens",
+        "session_created_label": "Created",
+        "session_closed_at_label": "Closed",
+        "session_tokens_heading": "Token mapping",
+        "session_token_id_header": "Token",
+        "session_token_value_header": "Original value",
+        "session_delete_tooltip": "Delete session",
+        "session_delete_msg": "Session deleted.",
+        "session_show_more": "Show {n} more",
+        "session_expand_tooltip": "Expand",
+        "session_expired": "expired",
+        "session_expires_hm": "expires in {h}h {m}min",
+        "session_expires_m": "expires in {m}min",
+        "value_required_msg": "Please enter a value.",
+        "category_required_msg": "Please enter a category.",
+    },
+}
+
+
+@lru_cache(maxsize=256)
 def _format_dt(ts: float, lang: str) -> str:
     if not ts:
         return ""
@@ -52,25 +137,19 @@ def _format_dt(ts: float, lang: str) -> str:
     return dt.strftime("%Y-%m-%d %H:%M:%S")
 
 
-def _format_ttl_remaining(closed_at: float | None, lang: str) -> str:
+def _format_ttl_remaining(closed_at: float | None, lang: str, now: float | None = None) -> str:
     if closed_at is None:
         return ""
-    now = time.time()
+    if now is None:
+        now = time.time()
+    labels = _LABELS[lang]
     remaining = SESSION_TTL_SECONDS - (now - closed_at)
     if remaining <= 0:
-        if lang == "de":
-            return "abgelaufen"
-        return "expired"
-    mins = int(remaining // 60)
-    hours = mins // 60
-    mins = mins % 60
-    if lang == "de":
-        if hours > 0:
-            return f"läuft in {hours}h {mins}min ab"
-        return f"läuft in {mins}min ab"
+        return labels["session_expired"]
+    hours, mins = divmod(int(remaining // 60), 60)
     if hours > 0:
-        return f"expires in {hours}h {mins}min"
-    return f"expires in {mins}min"
+        return labels["session_expires_hm"].format(h=hours, m=mins)
+    return labels["session_expires_m"].format(m=mins)
 
 
 def view(page: ft.Page, theme: dict, store) -> ft.Control:
@@ -85,72 +164,24 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
         color=theme["text_primary"],
     )
 
-    if lang == "de":
-        subtitle_text = "Verwalte eigene Wörter und Tokens, die bei der Maskierung verwendet werden."
-        add_label = "Neuen Eintrag hinzufügen"
-        value_hint = "Wort oder Ausdruck…"
-        new_type_hint = "Neue Kategorie (z. B. KUNDENNUMMER)…"
-        save_button = "Speichern"
-        cancel_button = "Abbrechen"
-        delete_button = "Löschen"
-        edit_button_tooltip = "Bearbeiten"
-        empty_text = "Es sind noch keine eigenen Tokens vorhanden."
-        add_type_label = "Kategorie hinzufügen"
-        categories_title = "Eigene Kategorien"
-        delete_token_msg = "Eintrag gelöscht."
-        delete_type_msg = "Kategorie und zugehörige Einträge gelöscht."
-        sessions_title = "Maskierungssessions"
-        sessions_empty_text = "Es sind noch keine Sessions vorhanden."
-        session_active_label = "Aktive Session"
-        session_closed_label = "Abgeschlossene Session"
-        session_tokens_label = "Tokens"
-        session_created_label = "Erstellt"
-        session_closed_at_label = "Beendet"
-        session_tokens_heading = "Token-Mapping"
-        session_token_id_header = "Token"
-        session_token_value_header = "Originalwert"
-        session_delete_tooltip = "Session löschen"
-        session_delete_msg = "Session gelöscht."
-    else:
-        subtitle_text = "Manage custom words and tokens used for masking."
-        add_label = "Add new entry"
-        value_hint = "Word or phrase…"
-        new_type_hint = "New category (e.g. CUSTOMER_ID)…"
-        save_button = "Save"
-        cancel_button = "Cancel"
-        delete_button = "Delete"
-        edit_button_tooltip = "Edit"
-        empty_text = "No custom tokens yet."
-        add_type_label = "Add category"
-        categories_title = "Custom categories"
-        delete_token_msg = "Entry deleted."
-        delete_type_msg = "Category and related entries deleted."
-        sessions_title = "Masking sessions"
-        sessions_empty_text = "No sessions yet."
-        session_active_label = "Active session"
-        session_closed_label = "Closed session"
-        session_tokens_label = "Tokens"
-        session_created_label = "Created"
-        session_closed_at_label = "Closed"
-        session_tokens_heading = "Token mapping"
-        session_token_id_header = "Token"
-        session_token_value_header = "Original value"
-        session_delete_tooltip = "Delete session"
-        session_delete_msg = "Session deleted."
+    L = _LABELS[lang]
 
     subtitle = ft.Text(
-        subtitle_text,
+        L["subtitle_text"],
         size=13,
         color=theme["text_secondary"],
     )
 
     tokens: list[ManualToken] = get_all()
     editing_key: list[tuple[str, str] | None] = [None]
+    tokens_version = [0]
+    grouped_cache: dict = {"version": -1, "groups": ()}
 
-    expanded_session_ids: list[set[str]] = [set()]
+    expanded_sessions: dict[str, list] = {}
+    mapping_tables: dict[str, ft.Column] = {}
 
     add_value_field = ft.TextField(
-        hint_text=value_hint,
+        hint_text=L["value_hint"],
         bgcolor=theme["surface"],
         border_radius=10,
         filled=True,
@@ -158,7 +189,8 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
         expand=True,
     )
 
-    type_options_state: list[list[str]] = [_all_types()]
+    type_options_state: list[tuple[str, ...]] = [_all_types()]
+    edit_options_cache: dict = {}
 
     add_type_dropdown = ft.Dropdown(
         options=[ft.dropdown.Option(v, text=type_label(lang, v)) for v in type_options_state[0]],
@@ -177,7 +209,7 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
     add_type_dropdown.on_change = on_add_type_change
 
     new_type_field = ft.TextField(
-        hint_text=new_type_hint,
+        hint_text=L["new_type_hint"],
         bgcolor=theme["surface"],
         border_radius=10,
         filled=True,
@@ -189,8 +221,39 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
     categories_col = ft.Column(spacing=8)
     sessions_col = ft.Column(spacing=8)
 
+    suspend_updates = [False]
+    tokens_dirty = [False]
+
+    def update():
+        if not suspend_updates[0]:
+            page.update()
+
+    @contextmanager
+    def batched() -> Iterator[None]:
+        if suspend_updates[0]:
+            yield
+            return
+
+        dashboard_ctx = getattr(store, "dashboard_ctx", None)
+        suspend_updates[0] = True
+        if dashboard_ctx is not None:
+            dashboard_ctx.suspend_updates = True
+        try:
+            yield
+        finally:
+            if tokens_dirty[0]:
+                tokens_dirty[0] = False
+                build_token_rows()
+            suspend_updates[0] = False
+            if dashboard_ctx is not None:
+                dashboard_ctx.suspend_updates = False
+            page.update()
+
     def refresh_type_options():
-        type_options_state[0] = _all_types()
+        all_types = _all_types()
+        if all_types is type_options_state[0]:
+            return
+        type_options_state[0] = all_types
         add_type_dropdown.options = [
             ft.dropdown.Option(v, text=type_label(lang, v)) for v in type_options_state[0]
         ]
@@ -198,9 +261,30 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
             add_type_value[0] = "MISC"
         add_type_dropdown.value = add_type_value[0]
 
-    def reload_tokens():
+    def refetch_tokens():
         tokens[:] = get_all()
-        build_token_rows()
+        tokens_version[0] += 1
+
+    def rebuild_token_rows():
+        if suspend_updates[0]:
+            tokens_dirty[0] = True
+        else:
+            build_token_rows()
+
+    def reload_tokens():
+        refetch_tokens()
+        rebuild_token_rows()
+
+    def grouped_tokens() -> tuple[tuple[str, tuple[ManualToken, ...]], ...]:
+        if grouped_cache["version"] == tokens_version[0]:
+            return grouped_cache["groups"]
+        group_keys = {typ: group_sort_key(typ) for typ in {tok.typ for tok in tokens}}
+        groups: dict[str, list[ManualToken]] = {}
+        for tok in sorted(tokens, key=lambda t: (group_keys[t.typ], t.value.lower())):
+            groups.setdefault(tok.typ, []).append(tok)
+        grouped_cache["version"] = tokens_version[0]
+        grouped_cache["groups"] = tuple((typ, tuple(items)) for typ, items in groups.items())
+        return grouped_cache["groups"]
 
     def show_snackbar(text: str, color_key: str = "danger"):
         page.snack_bar = ft.SnackBar(
@@ -208,41 +292,39 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
             bgcolor=theme.get(color_key, theme["danger"]),
         )
         page.snack_bar.open = True
-        page.update()
+        update()
 
     def handle_add_category(_):
-        raw = (new_type_field.value or "").strip()
-        if not raw:
-            msg = "Bitte eine Kategorie eingeben." if lang == "de" else "Please enter a category."
-            show_snackbar(msg, "danger")
-            return
-        try:
-            added = add_custom_type(raw)
-        except Exception as e:
-            show_snackbar(str(e), "danger")
-            return
-        new_type_field.value = ""
-        refresh_type_options()
-        add_type_value[0] = added
-        add_type_dropdown.value = added
-        build_categories_rows()
-        page.update()
+        with batched():
+            raw = (new_type_field.value or "").strip()
+            if not raw:
+                show_snackbar(L["category_required_msg"], "danger")
+                return
+            try:
+                added = add_custom_type(raw)
+            except Exception as e:
+                show_snackbar(str(e), "danger")
+                return
+            new_type_field.value = ""
+            refresh_type_options()
+            add_type_value[0] = added
+            add_type_dropdown.value = added
+            build_categories_rows()
 
     def handle_add_entry(_):
-        value = (add_value_field.value or "").strip()
-        if not value:
-            msg = "Bitte einen Wert eingeben." if lang == "de" else "Please enter a value."
-            show_snackbar(msg, "danger")
-            return
-        typ = add_type_value[0] or "MISC"
-        try:
-            add_manual_token(typ, value)
-        except Exception as e:
-            show_snackbar(str(e), "danger")
-            return
-        add_value_field.value = ""
-        reload_tokens()
-        page.update()
+        with batched():
+            value = (add_value_field.value or "").strip()
+            if not value:
+                show_snackbar(L["value_required_msg"], "danger")
+                return
+            typ = add_type_value[0] or "MISC"
+            try:
+                add_manual_token(typ, value)
+            except Exception as e:
+                show_snackbar(str(e), "danger")
+                return
+            add_value_field.value = ""
+            reload_tokens()
 
     def _remask_dashboard() -> None:
         dashboard_ctx = getattr(store, "dashboard_ctx", None)
@@ -251,70 +333,294 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
         run_masking_internal(dashboard_ctx, auto=True)
         dashboard_ctx.update_placeholder()
         dashboard_ctx.sync_equal_height()
-        dashboard_ctx.page.update()
+        update()
 
     def _remove_from_current_mapping(tok: ManualToken):
-        mapping = getattr(store, "last_mapping", None) or {}
-        to_remove = [k for k, v in mapping.items() if v == tok.value]
-        for key in to_remove:
-            mapping.pop(key, None)
-        setattr(store, "last_mapping", mapping)
-        dashboard_ctx = getattr(store, "dashboard_ctx", None)
-        if dashboard_ctx is not None:
-            refresh_tokens_from_store(dashboard_ctx)
-        _remask_dashboard()
+        _remove_values_from_current_mapping([tok.value])
 
     def _remove_values_from_current_mapping(values: list[str]):
         if not values:
             return
-        mapping = getattr(store, "last_mapping", None) or {}
-        to_remove = [k for k, v in mapping.items() if v in values]
-        for key in to_remove:
-            mapping.pop(key, None)
-        setattr(store, "last_mapping", mapping)
+        store.remove_mapping_values(values)
         dashboard_ctx = getattr(store, "dashboard_ctx", None)
         if dashboard_ctx is not None:
             refresh_tokens_from_store(dashboard_ctx)
         _remask_dashboard()
 
     def delete_token_immediately(tok: ManualToken):
-        try:
-            remove_manual_token(tok.typ, tok.value)
-        except Exception as e:
-            show_snackbar(str(e), "danger")
-            return
-        _remove_from_current_mapping(tok)
-        reload_tokens()
-        show_snackbar(delete_token_msg, "surface_muted")
+        with batched():
+            try:
+                remove_manual_token(tok.typ, tok.value)
+            except Exception as e:
+                show_snackbar(str(e), "danger")
+                return
+            _remove_from_current_mapping(tok)
+            refetch_tokens()
+            if not drop_token_row((tok.typ, tok.value)):
+                rebuild_token_rows()
+            show_snackbar(L["delete_token_msg"], "surface_muted")
 
     def delete_category_immediately(typ: str):
-        if typ in BASE_TYPES:
-            return
-        removed_values: list[str] = []
-        try:
-            remove_custom_type(typ)
-        except Exception as e:
-            show_snackbar(str(e), "danger")
-            return
-        for tok in list(tokens):
-            if tok.typ == typ:
-                removed_values.append(tok.value)
+        with batched():
+            if typ in BASE_TYPES_SET:
+                return
+            try:
+                remove_custom_type(typ)
+            except Exception as e:
+                show_snackbar(str(e), "danger")
+                return
+            try:
+                removed_values = remove_manual_tokens_by_type(typ)
+            except Exception:
+                removed_values = [tok.value for tok in tokens if tok.typ == typ]
+            _remove_values_from_current_mapping(removed_values)
+            reload_tokens()
+            refresh_type_options()
+            if add_type_value[0] == typ:
+                add_type_value[0] = "MISC"
+                add_type_dropdown.value = "MISC"
+            build_categories_rows()
+            show_snackbar(L["delete_type_msg"], "surface_muted")
+
+    token_rows_by_key: dict[tuple[str, str], tuple[ft.Control, ft.Column]] = {}
+    group_badges: dict[str, ft.Text] = {}
+
+    def group_header(typ: str, count: int) -> ft.Control:
+        badge_text = ft.Text(str(count), size=12, color=theme["text_secondary"])
+        group_badges[typ] = badge_text
+        badge = ft.Container(
+            padding=ft.padding.symmetric(2, 8),
+            bgcolor=theme["surface_muted"],
+            border_radius=20,
+            content=badge_text,
+        )
+        title_text = type_label(lang, typ)
+        title = ft.Text(title_text, weight=ft.FontWeight.W_600, color=theme["text_primary"])
+        return ft.Row(
+            [title, badge],
+            spacing=8,
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+        )
+
+    def edit_type_options() -> list[ft.dropdown.Option]:
+        if edit_options_cache.get("types") is not type_options_state[0]:
+            edit_options_cache["types"] = type_options_state[0]
+            edit_options_cache["labels"] = [(v, type_label(lang, v)) for v in type_options_state[0]]
+        return [ft.dropdown.Option(v, text=label) for v, label in edit_options_cache["labels"]]
+
+    def build_edit_row(tok: ManualToken) -> ft.Control:
+        edit_value_field = ft.TextField(
+            value=tok.value,
+            bgcolor=theme["surface"],
+            border_radius=8,
+            filled=True,
+            dense=True,
+            expand=True,
+        )
+
+        edit_type_dropdown = ft.Dropdown(
+            options=edit_type_options(),
+            value=tok.typ,
+            dense=True,
+            text_size=12,
+            width=220,
+            menu_height=260,
+        )
+
+        edit_type_state = [tok.typ]
+
+        def on_edit_type_change(e: ft.ControlEvent, state=edit_type_state):
+            state[0] = e.control.value or tok.typ
+
+        edit_type_dropdown.on_change = on_edit_type_change
+
+        def on_save_edit(
+            _,
+            _tok: ManualToken = tok,
+            value_field: ft.TextField = edit_value_field,
+            type_state: list[str] = edit_type_state,
+        ):
+            with batched():
+                new_value = (value_field.value or "").strip()
+                if not new_value:
+                    show_snackbar(L["value_required_msg"], "danger")
+                    return
+                new_typ = (type_state[0] or _tok.typ).upper().strip()
                 try:
-                    remove_manual_token(tok.typ, tok.value)
-                except Exception:
-                    pass
-        _remove_values_from_current_mapping(removed_values)
-        reload_tokens()
-        refresh_type_options()
-        if add_type_value[0] == typ:
-            add_type_value[0] = "MISC"
-            add_type_dropdown.value = "MISC"
-        build_categories_rows()
-        show_snackbar(delete_type_msg, "surface_muted")
-        page.update()
+                    remove_manual_token(_tok.typ, _tok.value)
+                    add_manual_token(new_typ, new_value)
+                except Exception as e:
+                    show_snackbar(str(e), "danger")
+                    reload_tokens()
+                    editing_key[0] = None
+                    return
+                _remove_from_current_mapping(_tok)
+                editing_key[0] = None
+                reload_tokens()
+
+        def on_cancel_edit(_):
+            with batched():
+                set_editing_key(None)
+
+        return ft.Container(
+            bgcolor=theme["surface"],
+            border_radius=10,
+            padding=ft.padding.symmetric(10, 12),
+            content=ft.Column(
+                [
+                    ft.Row(
+                        [
+                            edit_type_dropdown,
+                        ],
+                        spacing=8,
+                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                    ),
+                    ft.Container(height=6),
+                    ft.Row(
+                        [
+                            edit_value_field,
+                        ],
+                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                    ),
+                    ft.Container(height=6),
+                    ft.Row(
+                        [
+                            ft.TextButton(L["cancel_button"], on_click=on_cancel_edit),
+                            ft.FilledButton(L["save_button"], on_click=on_save_edit),
+                        ],
+                        spacing=8,
+                        alignment=ft.MainAxisAlignment.END,
+                    ),
+                ],
+                spacing=4,
+            ),
+        )
+
+    def on_edit_click(e: ft.ControlEvent):
+        with batched():
+            set_editing_key(e.control.data)
+
+    def on_delete_token_click(e: ft.ControlEvent):
+        typ, value = e.control.data
+        delete_token_immediately(ManualToken(typ=typ, value=value))
+
+    def on_delete_category_click(e: ft.ControlEvent):
+        delete_category_immediately(e.control.data)
+
+    def on_toggle_session_click(e: ft.ControlEvent):
+        toggle_expand(e.control.data)
+
+    def on_delete_session_click(e: ft.ControlEvent):
+        handle_delete_session(e.control.data)
+
+    def on_show_more_click(e: ft.ControlEvent):
+        show_more(e.control.data)
+
+    def build_display_row(tok: ManualToken) -> ft.Control:
+        key = (tok.typ, tok.value)
+        value_text = ft.Text(
+            tok.value,
+            color=theme["text_primary"],
+            size=13,
+            no_wrap=False,
+            expand=True,
+        )
+        type_chip = ft.Container(
+            padding=ft.padding.symmetric(2, 8),
+            border_radius=20,
+            bgcolor=theme["surface_muted"],
+            content=ft.Text(
+                type_label(lang, tok.typ),
+                size=11,
+                color=theme["text_secondary"],
+            ),
+        )
+        action_row = ft.Row(
+            [
+                ft.IconButton(
+                    icon=ft.Icons.EDIT,
+                    tooltip=L["edit_button_tooltip"],
+                    icon_size=18,
+                    data=key,
+                    on_click=on_edit_click,
+                ),
+                ft.IconButton(
+                    icon=ft.Icons.DELETE_OUTLINE,
+                    tooltip=L["delete_button"],
+                    icon_size=18,
+                    data=key,
+                    on_click=on_delete_token_click,
+                ),
+            ],
+            spacing=4,
+            alignment=ft.MainAxisAlignment.END,
+        )
+        return ft.Container(
+            bgcolor=theme["surface"],
+            border_radius=10,
+            padding=ft.padding.symmetric(10, 12),
+            content=ft.Row(
+                [
+                    ft.Column(
+                        [
+                            ft.Row(
+                                [
+                                    type_chip,
+                                ],
+                                spacing=8,
+                                vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                            ),
+                            ft.Container(height=4),
+                            value_text,
+                        ],
+                        spacing=2,
+                        expand=True,
+                    ),
+                    action_row,
+                ],
+                vertical_alignment=ft.CrossAxisAlignment.CENTER,
+            ),
+        )
+
+    def build_token_row(tok: ManualToken) -> ft.Control:
+        if editing_key[0] == (tok.typ, tok.value):
+            return build_edit_row(tok)
+        return build_display_row(tok)
+
+    def swap_token_row(key: tuple[str, str]) -> bool:
+        entry = token_rows_by_key.get(key)
+        if entry is None:
+            return False
+        old_row, rows_col = entry
+        new_row = build_token_row(ManualToken(typ=key[0], value=key[1]))
+        rows_col.controls[rows_col.controls.index(old_row)] = new_row
+        token_rows_by_key[key] = (new_row, rows_col)
+        return True
+
+    def drop_token_row(key: tuple[str, str]) -> bool:
+        entry = token_rows_by_key.get(key)
+        if entry is None:
+            return False
+        row, rows_col = entry
+        if len(rows_col.controls) <= 1:
+            return False
+        rows_col.controls.remove(row)
+        del token_rows_by_key[key]
+        group_badges[key[0]].value = str(len(rows_col.controls))
+        return True
+
+    def set_editing_key(key: tuple[str, str] | None):
+        previous = editing_key[0]
+        editing_key[0] = key
+        for k in (previous, key):
+            if k is not None and not swap_token_row(k):
+                rebuild_token_rows()
+                return
 
     def build_token_rows():
         token_groups_col.controls.clear()
+        token_rows_by_key.clear()
+        group_badges.clear()
         if not tokens:
             token_groups_col.controls.append(
                 ft.Container(
@@ -324,228 +630,44 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
                     content=ft.Row(
                         [
                             ft.Icon(ft.Icons.INFO_OUTLINED, size=18, color=theme["text_secondary"]),
-                            ft.Text(empty_text, color=theme["text_secondary"]),
+                            ft.Text(L["empty_text"], color=theme["text_secondary"]),
                         ],
                         vertical_alignment=ft.CrossAxisAlignment.CENTER,
                     ),
                 )
             )
-            page.update()
+            update()
             return
 
-        filtered_sorted = sorted(tokens, key=lambda t: (group_sort_key(t.typ), t.value.lower()))
-
-        groups: dict[str, list[ManualToken]] = {}
-        for tok in filtered_sorted:
-            groups.setdefault(tok.typ, []).append(tok)
-
-        def group_header(typ: str, count: int) -> ft.Control:
-            badge = ft.Container(
-                padding=ft.padding.symmetric(2, 8),
-                bgcolor=theme["surface_muted"],
-                border_radius=20,
-                content=ft.Text(str(count), size=12, color=theme["text_secondary"]),
-            )
-            title_text = type_label(lang, typ)
-            title = ft.Text(title_text, weight=ft.FontWeight.W_600, color=theme["text_primary"])
-            return ft.Row(
-                [title, badge],
-                spacing=8,
-                vertical_alignment=ft.CrossAxisAlignment.CENTER,
-            )
-
-        for i, typ in enumerate(sorted(groups.keys(), key=group_sort_key)):
-            items = groups[typ]
-            rows: list[ft.Control] = []
+        groups = grouped_tokens()
+        for i, (typ, items) in enumerate(groups):
+            rows_col = ft.Column(spacing=8)
             for tok in items:
-                key = (tok.typ, tok.value)
-                if editing_key[0] == key:
-                    edit_value_field = ft.TextField(
-                        value=tok.value,
-                        bgcolor=theme["surface"],
-                        border_radius=8,
-                        filled=True,
-                        dense=True,
-                        expand=True,
-                    )
-
-                    edit_type_dropdown = ft.Dropdown(
-                        options=[
-                            ft.dropdown.Option(v, text=type_label(lang, v))
-                            for v in type_options_state[0]
-                        ],
-                        value=tok.typ,
-                        dense=True,
-                        text_size=12,
-                        width=220,
-                        menu_height=260,
-                    )
-
-                    edit_type_state = [tok.typ]
-
-                    def on_edit_type_change(e: ft.ControlEvent, state=edit_type_state):
-                        state[0] = e.control.value or tok.typ
-
-                    edit_type_dropdown.on_change = on_edit_type_change
-
-                    def on_save_edit(
-                        _,
-                        _tok: ManualToken = tok,
-                        value_field: ft.TextField = edit_value_field,
-                        type_state: list[str] = edit_type_state,
-                    ):
-                        new_value = (value_field.value or "").strip()
-                        if not new_value:
-                            msg = "Bitte einen Wert eingeben." if lang == "de" else "Please enter a value."
-                            show_snackbar(msg, "danger")
-                            return
-                        new_typ = (type_state[0] or _tok.typ).upper().strip()
-                        try:
-                            remove_manual_token(_tok.typ, _tok.value)
-                            add_manual_token(new_typ, new_value)
-                        except Exception as e:
-                            show_snackbar(str(e), "danger")
-                            reload_tokens()
-                            editing_key[0] = None
-                            page.update()
-                            return
-                        _remove_from_current_mapping(_tok)
-                        editing_key[0] = None
-                        reload_tokens()
-                        page.update()
-
-                    def on_cancel_edit(_):
-                        editing_key[0] = None
-                        build_token_rows()
-                        page.update()
-
-                    row = ft.Container(
-                        bgcolor=theme["surface"],
-                        border_radius=10,
-                        padding=ft.padding.symmetric(10, 12),
-                        content=ft.Column(
-                            [
-                                ft.Row(
-                                    [
-                                        edit_type_dropdown,
-                                    ],
-                                    spacing=8,
-                                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                                ),
-                                ft.Container(height=6),
-                                ft.Row(
-                                    [
-                                        edit_value_field,
-                                    ],
-                                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                                ),
-                                ft.Container(height=6),
-                                ft.Row(
-                                    [
-                                        ft.TextButton(cancel_button, on_click=on_cancel_edit),
-                                        ft.FilledButton(save_button, on_click=on_save_edit),
-                                    ],
-                                    spacing=8,
-                                    alignment=ft.MainAxisAlignment.END,
-                                ),
-                            ],
-                            spacing=4,
-                        ),
-                    )
-                    rows.append(row)
-                else:
-                    def start_edit(e, tok_inner: ManualToken = tok):
-                        editing_key[0] = (tok_inner.typ, tok_inner.value)
-                        build_token_rows()
-                        page.update()
-
-                    def on_delete_click(e, tok_inner: ManualToken = tok):
-                        delete_token_immediately(tok_inner)
-
-                    value_text = ft.Text(
-                        tok.value,
-                        color=theme["text_primary"],
-                        size=13,
-                        no_wrap=False,
-                        expand=True,
-                    )
-                    type_chip = ft.Container(
-                        padding=ft.padding.symmetric(2, 8),
-                        border_radius=20,
-                        bgcolor=theme["surface_muted"],
-                        content=ft.Text(
-                            type_label(lang, tok.typ),
-                            size=11,
-                            color=theme["text_secondary"],
-                        ),
-                    )
-                    action_row = ft.Row(
-                        [
-                            ft.IconButton(
-                                icon=ft.Icons.EDIT,
-                                tooltip=edit_button_tooltip,
-                                icon_size=18,
-                                on_click=start_edit,
-                            ),
-                            ft.IconButton(
-                                icon=ft.Icons.DELETE_OUTLINE,
-                                tooltip=delete_button,
-                                icon_size=18,
-                                on_click=on_delete_click,
-                            ),
-                        ],
-                        spacing=4,
-                        alignment=ft.MainAxisAlignment.END,
-                    )
-                    row = ft.Container(
-                        bgcolor=theme["surface"],
-                        border_radius=10,
-                        padding=ft.padding.symmetric(10, 12),
-                        content=ft.Row(
-                            [
-                                ft.Column(
-                                    [
-                                        ft.Row(
-                                            [
-                                                type_chip,
-                                            ],
-                                            spacing=8,
-                                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                                        ),
-                                        ft.Container(height=4),
-                                        value_text,
-                                    ],
-                                    spacing=2,
-                                    expand=True,
-                                ),
-                                action_row,
-                            ],
-                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                        ),
-                    )
-                    rows.append(row)
+                row = build_token_row(tok)
+                rows_col.controls.append(row)
+                token_rows_by_key[(tok.typ, tok.value)] = (row, rows_col)
 
             grp = ft.Column(
                 [
                     group_header(typ, len(items)),
                     ft.Container(height=6),
-                    ft.Column(rows, spacing=8),
+                    rows_col,
                 ],
                 spacing=4,
             )
             token_groups_col.controls.append(grp)
-            if i < len(groups.keys()) - 1:
+            if i < len(groups) - 1:
                 token_groups_col.controls.append(ft.Container(height=10))
 
-        page.update()
+        update()
 
     def build_categories_rows():
         categories_col.controls.clear()
-        custom_types = [t for t in get_custom_types() if t not in BASE_TYPES]
+        custom_types = [t for t in get_custom_types() if t not in BASE_TYPES_SET]
         if not custom_types:
             return
         header = ft.Text(
-            categories_title,
+            L["categories_title"],
             size=14,
             weight=ft.FontWeight.W_600,
             color=theme["text_secondary"],
@@ -567,8 +689,9 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
                         ft.IconButton(
                             icon=ft.Icons.DELETE_OUTLINE,
                             icon_size=16,
-                            tooltip=delete_button,
-                            on_click=lambda e, t_name=typ: delete_category_immediately(t_name),
+                            tooltip=L["delete_button"],
+                            data=typ,
+                            on_click=on_delete_category_click,
                         ),
                     ],
                     spacing=4,
@@ -576,10 +699,154 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
                 ),
             )
             categories_col.controls.append(chip)
-        page.update()
+        update()
+
+    session_cards: dict[str, tuple[ft.Container, ft.Column, ft.IconButton, dict]] = {}
+
+    def mapping_row(k: str, v: str) -> ft.Control:
+        return ft.Row(
+            [
+                ft.Text(
+                    k,
+                    size=11,
+                    color=theme["text_primary"],
+                    width=220,
+                    no_wrap=False,
+                ),
+                ft.Text(
+                    v,
+                    size=11,
+                    color=theme["text_primary"],
+                    expand=True,
+                    no_wrap=False,
+                ),
+            ],
+            vertical_alignment=ft.CrossAxisAlignment.START,
+        )
+
+    def show_more_button(sess_id: str, remaining: int) -> ft.Control:
+        return ft.TextButton(
+            L["session_show_more"].format(n=min(remaining, SESSION_MAPPING_WINDOW)),
+            data=sess_id,
+            on_click=on_show_more_click,
+        )
+
+    def build_mapping_table(sess_id: str, mapping: dict) -> list[ft.Control]:
+        keys, shown = expanded_sessions[sess_id]
+        token_rows: list[ft.Control] = []
+        header_row = ft.Row(
+            [
+                ft.Text(
+                    L["session_tokens_heading"],
+                    size=12,
+                    weight=ft.FontWeight.W_600,
+                    color=theme["text_secondary"],
+                ),
+            ],
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+        )
+        token_rows.append(header_row)
+        token_rows.append(ft.Container(height=4))
+
+        header_cols = ft.Row(
+            [
+                ft.Text(
+                    L["session_token_id_header"],
+                    size=11,
+                    weight=ft.FontWeight.W_500,
+                    color=theme["text_secondary"],
+                    width=220,
+                ),
+                ft.Text(
+                    L["session_token_value_header"],
+                    size=11,
+                    weight=ft.FontWeight.W_500,
+                    color=theme["text_secondary"],
+                    expand=True,
+                ),
+            ],
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+        )
+        token_rows.append(header_cols)
+        token_rows.append(ft.Container(height=2))
+
+        for k in keys[:shown]:
+            token_rows.append(mapping_row(k, mapping[k]))
+        if len(keys) > shown:
+            token_rows.append(show_more_button(sess_id, len(keys) - shown))
+
+        table_col = ft.Column(token_rows, spacing=4)
+        mapping_tables[sess_id] = table_col
+        return [
+            ft.Container(height=8),
+            ft.Container(
+                bgcolor=theme["surface_muted"],
+                border_radius=8,
+                padding=ft.padding.symmetric(8, 10),
+                content=table_col,
+            ),
+        ]
+
+    def show_more(sess_id: str):
+        entry = session_cards.get(sess_id)
+        table_col = mapping_tables.get(sess_id)
+        state = expanded_sessions.get(sess_id)
+        if entry is None or table_col is None or state is None:
+            return
+        card, _, _, mapping = entry
+        keys, start = state
+        state[1] = start + SESSION_MAPPING_WINDOW
+        table_col.controls.pop()
+        table_col.controls.extend(mapping_row(k, mapping[k]) for k in keys[start:state[1]])
+        if len(keys) > state[1]:
+            table_col.controls.append(show_more_button(sess_id, len(keys) - state[1]))
+        card.update()
+
+    def toggle_expand(sess_id: str):
+        entry = session_cards.get(sess_id)
+        if entry is None:
+            with batched():
+                build_sessions_rows()
+            return
+        card, body, expand_icon, mapping = entry
+        if sess_id in expanded_sessions:
+            del expanded_sessions[sess_id]
+            mapping_tables.pop(sess_id, None)
+            del body.controls[3:]
+            expand_icon.icon = ft.Icons.KEYBOARD_ARROW_DOWN
+        else:
+            expanded_sessions[sess_id] = [sorted(mapping), SESSION_MAPPING_WINDOW]
+            if mapping:
+                body.controls.extend(build_mapping_table(sess_id, mapping))
+            expand_icon.icon = ft.Icons.KEYBOARD_ARROW_UP
+        card.update()
+
+    def handle_delete_session(sess_id: str):
+        session_mgr = getattr(store, "session_mgr", None)
+        with batched():
+            try:
+                if hasattr(session_mgr, "delete_session"):
+                    session_mgr.delete_session(sess_id)
+                elif hasattr(session_mgr, "remove_session"):
+                    session_mgr.remove_session(sess_id)
+                else:
+                    raise RuntimeError("SessionManager hat keine delete/remove_session-Methode.")
+            except Exception as e:
+                show_snackbar(str(e), "danger")
+                return
+            expanded_sessions.pop(sess_id, None)
+            mapping_tables.pop(sess_id, None)
+            show_snackbar(L["session_delete_msg"], "surface_muted")
+            entry = session_cards.pop(sess_id, None)
+            if entry is None or not session_cards:
+                build_sessions_rows()
+            else:
+                sessions_col.controls.remove(entry[0])
 
     def build_sessions_rows():
         sessions_col.controls.clear()
+        session_cards.clear()
+        mapping_tables.clear()
         session_mgr = getattr(store, "session_mgr", None)
         if session_mgr is None:
             return
@@ -592,7 +859,7 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
         )
 
         header = ft.Text(
-            sessions_title,
+            L["sessions_title"],
             size=14,
             weight=ft.FontWeight.W_600,
             color=theme["text_secondary"],
@@ -608,31 +875,16 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
                 content=ft.Row(
                     [
                         ft.Icon(ft.Icons.INFO_OUTLINED, size=18, color=theme["text_secondary"]),
-                        ft.Text(sessions_empty_text, color=theme["text_secondary"]),
+                        ft.Text(L["sessions_empty_text"], color=theme["text_secondary"]),
                     ],
                     vertical_alignment=ft.CrossAxisAlignment.CENTER,
                 ),
             )
             sessions_col.controls.append(info)
-            page.update()
+            update()
             return
 
-        def handle_delete_session(sess_id: str):
-            try:
-                if hasattr(session_mgr, "delete_session"):
-                    session_mgr.delete_session(sess_id)
-                elif hasattr(session_mgr, "remove_session"):
-                    session_mgr.remove_session(sess_id)
-                else:
-                    raise RuntimeError("SessionManager hat keine delete/remove_session-Methode.")
-            except Exception as e:
-                show_snackbar(str(e), "danger")
-                return
-            if sess_id in expanded_session_ids[0]:
-                expanded_session_ids[0].remove(sess_id)
-            show_snackbar(session_delete_msg, "surface_muted")
-            build_sessions_rows()
-
+        now = time.time()
         for sess in sessions_sorted:
             sid = sess.get("session_id", "") or ""
             created_at = sess.get("created_at")
@@ -642,11 +894,11 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
             created_str = _format_dt(created_at, lang)
             closed_str = _format_dt(closed_at, lang) if closed_at else "-"
             if closed_at is None:
-                status_label = session_active_label
+                status_label = L["session_active_label"]
                 ttl_str = ""
             else:
-                status_label = session_closed_label
-                ttl_str = _format_ttl_remaining(closed_at, lang)
+                status_label = L["session_closed_label"]
+                ttl_str = _format_ttl_remaining(closed_at, lang, now)
             id_text = sid if len(sid) <= 16 else f"{sid[:16]}…"
             status_chip = ft.Container(
                 padding=ft.padding.symmetric(2, 8),
@@ -663,7 +915,7 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
                 border_radius=20,
                 bgcolor=theme["surface_muted"],
                 content=ft.Text(
-                    f"{session_tokens_label}: {count}",
+                    f"{L['session_tokens_label']}: {count}",
                     size=11,
                     color=theme["text_secondary"],
                 ),
@@ -673,27 +925,23 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
                 size=11,
                 color=theme["text_secondary"],
             ) if ttl_str else ft.Text("", size=11, color=theme["text_secondary"])
-            is_expanded = sid in expanded_session_ids[0]
-
-            def toggle_expand(e, sess_id=sid):
-                if sess_id in expanded_session_ids[0]:
-                    expanded_session_ids[0].remove(sess_id)
-                else:
-                    expanded_session_ids[0].add(sess_id)
-                build_sessions_rows()
+            expanded_state = expanded_sessions.get(sid)
+            is_expanded = expanded_state is not None
 
             expand_icon = ft.IconButton(
                 icon=ft.Icons.KEYBOARD_ARROW_DOWN if not is_expanded else ft.Icons.KEYBOARD_ARROW_UP,
                 icon_size=18,
-                on_click=toggle_expand,
-                tooltip="Aufklappen" if lang == "de" else "Expand",
+                data=sid,
+                on_click=on_toggle_session_click,
+                tooltip=L["session_expand_tooltip"],
             )
 
             delete_icon = ft.IconButton(
                 icon=ft.Icons.DELETE_OUTLINE,
                 icon_size=18,
-                tooltip=session_delete_tooltip,
-                on_click=lambda e, sess_id=sid: handle_delete_session(sess_id),
+                tooltip=L["session_delete_tooltip"],
+                data=sid,
+                on_click=on_delete_session_click,
             )
 
             row_top = ft.Row(
@@ -716,13 +964,13 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
             row_bottom = ft.Row(
                 [
                     ft.Text(
-                        f"{session_created_label}: {created_str}",
+                        f"{L['session_created_label']}: {created_str}",
                         size=11,
                         color=theme["text_secondary"],
                     ),
                     ft.Container(width=18),
                     ft.Text(
-                        f"{session_closed_at_label}: {closed_str}",
+                        f"{L['session_closed_at_label']}: {closed_str}",
                         size=11,
                         color=theme["text_secondary"],
                     ),
@@ -736,98 +984,32 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
             children: list[ft.Control] = [row_top, ft.Container(height=4), row_bottom]
 
             if is_expanded and mapping:
-                token_rows: list[ft.Control] = []
-                header_row = ft.Row(
-                    [
-                        ft.Text(
-                            session_tokens_heading,
-                            size=12,
-                            weight=ft.FontWeight.W_600,
-                            color=theme["text_secondary"],
-                        ),
-                    ],
-                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                )
-                token_rows.append(header_row)
-                token_rows.append(ft.Container(height=4))
-
-                header_cols = ft.Row(
-                    [
-                        ft.Text(
-                            session_token_id_header,
-                            size=11,
-                            weight=ft.FontWeight.W_500,
-                            color=theme["text_secondary"],
-                            width=220,
-                        ),
-                        ft.Text(
-                            session_token_value_header,
-                            size=11,
-                            weight=ft.FontWeight.W_500,
-                            color=theme["text_secondary"],
-                            expand=True,
-                        ),
-                    ],
-                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                )
-                token_rows.append(header_cols)
-                token_rows.append(ft.Container(height=2))
-
-                for k in sorted(mapping.keys()):
-                    v = mapping[k]
-                    token_rows.append(
-                        ft.Row(
-                            [
-                                ft.Text(
-                                    k,
-                                    size=11,
-                                    color=theme["text_primary"],
-                                    width=220,
-                                    no_wrap=False,
-                                ),
-                                ft.Text(
-                                    v,
-                                    size=11,
-                                    color=theme["text_primary"],
-                                    expand=True,
-                                    no_wrap=False,
-                                ),
-                            ],
-                            vertical_alignment=ft.CrossAxisAlignment.START,
-                        )
-                    )
-
-                children.append(ft.Container(height=8))
-                children.append(
-                    ft.Container(
-                        bgcolor=theme["surface_muted"],
-                        border_radius=8,
-                        padding=ft.padding.symmetric(8, 10),
-                        content=ft.Column(token_rows, spacing=4),
-                    )
-                )
+                expanded_state[0] = sorted(mapping)
+                children.extend(build_mapping_table(sid, mapping))
 
+            body = ft.Column(
+                children,
+                spacing=4,
+            )
             card = ft.Container(
                 bgcolor=theme["surface"],
                 border_radius=10,
                 padding=ft.padding.symmetric(10, 12),
-                content=ft.Column(
-                    children,
-                    spacing=4,
-                ),
+                content=body,
             )
             sessions_col.controls.append(card)
+            session_cards[sid] = (card, body, expand_icon, mapping)
 
-        page.update()
+        update()
 
     add_button = ft.FilledButton(
-        add_label,
+        L["add_label"],
         icon=ft.Icons.ADD,
         on_click=handle_add_entry,
     )
 
     add_type_button = ft.OutlinedButton(
-        add_type_label,
+        L["add_type_label"],
         icon=ft.Icons.ADD,
         on_click=handle_add_category,
     )
@@ -835,7 +1017,7 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
     add_row = ft.Column(
         [
             ft.Text(
-                add_label,
+                L["add_label"],
                 weight=ft.FontWeight.W_600,
                 size=14,
                 color=theme["text_secondary"],
@@ -880,19 +1062,13 @@ def view(page: ft.Page, theme: dict, store) -> ft.Control:
 
     content = ft.Column(
         [
-            header_row,
-            ft.Container(height=4),
-            subtitle,
-            ft.Container(height=20),
+            ft.Column([header_row, subtitle], spacing=20),
             add_row,
-            ft.Container(height=20),
             categories_col,
-            ft.Container(height=20),
             sessions_col,
-            ft.Container(height=20),
             token_groups_col,
         ],
-        spacing=8,
+        spacing=36,
         expand=True,
         horizontal_alignment=ft.CrossAxisAlignment.START,
         scroll=ft.ScrollMode.AUTO,
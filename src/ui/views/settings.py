@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from itertools import zip_longest
+
 import flet as ft
 
 from core import config
@@ -14,6 +16,106 @@ from detectors.ner.ner_core import (
 from ui.style.translations import t
 
 
+BACKEND_LABELS = {
+    "spacy": "spaCy",
+    "flair": "Flair",
+}
+
+
+NER_UI_TYPES = ("PER", "ORG", "LOC", "STRASSE")
+NER_MINIMAL = frozenset({"PER", "STRASSE"})
+
+
+LABELS_DE = {
+    "PER": "Person (PER)",
+    "ORG": "Organisation (ORG)",
+    "LOC": "Ort / Ortseinheit (LOC)",
+    "STRASSE": "Straße / Hausnummer (STRASSE)",
+}
+
+
+LABELS_EN = {
+    "PER": "Person (PER)",
+    "ORG": "Organization (ORG)",
+    "LOC": "Location / place entity (LOC)",
+    "STRASSE": "Street / house number (STRASSE)",
+}
+
+
+REGEX_TYPES = ("E_MAIL", "TELEFON", "IBAN", "URL", "PLZ", "STRASSE", "DATUM", "IP_ADRESSE")
+RX_MINIMAL = frozenset({"E_MAIL", "TELEFON", "IBAN", "IP_ADRESSE", "STRASSE"})
+
+
+R_LABELS_DE = {
+    "E_MAIL": "E-Mail",
+    "TELEFON": "Telefon",
+    "IBAN": "IBAN",
+    "URL": "URL",
+    "PLZ": "Postleitzahl (PLZ)",
+    "STRASSE": "Straße / Hausnummer (STRASSE)",
+    "DATUM": "Datum",
+    "IP_ADRESSE": "IP-Adresse",
+}
+
+
+R_LABELS_EN = {
+    "E_MAIL": "Email",
+    "TELEFON": "Phone",
+    "IBAN": "IBAN",
+    "URL": "URL",
+    "PLZ": "Postal code (PLZ)",
+    "STRASSE": "Street / house number (STRASSE)",
+    "DATUM": "Date",
+    "IP_ADRESSE": "IP address",
+}
+
+
+NER_LABELS = {
+    "de": tuple(LABELS_DE[code] for code in NER_UI_TYPES),
+    "en": tuple(LABELS_EN[code] for code in NER_UI_TYPES),
+}
+
+RX_LABELS = {
+    "de": tuple(R_LABELS_DE[code] for code in REGEX_TYPES),
+    "en": tuple(R_LABELS_EN[code] for code in REGEX_TYPES),
+}
+
+
+NER_BITS = {code: 1 << i for i, code in enumerate(NER_UI_TYPES)}
+NER_ALL_MASK = (1 << len(NER_UI_TYPES)) - 1
+NER_MINIMAL_MASK = sum(NER_BITS[code] for code in NER_MINIMAL)
+
+RX_BITS = {code: 1 << i for i, code in enumerate(REGEX_TYPES)}
+RX_ALL_MASK = (1 << len(REGEX_TYPES)) - 1
+RX_MINIMAL_MASK = sum(RX_BITS[code] for code in RX_MINIMAL)
+
+
+def _two_col_order(n: int) -> tuple[int, ...]:
+    half = (n + 1) // 2
+    return tuple(
+        i
+        for pair in zip_longest(range(half), range(half, n))
+        for i in pair
+        if i is not None
+    )
+
+
+NER_GRID_ORDER = _two_col_order(len(NER_UI_TYPES))
+RX_GRID_ORDER = _two_col_order(len(REGEX_TYPES))
+
+
+def _mask_of(codes, bits: dict[str, int]) -> int:
+    mask = 0
+    for code in codes:
+        if isinstance(code, str):
+            mask |= bits.get(code.upper(), 0)
+    return mask
+
+
+def _codes_of(mask: int, types: tuple[str, ...], bits: dict[str, int]) -> list[str]:
+    return [code for code in types if mask & bits[code]]
+
+
 def view(
     page: ft.Page,
     theme_name: str,
@@ -22,7 +124,9 @@ def view(
     on_lang_changed=None,
     store=None,
 ) -> ft.Control:
-    lang = config.get("lang", "de")
+    cfg = config.load()
+
+    lang = cfg.get("lang", "de")
     if lang not in ("de", "en"):
         lang = "de"
 
@@ -36,7 +140,7 @@ def view(
     if MODEL_MANAGER.flair_available():
         backend_options_available.append("flair")
 
-    cfg_backend = str(config.get("ner_backend", "spacy") or "spacy").strip().lower()
+    cfg_backend = str(cfg.get("ner_backend", "spacy") or "spacy").strip().lower()
     runtime_backend = str(get_current_backend() or "").strip().lower()
     current_backend = runtime_backend or cfg_backend
 
@@ -45,7 +149,7 @@ def view(
 
     config.set("ner_backend", current_backend)
 
-    current_model_name = str(get_current_model() or config.get("ner_model", "") or "").strip()
+    current_model_name = str(get_current_model() or cfg.get("ner_model", "") or "").strip()
 
     if current_backend == "spacy":
         if current_model_name not in installed_spacy_keys:
@@ -64,101 +168,34 @@ def view(
                 current_model_name = ""
                 config.set("ner_model", "")
 
-    def backend_options(for_lang: str) -> list[ft.dropdown.Option]:
-        labels = {
-            "de": {
-                "spacy": "spaCy",
-                "flair": "Flair",
-            },
-            "en": {
-                "spacy": "spaCy",
-                "flair": "Flair",
-            },
-        }
-
-        out: list[ft.dropdown.Option] = []
-        for key in backend_options_available:
-            out.append(ft.dropdown.Option(key=key, text=labels[for_lang][key]))
-        return out
+    def backend_options() -> list[ft.dropdown.Option]:
+        return [
+            ft.dropdown.Option(key=key, text=BACKEND_LABELS.get(key, key))
+            for key in backend_options_available
+        ]
 
     def ner_options(backend: str) -> list[ft.dropdown.Option]:
-        opts: list[ft.dropdown.Option] = []
-
-        if backend == "flair":
-            for key in installed_flair_keys:
-                opts.append(ft.dropdown.Option(key=key, text=key))
-            return opts
-
-        for key in installed_spacy_keys:
-            opts.append(ft.dropdown.Option(key=key, text=key))
-
-        return opts
+        keys = installed_flair_keys if backend == "flair" else installed_spacy_keys
+        return [ft.dropdown.Option(key=key, text=key) for key in keys]
 
     backend_ref = ft.Ref[ft.Dropdown]()
     model_ref = ft.Ref[ft.Dropdown]()
     lang_ref = ft.Ref[ft.Dropdown]()
 
-    NER_UI_TYPES = ["PER", "ORG", "LOC", "STRASSE"]
-    NER_MINIMAL = {"PER", "STRASSE"}
-
-    LABELS_DE = {
-        "PER": "Person (PER)",
-        "ORG": "Organisation (ORG)",
-        "LOC": "Ort / Ortseinheit (LOC)",
-        "STRASSE": "Straße / Hausnummer (STRASSE)",
-    }
-
-    LABELS_EN = {
-        "PER": "Person (PER)",
-        "ORG": "Organization (ORG)",
-        "LOC": "Location / place entity (LOC)",
-        "STRASSE": "Street / house number (STRASSE)",
-    }
-
-    REGEX_TYPES = ["E_MAIL", "TELEFON", "IBAN", "URL", "PLZ", "STRASSE", "DATUM", "IP_ADRESSE"]
-    RX_MINIMAL = {"E_MAIL", "TELEFON", "IBAN", "IP_ADRESSE", "STRASSE"}
-
-    R_LABELS_DE = {
-        "E_MAIL": "E-Mail",
-        "TELEFON": "Telefon",
-        "IBAN": "IBAN",
-        "URL": "URL",
-        "PLZ": "Postleitzahl (PLZ)",
-        "STRASSE": "Straße / Hausnummer (STRASSE)",
-        "DATUM": "Datum",
-        "IP_ADRESSE": "IP-Adresse",
-    }
-
-    R_LABELS_EN = {
-        "E_MAIL": "Email",
-        "TELEFON": "Phone",
-        "IBAN": "IBAN",
-        "URL": "URL",
-        "PLZ": "Postal code (PLZ)",
-        "STRASSE": "Street / house number (STRASSE)",
-        "DATUM": "Date",
-        "IP_ADRESSE": "IP address",
-    }
-
-    def label_for(code: str, lng: str) -> str:
-        return (LABELS_DE if lng == "de" else LABELS_EN).get(code, code)
-
-    def rlabel_for(code: str, lng: str) -> str:
-        return (R_LABELS_DE if lng == "de" else R_LABELS_EN).get(code, code)
-
-    selected_ner: set[str] = set(config.get("ner_labels", list(NER_UI_TYPES)))
-    selected_rx: set[str] = set(config.get("regex_labels", REGEX_TYPES))
-
-    selected_ner = {x.upper() for x in selected_ner if isinstance(x, str)}
-    selected_rx = {x.upper() for x in selected_rx if isinstance(x, str)}
-
-    selected_ner.intersection_update(set(NER_UI_TYPES))
-    selected_rx.intersection_update(set(REGEX_TYPES))
-
-    postcode_ml_enabled = bool(config.get("use_postcode_ml_validator", True))
-    postcode_manual_threshold_enabled = bool(config.get("postcode_manual_threshold_enabled", False))
-
-    raw_postcode_manual_threshold = config.get("postcode_manual_threshold", 0.43)
+    all_label = t(lang, "settings.all")
+    none_label = t(lang, "settings.none")
+    minimal_label = t(lang, "settings.minimal")
+    loaded_label = t(lang, "loaded")
+    saved_msg = t(lang, "settings.saved")
+
+    ner_mask = [_mask_of(cfg.get("ner_labels", NER_UI_TYPES) or (), NER_BITS)]
+    rx_mask = [_mask_of(cfg.get("regex_labels", REGEX_TYPES) or (), RX_BITS)]
+    persisted_masks: list[tuple[int, int] | None] = [None]
+
+    postcode_ml_enabled = bool(cfg.get("use_postcode_ml_validator", True))
+    postcode_manual_threshold_enabled = bool(cfg.get("postcode_manual_threshold_enabled", False))
+
+    raw_postcode_manual_threshold = cfg.get("postcode_manual_threshold", 0.43)
     try:
         postcode_manual_threshold_value = float(raw_postcode_manual_threshold)
     except Exception:
@@ -169,38 +206,45 @@ def view(
     if postcode_manual_threshold_value > 1.0:
         postcode_manual_threshold_value = 1.0
 
+    text_secondary = theme["text_secondary"]
     divider_color = theme.get("divider", theme.get("surface_muted"))
 
     saved_label = ft.Text(
-        f"{t(lang, 'loaded')}: {get_current_model() or '-'}",
+        f"{loaded_label}: {get_current_model() or '-'}",
         size=12,
-        color=theme["text_secondary"],
+        color=text_secondary,
     )
 
     backend_info_label = ft.Text(
         f"Backend: {current_backend}",
         size=12,
-        color=theme["text_secondary"],
+        color=text_secondary,
     )
 
     def _prune_mapping():
-        allowed = {x.upper() for x in (list(selected_rx) + list(selected_ner)) if isinstance(x, str) and x.strip()}
+        allowed = {
+            *_codes_of(rx_mask[0], REGEX_TYPES, RX_BITS),
+            *_codes_of(ner_mask[0], NER_UI_TYPES, NER_BITS),
+        }
         if store is not None and hasattr(store, "session_mgr") and store.session_mgr is not None:
             prune_func = getattr(store.session_mgr, "prune_active_mapping_by_allowed_labels", None)
             if callable(prune_func):
                 prune_func(allowed)
 
     def _persist_flags_and_labels():
-        use_regex = bool(selected_rx)
-        use_ner = bool(selected_ner)
-        current_flags = config.get_flags()
-        config.set_flags(
-            use_regex=use_regex,
-            use_ner=use_ner,
-            debug_mask=current_flags.get("debug_mask", False),
+        masks = (ner_mask[0], rx_mask[0])
+        if masks == persisted_masks[0]:
+            return
+        persisted_masks[0] = masks
+
+        config.save(
+            {
+                "use_regex": bool(rx_mask[0]),
+                "use_ner": bool(ner_mask[0]),
+                "ner_labels": _codes_of(ner_mask[0], NER_UI_TYPES, NER_BITS),
+                "regex_labels": _codes_of(rx_mask[0], REGEX_TYPES, RX_BITS),
+            }
         )
-        config.set("ner_labels", sorted(set(selected_ner).intersection(set(NER_UI_TYPES))))
-        config.set("regex_labels", sorted(set(selected_rx).intersection(set(REGEX_TYPES))))
         _prune_mapping()
 
     def _persist_postcode_ml_settings(
@@ -214,15 +258,29 @@ def view(
         if manual_threshold_value > 1.0:
             manual_threshold_value = 1.0
 
-        config.set("use_postcode_ml_validator", bool(enabled))
-        config.set("postcode_manual_threshold_enabled", bool(manual_threshold_enabled))
-        config.set("postcode_manual_threshold", float(manual_threshold_value))
+        config.save(
+            {
+                "use_postcode_ml_validator": bool(enabled),
+                "postcode_manual_threshold_enabled": bool(manual_threshold_enabled),
+                "postcode_manual_threshold": float(manual_threshold_value),
+            }
+        )
 
-    def _notify_saved(msg: str):
-        page.snack_bar = ft.SnackBar(ft.Text(msg), bgcolor=theme["success"])
-        page.snack_bar.open = True
+    snack_text = ft.Text()
+    snack_bar = ft.SnackBar(snack_text)
+    success_color = theme["success"]
+    danger_color = theme.get("danger", ft.Colors.RED)
+
+    def _show_snack(msg: str, color) -> None:
+        snack_text.value = msg
+        snack_bar.bgcolor = color
+        snack_bar.open = True
+        page.snack_bar = snack_bar
         page.update()
 
+    def _notify_saved(msg: str):
+        _show_snack(msg, success_color)
+
     def handle_lang_change(e: ft.ControlEvent):
         new_lang = e.control.value or "de"
         config.set("lang", new_lang)
@@ -246,7 +304,7 @@ def view(
         dd = ft.Dropdown(
             ref=backend_ref,
             label="NER Backend",
-            options=backend_options(cur_lang),
+            options=backend_options(),
             value=backend_value,
             width=220,
         )
@@ -257,16 +315,10 @@ def view(
             try:
                 effective_backend = set_ner_backend(new_backend)
             except Exception as ex:
-                page.snack_bar = ft.SnackBar(
-                    ft.Text(
-                        f"NER-Backend konnte nicht gesetzt werden: {ex}"
-                        if cur_lang == "de"
-                        else f"Failed to set NER backend: {ex}"
-                    ),
-                    bgcolor=theme.get("danger", ft.Colors.RED),
+                _show_snack(
+                    t(cur_lang, "settings.backend_error", error=ex),
+                    danger_color,
                 )
-                page.snack_bar.open = True
-                page.update()
                 return
 
             config.set("ner_backend", effective_backend)
@@ -290,10 +342,9 @@ def view(
             model_control = make_model_dropdown(cur_lang, effective_backend)
             model_host.content = ft.Column([model_control, backend_info_label, saved_label], spacing=6)
             backend_info_label.value = f"Backend: {effective_backend}"
-            saved_label.value = f"{t(cur_lang, 'loaded')}: {get_current_model() or '-'}"
+            saved_label.value = f"{loaded_label}: {get_current_model() or '-'}"
             _persist_flags_and_labels()
-            _notify_saved("Gespeichert" if cur_lang == "de" else "Saved")
-            page.update()
+            _notify_saved(saved_msg)
 
         dd.on_change = on_backend_change
         return dd
@@ -302,16 +353,11 @@ def view(
         options = ner_options(backend_value)
 
         if not options:
-            message = (
-                "Kein passendes NER-Modell installiert"
-                if cur_lang == "de"
-                else "No matching NER model installed"
-            )
             return ft.Container(
                 content=ft.Text(
-                    message,
+                    t(cur_lang, "settings.no_model"),
                     size=12,
-                    color=theme["text_secondary"],
+                    color=text_secondary,
                 ),
                 width=420,
             )
@@ -325,7 +371,7 @@ def view(
 
         dd = ft.Dropdown(
             ref=model_ref,
-            label="NER Modell" if cur_lang == "de" else "NER model",
+            label=t(cur_lang, "ner_model"),
             options=options,
             value=current_value,
             width=420,
@@ -342,24 +388,17 @@ def view(
                 else:
                     eff = set_spacy_model(chosen)
             except Exception as ex:
-                page.snack_bar = ft.SnackBar(
-                    ft.Text(
-                        f"NER-Modell konnte nicht geladen werden: {ex}"
-                        if cur_lang == "de"
-                        else f"Failed to load NER model: {ex}"
-                    ),
-                    bgcolor=theme.get("danger", ft.Colors.RED),
+                _show_snack(
+                    t(cur_lang, "settings.model_error", error=ex),
+                    danger_color,
                 )
-                page.snack_bar.open = True
-                page.update()
                 return
 
             config.set("ner_model", eff)
             backend_info_label.value = f"Backend: {backend_value}"
-            saved_label.value = f"{t(cur_lang, 'loaded')}: {eff}"
+            saved_label.value = f"{loaded_label}: {eff}"
             _persist_flags_and_labels()
-            _notify_saved("Gespeichert" if cur_lang == "de" else "Saved")
-            page.update()
+            _notify_saved(saved_msg)
 
         dd.on_change = on_model_change
         return dd
@@ -381,51 +420,47 @@ def view(
 
     ner_post_switch = ft.Switch(
         label=t(lang, "ner_postprocessing"),
-        value=bool(config.get("use_ner_postprocessing", False)),
+        value=bool(cfg.get("use_ner_postprocessing", False)),
     )
 
     def toggle_ner_postprocessing(e: ft.ControlEvent):
         config.set("use_ner_postprocessing", bool(e.control.value))
-        _notify_saved("Gespeichert" if lang == "de" else "Saved")
+        _notify_saved(saved_msg)
 
     ner_post_switch.on_change = toggle_ner_postprocessing
 
     copy_ai_prompt_switch = ft.Switch(
-        label=("KI Prompt Ergänzung bei Kopieren" if lang == "de" else "Add AI prompt when copying"),
-        value=bool(config.get("copy_ai_prompt_enabled", False)),
+        label=t(lang, "settings.copy_ai_prompt"),
+        value=bool(cfg.get("copy_ai_prompt_enabled", False)),
     )
 
     def toggle_copy_ai_prompt(e: ft.ControlEvent):
         config.set("copy_ai_prompt_enabled", bool(e.control.value))
-        _notify_saved("Gespeichert" if lang == "de" else "Saved")
+        _notify_saved(saved_msg)
 
     copy_ai_prompt_switch.on_change = toggle_copy_ai_prompt
 
     postcode_ml_switch = ft.Switch(
-        label=("PLZ-ML-Validierung aktivieren" if lang == "de" else "Enable postcode ML validation"),
+        label=t(lang, "settings.postcode_ml"),
         value=postcode_ml_enabled,
     )
 
     postcode_manual_threshold_switch = ft.Switch(
-        label=("Manuellen PLZ-Threshold verwenden" if lang == "de" else "Use manual postcode threshold"),
+        label=t(lang, "settings.postcode_manual_threshold"),
         value=postcode_manual_threshold_enabled,
     )
 
     postcode_threshold_field = ft.TextField(
-        label=("PLZ Threshold (0.0 - 1.0)" if lang == "de" else "Postcode threshold (0.0 - 1.0)"),
+        label=t(lang, "settings.postcode_threshold"),
         value=f"{postcode_manual_threshold_value:.2f}",
         width=220,
         disabled=not postcode_manual_threshold_enabled,
     )
 
     postcode_threshold_hint = ft.Text(
-        (
-            "Niedrigerer Threshold erhöht Trefferquote, aber auch False Positives."
-            if lang == "de"
-            else "Lower threshold increases recall, but also false positives."
-        ),
+        t(lang, "settings.postcode_threshold_hint"),
         size=12,
-        color=theme["text_secondary"],
+        color=text_secondary,
     )
 
     def _parse_postcode_threshold_from_ui() -> float:
@@ -450,8 +485,7 @@ def view(
             manual_threshold_enabled=bool(postcode_manual_threshold_switch.value),
             manual_threshold_value=value,
         )
-        _notify_saved("Gespeichert" if lang == "de" else "Saved")
-        page.update()
+        _notify_saved(saved_msg)
 
     def toggle_postcode_ml(e: ft.ControlEvent) -> None:
         _persist_postcode_ml_settings(
@@ -459,7 +493,7 @@ def view(
             manual_threshold_enabled=bool(postcode_manual_threshold_switch.value),
             manual_threshold_value=_parse_postcode_threshold_from_ui(),
         )
-        _notify_saved("Gespeichert" if lang == "de" else "Saved")
+        _notify_saved(saved_msg)
 
     def toggle_postcode_manual_threshold(e: ft.ControlEvent) -> None:
         enabled = bool(e.control.value)
@@ -469,8 +503,7 @@ def view(
             manual_threshold_enabled=enabled,
             manual_threshold_value=_parse_postcode_threshold_from_ui(),
         )
-        _notify_saved("Gespeichert" if lang == "de" else "Saved")
-        page.update()
+        _notify_saved(saved_msg)
 
     def submit_postcode_threshold(_: ft.ControlEvent) -> None:
         _save_postcode_ml_ui_settings()
@@ -480,141 +513,93 @@ def view(
     postcode_threshold_field.on_submit = submit_postcode_threshold
     postcode_threshold_field.on_blur = submit_postcode_threshold
 
-    ner_col_left = ft.Column(spacing=6)
-    ner_col_right = ft.Column(spacing=6)
-    ner_cb_by_code: dict[str, ft.Checkbox] = {}
-
-    rx_col_left = ft.Column(spacing=6)
-    rx_col_right = ft.Column(spacing=6)
-    rx_cb_by_code: dict[str, ft.Checkbox] = {}
+    ner_grid = ft.ResponsiveRow(spacing=24, run_spacing=6)
+    rx_grid = ft.ResponsiveRow(spacing=24, run_spacing=6)
 
     def build_two_col_checkboxes(
-        codes: list[str],
-        label_func,
-        selected: set[str],
-        col_left: ft.Column,
-        col_right: ft.Column,
-        store_dict: dict[str, ft.Checkbox],
-        lang_code: str,
+        codes: tuple[str, ...],
+        labels: tuple[str, ...],
+        bits: dict[str, int],
+        order: tuple[int, ...],
+        mask: list[int],
+        grid: ft.ResponsiveRow,
         on_any_change,
-        clamp_allowed: set[str] | None = None,
     ):
-        col_left.controls = []
-        col_right.controls = []
-        store_dict.clear()
-
-        half = (len(codes) + 1) // 2
-        left_codes = codes[:half]
-        right_codes = codes[half:]
-
-        def make_cb(code: str) -> ft.Checkbox:
-            def _changed(e: ft.ControlEvent):
-                if e.control.value:
-                    selected.add(code)
-                else:
-                    selected.discard(code)
-
-                if clamp_allowed is not None:
-                    selected.intersection_update(clamp_allowed)
+        def _changed(e: ft.ControlEvent):
+            bit = bits[e.control.data]
+            if e.control.value:
+                mask[0] |= bit
+            else:
+                mask[0] &= ~bit
 
-                on_any_change()
+            on_any_change()
 
-            return ft.Checkbox(
-                label=label_func(code, lang_code),
-                value=(code in selected),
+        grid.controls = [
+            ft.Checkbox(
+                label=labels[i],
+                value=bool(mask[0] & bits[codes[i]]),
+                data=codes[i],
                 on_change=_changed,
+                col=6,
             )
-
-        for code in left_codes:
-            cb = make_cb(code)
-            store_dict[code] = cb
-            col_left.controls.append(cb)
-
-        for code in right_codes:
-            cb = make_cb(code)
-            store_dict[code] = cb
-            col_right.controls.append(cb)
+            for i in order
+        ]
 
     def _on_any_settings_change():
-        selected_ner.intersection_update(set(NER_UI_TYPES))
-        selected_rx.intersection_update(set(REGEX_TYPES))
         _persist_flags_and_labels()
-        _notify_saved("Gespeichert" if lang == "de" else "Saved")
+        _notify_saved(saved_msg)
 
     build_two_col_checkboxes(
         NER_UI_TYPES,
-        label_for,
-        selected_ner,
-        ner_col_left,
-        ner_col_right,
-        ner_cb_by_code,
-        lang,
+        NER_LABELS[lang],
+        NER_BITS,
+        NER_GRID_ORDER,
+        ner_mask,
+        ner_grid,
         _on_any_settings_change,
-        clamp_allowed=set(NER_UI_TYPES),
     )
 
     build_two_col_checkboxes(
         REGEX_TYPES,
-        rlabel_for,
-        selected_rx,
-        rx_col_left,
-        rx_col_right,
-        rx_cb_by_code,
-        lang,
+        RX_LABELS[lang],
+        RX_BITS,
+        RX_GRID_ORDER,
+        rx_mask,
+        rx_grid,
         _on_any_settings_change,
-        clamp_allowed=set(REGEX_TYPES),
     )
 
-    def ner_select_all(_):
-        selected_ner.clear()
-        selected_ner.update(NER_UI_TYPES)
-        for code, cb in ner_cb_by_code.items():
-            cb.value = code in selected_ner
+    def _apply_selection(
+        mask: list[int],
+        bits: dict[str, int],
+        grid: ft.ResponsiveRow,
+        value: int,
+    ) -> None:
+        mask[0] = value
+        for cb in grid.controls:
+            cb.value = bool(value & bits[cb.data])
         _on_any_settings_change()
-        page.update()
+
+    def ner_select_all(_):
+        _apply_selection(ner_mask, NER_BITS, ner_grid, NER_ALL_MASK)
 
     def ner_select_minimal(_):
-        selected_ner.clear()
-        selected_ner.update(NER_MINIMAL)
-        selected_ner.intersection_update(set(NER_UI_TYPES))
-        for code, cb in ner_cb_by_code.items():
-            cb.value = code in selected_ner
-        _on_any_settings_change()
-        page.update()
+        _apply_selection(ner_mask, NER_BITS, ner_grid, NER_MINIMAL_MASK)
 
     def ner_select_none(_):
-        selected_ner.clear()
-        for cb in ner_cb_by_code.values():
-            cb.value = False
-        _on_any_settings_change()
-        page.update()
+        _apply_selection(ner_mask, NER_BITS, ner_grid, 0)
 
     def rx_select_all(_):
-        selected_rx.clear()
-        selected_rx.update(REGEX_TYPES)
-        for cb in rx_cb_by_code.values():
-            cb.value = True
-        _on_any_settings_change()
-        page.update()
+        _apply_selection(rx_mask, RX_BITS, rx_grid, RX_ALL_MASK)
 
     def rx_select_minimal(_):
-        selected_rx.clear()
-        selected_rx.update(RX_MINIMAL)
-        selected_rx.intersection_update(set(REGEX_TYPES))
-        for code, cb in rx_cb_by_code.items():
-            cb.value = code in selected_rx
-        _on_any_settings_change()
-        page.update()
+        _apply_selection(rx_mask, RX_BITS, rx_grid, RX_MINIMAL_MASK)
 
     def rx_select_none(_):
-        selected_rx.clear()
-        for cb in rx_cb_by_code.values():
-            cb.value = False
-        _on_any_settings_change()
-        page.update()
+        _apply_selection(rx_mask, RX_BITS, rx_grid, 0)
 
     def section_divider() -> ft.Control:
-        return ft.Divider(height=1, thickness=1, color=divider_color)
+        return ft.Divider(height=33, thickness=1, color=divider_color)
 
     sections = ft.ListView(spacing=0, padding=0, expand=True, auto_scroll=False)
 
@@ -622,31 +607,22 @@ def view(
         ft.Row(
             [
                 lang_host,
-                ft.Container(width=20),
                 backend_host,
-                ft.Container(width=20),
                 model_host,
             ],
+            spacing=40,
             alignment=ft.MainAxisAlignment.START,
             vertical_alignment=ft.CrossAxisAlignment.START,
         )
     )
 
-    sections.controls.append(ft.Container(height=16))
     sections.controls.append(section_divider())
-    sections.controls.append(ft.Container(height=16))
 
     sections.controls.append(
-        ft.Row(
-            [
-                ft.Text(
-                    "Allgemeine Einstellungen" if lang == "de" else "General settings",
-                    weight=ft.FontWeight.W_600,
-                    color=theme["text_secondary"],
-                ),
-                ft.Container(expand=True),
-            ],
-            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+        ft.Text(
+            t(lang, "settings.general"),
+            weight=ft.FontWeight.W_600,
+            color=text_secondary,
         )
     )
 
@@ -656,31 +632,22 @@ def view(
         ft.Row(
             [
                 theme_switch,
-                ft.Container(width=32),
                 ner_post_switch,
-                ft.Container(width=32),
                 copy_ai_prompt_switch,
             ],
+            spacing=52,
             alignment=ft.MainAxisAlignment.START,
             vertical_alignment=ft.CrossAxisAlignment.CENTER,
         )
     )
 
-    sections.controls.append(ft.Container(height=16))
     sections.controls.append(section_divider())
-    sections.controls.append(ft.Container(height=16))
 
     sections.controls.append(
-        ft.Row(
-            [
-                ft.Text(
-                    "PLZ-Validierung" if lang == "de" else "Postcode validation",
-                    weight=ft.FontWeight.W_600,
-                    color=theme["text_secondary"],
-                ),
-                ft.Container(expand=True),
-            ],
-            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+        ft.Text(
+            t(lang, "settings.postcode"),
+            weight=ft.FontWeight.W_600,
+            color=text_secondary,
         )
     )
 
@@ -690,11 +657,10 @@ def view(
         ft.Row(
             [
                 postcode_ml_switch,
-                ft.Container(width=32),
                 postcode_manual_threshold_switch,
-                ft.Container(width=32),
                 postcode_threshold_field,
             ],
+            spacing=52,
             alignment=ft.MainAxisAlignment.START,
             vertical_alignment=ft.CrossAxisAlignment.CENTER,
         )
@@ -703,55 +669,41 @@ def view(
     sections.controls.append(ft.Container(height=8))
     sections.controls.append(postcode_threshold_hint)
 
-    sections.controls.append(ft.Container(height=16))
     sections.controls.append(section_divider())
-    sections.controls.append(ft.Container(height=16))
 
     sections.controls.append(
         ft.Row(
             [
-                ft.Text("NER-basiert", weight=ft.FontWeight.W_600, color=theme["text_secondary"]),
+                ft.Text(t(lang, "settings.ner_section"), weight=ft.FontWeight.W_600, color=text_secondary),
                 ft.Container(expand=True),
-                ft.TextButton(t(lang, "settings.all"), on_click=ner_select_all),
-                ft.TextButton("Minimal" if lang == "de" else "Minimal", on_click=ner_select_minimal),
-                ft.TextButton(t(lang, "settings.none"), on_click=ner_select_none),
+                ft.TextButton(all_label, on_click=ner_select_all),
+                ft.TextButton(minimal_label, on_click=ner_select_minimal),
+                ft.TextButton(none_label, on_click=ner_select_none),
             ],
             vertical_alignment=ft.CrossAxisAlignment.CENTER,
         )
     )
 
     sections.controls.append(ft.Container(height=10))
-    sections.controls.append(
-        ft.Row(
-            [ft.Container(ner_col_left, expand=1), ft.Container(ner_col_right, expand=1)],
-            spacing=24,
-        )
-    )
+    sections.controls.append(ner_grid)
 
-    sections.controls.append(ft.Container(height=16))
     sections.controls.append(section_divider())
-    sections.controls.append(ft.Container(height=16))
 
     sections.controls.append(
         ft.Row(
             [
-                ft.Text("Regex-basiert", weight=ft.FontWeight.W_600, color=theme["text_secondary"]),
+                ft.Text(t(lang, "settings.regex_section"), weight=ft.FontWeight.W_600, color=text_secondary),
                 ft.Container(expand=True),
-                ft.TextButton(t(lang, "settings.all"), on_click=rx_select_all),
-                ft.TextButton("Minimal" if lang == "de" else "Minimal", on_click=rx_select_minimal),
-                ft.TextButton(t(lang, "settings.none"), on_click=rx_select_none),
+                ft.TextButton(all_label, on_click=rx_select_all),
+                ft.TextButton(minimal_label, on_click=rx_select_minimal),
+                ft.TextButton(none_label, on_click=rx_select_none),
             ],
             vertical_alignment=ft.CrossAxisAlignment.CENTER,
         )
     )
 
     sections.controls.append(ft.Container(height=10))
-    sections.controls.append(
-        ft.Row(
-            [ft.Container(rx_col_left, expand=1), ft.Container(rx_col_right, expand=1)],
-            spacing=24,
-        )
-    )
+    sections.controls.append(rx_grid)
 
     return ft.Container(
         padding=24,